@@ -126,8 +126,8 @@ def upgrade() -> None:
     op.create_index('idx_start_status', 'calendar_events', ['start_datetime', 'status'], unique=False)
     op.create_index('idx_hiring_type', 'calendar_events', ['is_hiring_related', 'event_type'], unique=False)
     op.create_index('idx_organizer_date', 'calendar_events', ['organizer_email', 'start_datetime'], unique=False)
-    op.create_index('idx_company_type', 'calendar_events', ['company_name', 'event_type'], unique=False)
-    op.create_index('idx_sync_status_cal', 'calendar_events', ['is_synced', 'status'], unique=False)
+    op.create_index('idx_event_company_type', 'calendar_events', ['company_name', 'event_type'], unique=False)
+    op.create_index('idx_event_sync_status', 'calendar_events', ['is_synced', 'status'], unique=False)
     op.create_index('idx_upcoming_events', 'calendar_events', ['start_datetime', 'status', 'is_hiring_related'], unique=False)
 
 
@@ -137,8 +137,8 @@ def downgrade() -> None:
     # Drop calendar_events table
     # Drop composite indexes first
     op.drop_index('idx_upcoming_events', table_name='calendar_events')
-    op.drop_index('idx_sync_status_cal', table_name='calendar_events')
-    op.drop_index('idx_company_type', table_name='calendar_events')
+    op.drop_index('idx_event_sync_status', table_name='calendar_events')
+    op.drop_index('idx_event_company_type', table_name='calendar_events')
     op.drop_index('idx_organizer_date', table_name='calendar_events')
     op.drop_index('idx_hiring_type', table_name='calendar_events')
     op.drop_index('idx_start_status', table_name='calendar_events')
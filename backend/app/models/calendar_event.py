@@ -53,8 +53,8 @@ class CalendarEvent(Base):
         Index('idx_start_status', 'start_datetime', 'status'),
         Index('idx_hiring_type', 'is_hiring_related', 'event_type'),
         Index('idx_organizer_date', 'organizer_email', 'start_datetime'),
-        Index('idx_company_type', 'company_name', 'event_type'),
-        Index('idx_sync_status', 'is_synced', 'status'),
+        Index('idx_event_company_type', 'company_name', 'event_type'),
+        Index('idx_event_sync_status', 'is_synced', 'status'),
         Index('idx_upcoming_events', 'start_datetime', 'status', 'is_hiring_related'),
     )
 
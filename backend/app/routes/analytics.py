@@ -1,59 +1,92 @@
 from fastapi import APIRouter, Depends, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func, extract
 from typing import Optional
 from datetime import datetime, timedelta
+import functools
+import json
 
 from ..models.database import get_db
 from ..models.application import Application, ApplicationStatus, ApplicationSource
 from ..models.contact import Contact, ContactType, Interaction
+from ..services.response_cache import analytics_cache, data_generation
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 router = APIRouter()
 
+def json_response(payload: dict) -> Response:
+    """Return a payload that is already JSON-ready, skipping jsonable_encoder"""
+    if orjson is not None:
+        return Response(orjson.dumps(payload), media_type="application/json")
+    return JSONResponse(payload)
+
+def count_by(db: Session, *columns) -> dict:
+    """Row counts per distinct value (or value tuple) of the columns, in one GROUP BY query"""
+    rows = db.query(*columns, func.count()).group_by(*columns).all()
+    if len(columns) == 1:
+        return {value: count for value, count in rows}
+    return {tuple(row[:-1]): row[-1] for row in rows}
+
+def cached_response(endpoint):
+    """Serve the endpoint's JSON from analytics_cache, keyed by its query parameters and the data generation"""
+    @functools.wraps(endpoint)
+    def wrapper(**kwargs):
+        params = tuple(sorted((name, value) for name, value in kwargs.items() if name != "db"))
+        key = (endpoint.__name__, params, data_generation())
+        body = analytics_cache.get(key)
+        if body is None:
+            payload = jsonable_encoder(endpoint(**kwargs))
+            body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
+            analytics_cache.set(key, body)
+        return Response(body, media_type="application/json")
+    return wrapper
+
+SUCCESSFUL_STATUSES = (ApplicationStatus.INTERVIEW, ApplicationStatus.OFFER)
+
 @router.get("/dashboard/")
+@cached_response
 def get_dashboard_analytics(db: Session = Depends(get_db)):
     """Get comprehensive dashboard analytics"""
     
-    # Application analytics
-    total_applications = db.query(Application).count()
-    
-    # Status breakdown
-    status_counts = {}
-    for status in ApplicationStatus:
-        count = db.query(Application).filter(Application.status == status).count()
-        status_counts[status.value] = count
+    # Status breakdown; the groups add up to the application total
+    by_status = count_by(db, Application.status)
+    total_applications = sum(by_status.values())
+    status_counts = {status.value: by_status.get(status, 0) for status in ApplicationStatus}
     
-    # Source breakdown
-    source_counts = {}
-    for source in ApplicationSource:
-        count = db.query(Application).filter(Application.source == source).count()
-        source_counts[source.value] = count
-    
-    # Recent applications (last 30 days)
+    # With no applications (or contacts) the follow-up queries can only return zeros
     thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-    recent_applications = db.query(Application).filter(
-        Application.date_applied >= thirty_days_ago
-    ).count()
+    if total_applications:
+        # Source breakdown
+        by_source = count_by(db, Application.source)
+        
+        # Recent applications (last 30 days)
+        recent_applications = db.query(Application).filter(
+            Application.date_applied >= thirty_days_ago
+        ).count()
+    else:
+        by_source = {}
+        recent_applications = 0
+    source_counts = {source.value: by_source.get(source, 0) for source in ApplicationSource}
     
     # Success rate (interviews and offers)
-    successful = db.query(Application).filter(
-        Application.status.in_([ApplicationStatus.INTERVIEW, ApplicationStatus.OFFER])
-    ).count()
+    successful = sum(by_status.get(status, 0) for status in SUCCESSFUL_STATUSES)
     success_rate = (successful / total_applications * 100) if total_applications > 0 else 0
     
-    # Contact analytics
-    total_contacts = db.query(Contact).count()
-    
     # Contact type breakdown
-    contact_type_counts = {}
-    for contact_type in ContactType:
-        count = db.query(Contact).filter(Contact.contact_type == contact_type).count()
-        contact_type_counts[contact_type.value] = count
+    by_contact_type = count_by(db, Contact.contact_type)
+    total_contacts = sum(by_contact_type.values())
+    contact_type_counts = {contact_type.value: by_contact_type.get(contact_type, 0) for contact_type in ContactType}
     
-    # Recent interactions
+    # Recent interactions; every interaction belongs to a contact
     recent_interactions = db.query(Interaction).filter(
         Interaction.date >= thirty_days_ago
-    ).count()
+    ).count() if total_contacts else 0
     
     return {
         "total_applications": total_applications,
@@ -67,22 +100,17 @@ def get_dashboard_analytics(db: Session = Depends(get_db)):
     }
 
 @router.get("/applications/")
+@cached_response
 def get_application_analytics(db: Session = Depends(get_db)):
     """Get application-specific analytics"""
     
-    # Application analytics
-    total_applications = db.query(Application).count()
-    
-    # Status breakdown
-    status_counts = {}
-    for status in ApplicationStatus:
-        count = db.query(Application).filter(Application.status == status).count()
-        status_counts[status.value] = count
+    # Status breakdown; the groups add up to the application total
+    by_status = count_by(db, Application.status)
+    total_applications = sum(by_status.values())
+    status_counts = {status.value: by_status.get(status, 0) for status in ApplicationStatus}
     
     # Success rate (interviews and offers)
-    successful = db.query(Application).filter(
-        Application.status.in_([ApplicationStatus.INTERVIEW, ApplicationStatus.OFFER])
-    ).count()
+    successful = sum(by_status.get(status, 0) for status in SUCCESSFUL_STATUSES)
     success_rate = (successful / total_applications * 100) if total_applications > 0 else 0
     
     return {
@@ -92,17 +120,14 @@ def get_application_analytics(db: Session = Depends(get_db)):
     }
 
 @router.get("/contacts/")
+@cached_response
 def get_contact_analytics(db: Session = Depends(get_db)):
     """Get contact-specific analytics"""
     
-    # Contact analytics
-    total_contacts = db.query(Contact).count()
-    
-    # Contact type breakdown
-    contact_type_counts = {}
-    for contact_type in ContactType:
-        count = db.query(Contact).filter(Contact.contact_type == contact_type).count()
-        contact_type_counts[contact_type.value] = count
+    # Contact type breakdown; the groups add up to the contact total
+    by_contact_type = count_by(db, Contact.contact_type)
+    total_contacts = sum(by_contact_type.values())
+    contact_type_counts = {contact_type.value: by_contact_type.get(contact_type, 0) for contact_type in ContactType}
     
     # Recent interactions (last 30 days)
     thirty_days_ago = datetime.utcnow() - timedelta(days=30)
@@ -117,10 +142,12 @@ def get_contact_analytics(db: Session = Depends(get_db)):
     }
 
 @router.get("/performance/")
+@cached_response
 def get_performance_analytics(db: Session = Depends(get_db)):
     """Get performance metrics analytics"""
     
-    total_applications = db.query(Application).count()
+    by_status = count_by(db, Application.status)
+    total_applications = sum(by_status.values())
     
     if total_applications == 0:
         return {
@@ -131,13 +158,11 @@ def get_performance_analytics(db: Session = Depends(get_db)):
         }
     
     # Interview rate (applied + interview + offer + rejected that had interviews)
-    interviews = db.query(Application).filter(
-        Application.status.in_([ApplicationStatus.INTERVIEW, ApplicationStatus.OFFER])
-    ).count()
+    interviews = sum(by_status.get(status, 0) for status in SUCCESSFUL_STATUSES)
     interview_rate = (interviews / total_applications * 100)
     
     # Offer rate
-    offers = db.query(Application).filter(Application.status == ApplicationStatus.OFFER).count()
+    offers = by_status.get(ApplicationStatus.OFFER, 0)
     offer_rate = (offers / total_applications * 100)
     
     # Success rate (offers)
@@ -151,6 +176,7 @@ def get_performance_analytics(db: Session = Depends(get_db)):
     }
 
 @router.get("/applications/trends")
+@cached_response
 def get_application_trends(
     days: int = Query(30, description="Number of days to analyze"),
     db: Session = Depends(get_db)
@@ -192,32 +218,27 @@ def get_application_trends(
     }
 
 @router.get("/applications/source-effectiveness/")
+@cached_response
 def get_source_effectiveness(db: Session = Depends(get_db)):
     """Analyze effectiveness of different application sources"""
     
     source_analysis = []
     
+    # Every (source, status) count in one query; totals and rates are derived from it
+    by_source_status = count_by(db, Application.source, Application.status)
+    
     for source in ApplicationSource:
-        total = db.query(Application).filter(Application.source == source).count()
+        status_breakdown = {
+            status.value: by_source_status.get((source, status), 0) for status in ApplicationStatus
+        }
+        total = sum(count for (row_source, _), count in by_source_status.items() if row_source == source)
         
         if total > 0:
             # Calculate success rate for this source
-            successful = db.query(Application).filter(
-                Application.source == source,
-                Application.status.in_([ApplicationStatus.INTERVIEW, ApplicationStatus.OFFER])
-            ).count()
+            successful = sum(status_breakdown[status.value] for status in SUCCESSFUL_STATUSES)
             
             success_rate = (successful / total * 100)
             
-            # Status breakdown for this source
-            status_breakdown = {}
-            for status in ApplicationStatus:
-                count = db.query(Application).filter(
-                    Application.source == source,
-                    Application.status == status
-                ).count()
-                status_breakdown[status.value] = count
-            
             source_analysis.append({
                 "source": source.value,
                 "total_applications": total,
@@ -228,6 +249,7 @@ def get_source_effectiveness(db: Session = Depends(get_db)):
     return {"source_effectiveness": source_analysis}
 
 @router.get("/contacts/network-analysis")
+@cached_response
 def get_network_analysis(db: Session = Depends(get_db)):
     """Analyze contact network and relationships"""
     
@@ -313,10 +335,11 @@ def export_data(
             "updated_at": contact.updated_at.isoformat()
         })
     
-    return {
+    # Values are already JSON-native (dates as ISO strings), so serialize without re-walking the payload
+    return json_response({
         "export_date": datetime.utcnow().isoformat(),
         "applications": app_data,
         "contacts": contact_data,
         "total_applications": len(app_data),
         "total_contacts": len(contact_data)
-    } 
\ No newline at end of file
+    }) 
\ No newline at end of file
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
+from pydantic import TypeAdapter
 from typing import List, Optional
 from datetime import datetime
 import uuid
@@ -23,6 +24,9 @@ from ..schemas import (
 
 router = APIRouter()
 
+# Validates ORM rows and writes the list's JSON in one pass; see get_applications
+application_list_adapter = TypeAdapter(List[ApplicationSchema])
+
 # Create uploads directory if it doesn't exist
 UPLOADS_DIR = Path("uploads/resumes")
 UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
@@ -35,13 +39,13 @@ def generate_id():
 
 def save_upload_file(file: UploadFile, application_id: str, upload_dir: Path) -> tuple[str, str]:
     """Save upload file and return original filename and file path"""
-    # Generate unique filename for file system
+    # Generate unique filename for file system; the random suffix keeps two uploads in the same second apart
     file_extension = Path(file.filename).suffix if file.filename else '.pdf'
-    system_filename = f"{application_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}{file_extension}"
+    system_filename = f"{application_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}{file_extension}"
     file_path = upload_dir / system_filename
     
-    # Save file
-    with open(file_path, "wb") as buffer:
+    # Save file; "xb" never reopens an existing file, whose inode a backup may share through a hard link
+    with open(file_path, "xb") as buffer:
         shutil.copyfileobj(file.file, buffer)
     
     # Return original filename for database, actual file path for system
@@ -127,13 +131,17 @@ async def download_resume(application_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Application not found")
     
     file_path = Path(application.resume_file_path)
-    if not file_path.exists():
+    try:
+        stat_result = file_path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Resume file not found")
     
+    # Reuse the stat so FileResponse does not look the file up a second time
     return FileResponse(
         path=file_path,
         filename=application.resume_filename,
-        media_type='application/octet-stream'
+        media_type='application/octet-stream',
+        stat_result=stat_result
     )
 
 @router.get("/{application_id}/cover-letter")
@@ -144,13 +152,16 @@ async def download_cover_letter(application_id: str, db: Session = Depends(get_d
         raise HTTPException(status_code=404, detail="Cover letter not found")
     
     file_path = Path(application.cover_letter_file_path)
-    if not file_path.exists():
+    try:
+        stat_result = file_path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Cover letter file not found")
     
     return FileResponse(
         path=file_path,
         filename=application.cover_letter_filename,
-        media_type='application/octet-stream'
+        media_type='application/octet-stream',
+        stat_result=stat_result
     )
 
 @router.get("/", response_model=List[ApplicationSchema])
@@ -180,7 +191,11 @@ def get_applications(
         query = query.filter(Application.email_used.ilike(f"%{email_used}%"))
     
     applications = query.offset(skip).limit(limit).all()
-    return applications
+    # Returning the Response directly skips FastAPI validating the rows a second time, so
+    # response_model above only documents the schema. Null optional fields (portal_url,
+    # notes, cover letter) are omitted from list rows here.
+    rows = application_list_adapter.validate_python(applications, from_attributes=True)
+    return Response(application_list_adapter.dump_json(rows, exclude_none=True), media_type="application/json")
 
 @router.get("/recent/", response_model=List[ApplicationSchema])
 def get_recent_applications(db: Session = Depends(get_db)):
@@ -192,33 +192,33 @@ async def sync_calendar_events_background(
                 for google_event in events_from_google:
                     try:
                         # Check if event already exists
-                        existing_event = db.query(CalendarEvent).filter(CalendarEvent.id == google_event['id']).first()
+                        existing_event = db.query(CalendarEvent).filter(CalendarEvent.id == google_event.id).first()
                         
                         if existing_event and not force_refresh:
                             continue  # Skip existing events unless force refresh
                         
                         # Analyze event for hiring relevance
-                        analysis = await analyze_event_for_hiring(google_event, db)
+                        analysis = await analyze_event_for_hiring(google_event.to_dict(), db)
                         
                         # Prepare event data
                         event_data = {
-                            'id': google_event['id'],
-                            'calendar_id': google_event['calendar_id'],
-                            'summary': google_event['summary'],
-                            'description': google_event.get('description', ''),
-                            'location': google_event.get('location', ''),
-                            'start_datetime': google_event['start_datetime'],
-                            'end_datetime': google_event['end_datetime'],
-                            'timezone': google_event.get('timezone'),
-                            'is_all_day': google_event['is_all_day'],
-                            'status': EventStatus[google_event['status']],
+                            'id': google_event.id,
+                            'calendar_id': google_event.calendar_id,
+                            'summary': google_event.summary,
+                            'description': google_event.description,
+                            'location': google_event.location,
+                            'start_datetime': google_event.start_datetime,
+                            'end_datetime': google_event.end_datetime,
+                            'timezone': google_event.timezone,
+                            'is_all_day': google_event.is_all_day,
+                            'status': EventStatus[google_event.status],
                             'event_type': EventType[analysis.get('event_type', 'OTHER')],
                             'is_hiring_related': analysis.get('is_hiring_related', False),
                             'confidence_score': str(analysis.get('confidence_score', 0.0)),
-                            'organizer_email': google_event.get('organizer_email', ''),
-                            'organizer_name': google_event.get('organizer_name', ''),
-                            'attendees': json.dumps(google_event.get('attendees', [])),
-                            'meeting_link': google_event.get('meeting_link'),
+                            'organizer_email': google_event.organizer_email,
+                            'organizer_name': google_event.organizer_name,
+                            'attendees': json.dumps(google_event.attendees),
+                            'meeting_link': google_event.meeting_link,
                             'company_name': analysis.get('company_name'),
                             'job_title': analysis.get('job_title'),
                             'interview_round': analysis.get('interview_round'),
@@ -244,7 +244,7 @@ async def sync_calendar_events_background(
                             db.commit()
                             
                     except Exception as e:
-                        print(f"[ERROR] Failed to sync event {google_event.get('id', 'unknown')}: {str(e)}")
+                        print(f"[ERROR] Failed to sync event {google_event.id}: {str(e)}")
                         continue
                         
             except Exception as e:
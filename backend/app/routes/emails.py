@@ -147,43 +147,51 @@ async def sync_emails_background(
     try:
         print(f"[INFO] Starting email sync for {days_back} days back")
         
+        # Resume from the last recorded Gmail history ID unless a full refresh is requested,
+        # or the requested window is wider than the one the last full sync searched
+        history_setting = db.query(SettingModel).filter(SettingModel.key == "gmail_history_id").first()
+        window_setting = db.query(SettingModel).filter(SettingModel.key == "gmail_sync_days_back").first()
+        window_covered = window_setting is not None and days_back <= int(window_setting.value)
+        start_history_id = history_setting.value if history_setting and window_covered and not force_refresh else None
+        
         # Search for hiring-related emails
-        gmail_data = google_service.search_hiring_related_emails(days_back)
+        gmail_data = google_service.search_hiring_related_emails(days_back, start_history_id=start_history_id)
         emails_from_gmail = gmail_data.get('emails', [])
         
         print(f"[INFO] Found {len(emails_from_gmail)} emails from Gmail")
         
         synced_count = 0
         updated_count = 0
+        failed_ids = []
         
         for gmail_email in emails_from_gmail:
             try:
                 # Check if email already exists
-                existing_email = db.query(Email).filter(Email.id == gmail_email['id']).first()
+                existing_email = db.query(Email).filter(Email.id == gmail_email.id).first()
                 
                 if existing_email and not force_refresh:
                     continue  # Skip existing emails unless force refresh
                 
                 # Analyze email for hiring relevance
-                analysis = filtering_service.analyze_email(gmail_email)
+                analysis = filtering_service.analyze_email(gmail_email.to_dict())
                 
                 # Prepare email data
                 email_data = {
-                    'id': gmail_email['id'],
-                    'thread_id': gmail_email['thread_id'],
-                    'subject': gmail_email['subject'],
-                    'sender_name': gmail_email['sender_name'],
-                    'sender_email': gmail_email['sender_email'],
-                    'recipient_email': gmail_email['recipient_email'],
-                    'body_text': gmail_email['body_text'],
-                    'body_html': gmail_email['body_html'],
-                    'date_received': gmail_email['date_received'],
+                    'id': gmail_email.id,
+                    'thread_id': gmail_email.thread_id,
+                    'subject': gmail_email.subject,
+                    'sender_name': gmail_email.sender_name,
+                    'sender_email': gmail_email.sender_email,
+                    'recipient_email': gmail_email.recipient_email,
+                    'body_text': gmail_email.body_text,
+                    'body_html': gmail_email.body_html,
+                    'date_received': gmail_email.date_received,
                     'status': EmailStatus.UNREAD,
                     'priority': EmailPriority[analysis.get('priority', 'medium').upper()],
                     'category': EmailCategory[analysis.get('category', 'OTHER')],
                     'is_hiring_related': analysis.get('is_hiring_related', False),
                     'confidence_score': str(analysis.get('confidence_score', 0.0)),
-                    'labels': json.dumps(gmail_email.get('labels', [])),
+                    'labels': json.dumps(gmail_email.labels),
                     'company_name': analysis.get('company_name'),
                     'job_title': analysis.get('job_title'),
                     'notes': json.dumps(analysis.get('key_details', [])),
@@ -208,9 +216,30 @@ async def sync_emails_background(
                     db.commit()
                     
             except Exception as e:
-                print(f"[ERROR] Failed to sync email {gmail_email.get('id', 'unknown')}: {str(e)}")
+                print(f"[ERROR] Failed to sync email {gmail_email.id}: {str(e)}")
+                failed_ids.append(gmail_email.id)
                 continue
         
+        # Remember where this sync ended for the next incremental sync. After a failure the
+        # next sync must see the failed emails again: an incremental sync keeps its starting
+        # history ID, a full search drops the stored ID so the next sync searches again too
+        history_id = gmail_data.get('history_id')
+        if failed_ids:
+            print(f"[INFO] {len(failed_ids)} emails failed to sync and will be retried next time")
+            if history_setting and not gmail_data.get('incremental'):
+                db.delete(history_setting)
+        elif history_id:
+            if history_setting:
+                history_setting.value = str(history_id)
+            else:
+                db.add(SettingModel(key="gmail_history_id", value=str(history_id)))
+            if not gmail_data.get('incremental'):
+                # A full search covered days_back; incremental syncs keep that window
+                if window_setting:
+                    window_setting.value = str(days_back)
+                else:
+                    db.add(SettingModel(key="gmail_sync_days_back", value=str(days_back)))
+        
         # Final commit
         db.commit()
         
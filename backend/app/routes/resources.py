@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_, or_, func
 from typing import List, Optional
 from datetime import datetime
@@ -137,7 +137,8 @@ def get_resources(
     db: Session = Depends(get_db)
 ):
     """Get all resources with optional filtering"""
-    query = db.query(ResourceModel)
+    # Each row serializes its group; load them in one IN query rather than one per group
+    query = db.query(ResourceModel).options(selectinload(ResourceModel.group))
     
     # Apply filters
     if name:
@@ -223,12 +224,12 @@ def get_resource_analytics(db: Session = Depends(get_db)):
     favorites_count = db.query(ResourceModel).filter(ResourceModel.is_favorite == True).count()
     
     # Most visited resources (top 5)
-    most_visited = db.query(ResourceModel).order_by(
+    most_visited = db.query(ResourceModel).options(selectinload(ResourceModel.group)).order_by(
         func.cast(ResourceModel.visit_count, db.Integer).desc()
     ).limit(5).all()
     
     # Recent resources (last 10)
-    recent_resources = db.query(ResourceModel).order_by(
+    recent_resources = db.query(ResourceModel).options(selectinload(ResourceModel.group)).order_by(
         ResourceModel.created_at.desc()
     ).limit(10).all()
     
@@ -35,8 +35,8 @@ def save_template_file(file: UploadFile, file_type: TemplateFileType) -> tuple[s
     system_filename = f"{uuid.uuid4()}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}{file_extension}"
     file_path = upload_dir / system_filename
     
-    # Save file
-    with open(file_path, "wb") as buffer:
+    # Save file; "xb" never reopens an existing file, whose inode a backup may share through a hard link
+    with open(file_path, "xb") as buffer:
         shutil.copyfileobj(file.file, buffer)
     
     # Return original filename and system path
@@ -108,13 +108,16 @@ async def download_template_file(template_id: str, db: Session = Depends(get_db)
         raise HTTPException(status_code=404, detail="Template file not found")
     
     file_path = Path(template.file_path)
-    if not file_path.exists():
+    try:
+        stat_result = file_path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Template file not found on disk")
     
     return FileResponse(
         path=file_path,
         filename=template.filename,
-        media_type='application/octet-stream'
+        media_type='application/octet-stream',
+        stat_result=stat_result
     )
 
 @router.put("/{template_id}", response_model=TemplateFileSchema)
@@ -1,19 +1,184 @@
 import os
 import json
+import logging
 import base64
 import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any, Tuple
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from email.utils import parsedate_to_datetime
 
+import httplib2
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 import dateutil.parser
 
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
+class EmailRecord:
+    """Gmail message as returned by GoogleAPIService"""
+    id: str
+    thread_id: str
+    subject: str
+    sender_name: str
+    sender_email: str
+    recipient_email: str
+    body_text: str
+    body_html: str
+    date_received: Optional[datetime]
+    labels: List[str]
+    snippet: str
+    size_estimate: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+@dataclass(slots=True)
+class CalendarEventRecord:
+    """Google Calendar event as returned by GoogleAPIService"""
+    id: str
+    calendar_id: str
+    summary: str
+    description: str
+    location: str
+    start_datetime: Optional[datetime]
+    end_datetime: Optional[datetime]
+    timezone: Optional[str]
+    is_all_day: bool
+    status: str
+    organizer_email: str
+    organizer_name: str
+    attendees: List[Dict[str, Any]]
+    meeting_link: Optional[str]
+    html_link: str
+    created: Optional[datetime]
+    updated: Optional[datetime]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+# Bytes-mode tracking detector run on undecoded MIME parts
+_RE_TRACKING_B = re.compile(rb'(?:https?://\S{100,}|\b[A-Za-z0-9_-]{40,}\b|utm_\w+)', re.IGNORECASE)
+
+# _clean_email_text content rules as one alternation, applied in a single pass
+_RE_CLEAN_EMAIL_TEXT = re.compile(
+    r'(?P<long_url>https?://[^\s]{200,})'  # Excessively long tracking URLs
+    r'|(?P<tracking>[?&](?:utm_[^&\s]*|tracking[^&\s]*|gclid[^&\s]*|fbclid[^&\s]*))'  # Tracking parameters
+    r'|(?P<encoded>[A-Za-z0-9+/]{100,}={0,2})'  # Base64 content that sometimes gets mixed in
+    r'|(?P<token>\b[A-Za-z0-9_-]{50,}\b)'  # OAuth tokens and similar long strings
+)
+
+_CLEAN_EMAIL_TEXT_REPLACEMENTS = {
+    'long_url': '[Long URL removed]',
+    'tracking': '',
+    'encoded': '[Encoded content removed]',
+    'token': '[Token removed]',
+}
+
+# Excessive whitespace, collapsed after the content rules since removals can leave double spaces
+_RE_EXCESS_WHITESPACE = re.compile(r'(?P<paragraphs>\n\s*\n\s*\n+)|(?P<spaces> {2,})')
+
+
+def _clean_email_text_replacement(match: re.Match) -> str:
+    return _CLEAN_EMAIL_TEXT_REPLACEMENTS[match.lastgroup]
+
+
+def _collapse_whitespace_replacement(match: re.Match) -> str:
+    # Preserve paragraph breaks, squeeze runs of spaces
+    return '\n\n' if match.lastgroup == 'paragraphs' else ' '
+
+
+# Professional language patterns for _check_email_structure, searched once as one alternation
+_RE_PROFESSIONAL_LANGUAGE = re.compile(
+    r'\b(?:dear|hello|hi)\s+\w+'  # Proper greeting
+    r'|\b(?:sincerely|best regards|thank you)'  # Professional closing
+    r'|\b(?:company|organization|team|position|role)\b',  # Business context
+    re.IGNORECASE
+)
+
+
+# Corporate domain indicators (not free email providers), matched anywhere in the domain
+_RE_CORPORATE_DOMAIN = re.compile(r'corp\.|company\.|inc\.|llc\.|ltd\.|\.edu|\.gov|\.org')
+
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _build_indicator_automaton(spam_indicators: List[str], legitimate_indicators: List[str]):
+    """Build one Aho-Corasick automaton matching every spam and legitimacy indicator in a single pass"""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for label, indicators in (('spam', spam_indicators), ('legit', legitimate_indicators)):
+        for indicator in indicators:
+            automaton.add_word(indicator, (label, indicator))
+    automaton.make_automaton()
+    return automaton
+
+
+class _SharedCredentials:
+    """OAuth credentials loaded from one token file, shared by every GoogleAPIService using it"""
+    
+    def __init__(self, token_path: str):
+        self.token_path = token_path
+        # Held while loading or refreshing, so concurrent requests wait for one refresh and reuse it
+        self.lock = threading.Lock()
+        self.creds: Optional[Credentials] = None
+        # (mtime_ns, size) of the token file when creds were read or last written
+        self.file_stamp: Optional[Tuple[int, int]] = None
+        # Gmail/Calendar clients per thread: httplib2.Http is not thread-safe, and worker
+        # threads outlive requests, so each keeps its keep-alive connections between them
+        self._clients = threading.local()
+    
+    def clients(self, timeout: int) -> Tuple[Any, Any]:
+        """This thread's (gmail, calendar) clients, rebuilt when the credentials were reloaded"""
+        clients = getattr(self._clients, 'value', None)
+        if clients is None or clients[0] is not self.creds:
+            creds = self.creds
+            # Built from the discovery documents bundled with googleapiclient; each client gets its
+            # own keep-alive transport, and both share creds, so refreshes apply to them too
+            gmail = build('gmail', 'v1', http=AuthorizedHttp(creds, http=httplib2.Http(timeout=timeout)),
+                          static_discovery=True, cache_discovery=False)
+            calendar = build('calendar', 'v3', http=AuthorizedHttp(creds, http=httplib2.Http(timeout=timeout)),
+                             static_discovery=True, cache_discovery=False)
+            clients = self._clients.value = (creds, gmail, calendar)
+        return clients[1], clients[2]
+
+
+# GoogleAPIService is built per request; credentials and API clients outlive it here, by token file path
+_shared_credentials: Dict[str, _SharedCredentials] = {}
+_shared_credentials_lock = threading.Lock()
+
+
+def _credentials_for(token_path: str) -> _SharedCredentials:
+    with _shared_credentials_lock:
+        shared = _shared_credentials.get(token_path)
+        if shared is None:
+            shared = _shared_credentials[token_path] = _SharedCredentials(token_path)
+        return shared
+
+
+def _token_file_stamp(token_path: str) -> Tuple[int, int]:
+    stat = os.stat(token_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
 class GoogleAPIService:
     """Service for integrating with Gmail and Google Calendar APIs"""
     
@@ -25,6 +190,93 @@ class GoogleAPIService:
         'https://www.googleapis.com/auth/calendar.events'
     ]
     
+    # Common hiring-related keywords and patterns
+    HIRING_KEYWORDS = [
+        "interview", "job opportunity", "position", "recruiter", "hiring",
+        "application", "resume", "CV", "offer", "salary", "compensation",
+        "onboarding", "background check", "reference", "screening",
+        "technical assessment", "coding challenge", "take home",
+        "team meeting", "culture fit", "next steps", "feedback"
+    ]
+    
+    # Spam phrases and sender prefixes excluded in the Gmail search query itself; the client-side
+    # spam indicators stay as a second line of defense (and for incremental history syncs)
+    QUERY_EXCLUDED_PHRASES = ["make money fast", "earn $", "guaranteed income", "act now"]
+    QUERY_EXCLUDED_SENDERS = ["noreply", "donotreply", "automated"]
+    
+    # Headers requested when fetching messages in metadata format
+    METADATA_HEADERS = ['Subject', 'From', 'To', 'Date', 'Message-ID']
+    
+    # Server-side projections for messages.get; only what _get_email_details reads is returned.
+    # MIME parts are kept four levels deep (e.g. mixed > related > alternative > text/plain)
+    FULL_MESSAGE_FIELDS = (
+        'id,threadId,snippet,labelIds,sizeEstimate,'
+        'payload(headers,mimeType,body,parts(mimeType,body,parts(mimeType,body,parts(mimeType,body))))'
+    )
+    METADATA_MESSAGE_FIELDS = 'id,threadId,snippet,labelIds,sizeEstimate,payload/headers'
+    
+    # Red flags that indicate spam
+    SPAM_INDICATORS = [
+        # Generic spam phrases
+        'make money fast', 'easy money', 'get rich quick', 'work from home scam',
+        'no experience required', 'earn $', 'guaranteed income', 'click here now',
+        'limited time offer', 'act now', 'urgent response required',
+        
+        # Suspicious hiring claims
+        'high paying job with no experience', 'earn thousands weekly',
+        'mysterious shopper', 'envelope stuffing', 'data entry from home',
+        
+        # Generic/suspicious senders
+        'noreply@', 'donotreply@', 'automated@',
+        
+        # Suspicious links/attachments
+        'download this software', 'install this app', 'verify your account',
+        'update your information', 'confirm your identity'
+    ]
+    
+    # Legitimate hiring email indicators
+    LEGITIMATE_INDICATORS = [
+        # Professional language
+        'dear', 'sincerely', 'best regards', 'thank you for your time',
+        'we reviewed your application', 'would like to schedule',
+        'interview process', 'next steps', 'team member',
+        
+        # Specific role mentions
+        'software engineer', 'developer', 'manager', 'analyst', 'coordinator',
+        'specialist', 'consultant', 'director', 'lead', 'senior', 'junior',
+        
+        # Legitimate recruiting platforms
+        'linkedin', 'indeed', 'glassdoor', 'hired.com', 'angellist'
+    ]
+    
+    # Maximum message IDs Gmail accepts per batchModify request
+    BATCH_MODIFY_LIMIT = 1000
+    
+    # Socket timeout for Gmail/Calendar API requests
+    HTTP_TIMEOUT_SECONDS = 30
+    
+    # Refresh access tokens this many seconds before they expire
+    TOKEN_REFRESH_MARGIN_SECONDS = 60
+    
+    # Sender TLDs counted as one legitimacy indicator; checked on the address, not the whole body
+    LEGITIMATE_SENDER_TLDS = ('.com', '.org', '.net', '.edu', '.gov')
+    
+    # Known legitimate recruiting/job platforms
+    RECRUITING_PLATFORM_DOMAINS = frozenset({
+        'linkedin.com', 'indeed.com', 'glassdoor.com', 'monster.com',
+        'ziprecruiter.com', 'careerbuilder.com', 'dice.com',
+        'angellist.com', 'wellfound.com', 'hired.com', 'triplebyte.com'
+    })
+    
+    # Free email providers (lower trust for professional outreach)
+    FREE_EMAIL_PROVIDER_DOMAINS = frozenset({
+        'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
+        'aol.com', 'icloud.com', 'protonmail.com'
+    })
+    
+    # Built once per process; None when pyahocorasick is not installed
+    _INDICATOR_AUTOMATON = _build_indicator_automaton(SPAM_INDICATORS, LEGITIMATE_INDICATORS)
+    
     def __init__(self, credentials_path: str = None, token_path: str = None):
         """
         Initialize Google API service
@@ -36,8 +288,9 @@ class GoogleAPIService:
         self.credentials_path = credentials_path or os.getenv('GOOGLE_CREDENTIALS_PATH', 'credentials.json')
         self.token_path = token_path or os.getenv('GOOGLE_TOKEN_PATH', 'token.json')
         self.creds = None
-        self.gmail_service = None
-        self.calendar_service = None
+        self._shared: Optional[_SharedCredentials] = None
+        self._gmail_service = None
+        self._calendar_service = None
         self.client_id = os.environ.get("GOOGLE_CLIENT_ID")
         self.client_secret = os.environ.get("GOOGLE_CLIENT_SECRET")
         self.redirect_uri = os.environ.get("GOOGLE_OAUTH_REDIRECT_URI")
@@ -50,37 +303,71 @@ class GoogleAPIService:
             bool: True if authentication successful, False otherwise
         """
         try:
-            # Load existing token if available
-            if os.path.exists(self.token_path):
-                self.creds = Credentials.from_authorized_user_file(self.token_path, self.SCOPES)
-            
-            # If there are no (valid) credentials available, prompt user to log in
-            if not self.creds or not self.creds.valid:
-                if self.creds and self.creds.expired and self.creds.refresh_token:
-                    self.creds.refresh(Request())
-                else:
-                    # For OAuth flow, we don't need credentials.json
-                    # The tokens should be available in token.json from the OAuth callback
-                    if not os.path.exists(self.token_path):
-                        raise FileNotFoundError(f"Google token file not found: {self.token_path}. Please complete OAuth flow first.")
-                    
-                    # If we reach here, token exists but is invalid and no refresh token
-                    raise Exception("Invalid token and no refresh token available. Please re-authenticate.")
+            shared = _credentials_for(self.token_path)
+            with shared.lock:
+                # Re-read token.json only when it changed on disk, e.g. rewritten by the OAuth callback
+                try:
+                    stamp = _token_file_stamp(self.token_path)
+                except FileNotFoundError:
+                    # Removed since it was loaded (access revoked); the OAuth callback writes a new one
+                    shared.creds = shared.file_stamp = None
+                    raise FileNotFoundError(f"Google token file not found: {self.token_path}. Please complete OAuth flow first.")
+                if stamp != shared.file_stamp:
+                    shared.creds = Credentials.from_authorized_user_file(self.token_path, self.SCOPES)
+                    shared.file_stamp = stamp
                 
-                # Save the refreshed credentials
-                with open(self.token_path, 'w') as token:
-                    token.write(self.creds.to_json())
-            
-            # Build services
-            self.gmail_service = build('gmail', 'v1', credentials=self.creds)
-            self.calendar_service = build('calendar', 'v3', credentials=self.creds)
+                creds = shared.creds
+                if not creds.valid or self._creds_near_expiry(creds):
+                    if creds.refresh_token:
+                        # Checked under the lock, so a request that waited here reuses the refreshed token
+                        creds.refresh(Request())
+                        
+                        # Save the refreshed credentials
+                        with open(self.token_path, 'w') as token:
+                            token.write(creds.to_json())
+                        shared.file_stamp = _token_file_stamp(self.token_path)
+                    elif not creds.valid:
+                        # Token exists but is invalid and no refresh token
+                        raise Exception("Invalid token and no refresh token available. Please re-authenticate.")
             
+            self._shared = shared
+            self.creds = creds
             return True
             
         except Exception as e:
-            print(f"[ERROR] Google API authentication failed: {str(e)}")
+            logger.error("Google API authentication failed: %s", e)
             return False
     
+    @property
+    def gmail_service(self):
+        """Gmail client for the calling thread, once authenticated"""
+        if self._gmail_service is None and self._shared is not None:
+            return self._shared.clients(self.HTTP_TIMEOUT_SECONDS)[0]
+        return self._gmail_service
+    
+    @gmail_service.setter
+    def gmail_service(self, service):
+        self._gmail_service = service
+    
+    @property
+    def calendar_service(self):
+        """Calendar client for the calling thread, once authenticated"""
+        if self._calendar_service is None and self._shared is not None:
+            return self._shared.clients(self.HTTP_TIMEOUT_SECONDS)[1]
+        return self._calendar_service
+    
+    @calendar_service.setter
+    def calendar_service(self, service):
+        self._calendar_service = service
+    
+    def _creds_near_expiry(self, creds: Credentials) -> bool:
+        """Check whether the access token expires within the refresh margin"""
+        if not creds.expiry:
+            return False
+        
+        remaining = (creds.expiry - datetime.utcnow()).total_seconds()
+        return remaining < self.TOKEN_REFRESH_MARGIN_SECONDS
+    
     def test_connection(self) -> Dict[str, bool]:
         """
         Test connection to both Gmail and Calendar APIs
@@ -90,21 +377,40 @@ class GoogleAPIService:
         """
         result = {'gmail': False, 'calendar': False}
         
-        try:
-            if self.gmail_service:
-                # Test Gmail connection
-                profile = self.gmail_service.users().getProfile(userId='me').execute()
-                result['gmail'] = True
-                print(f"[DEBUG] Gmail connected for: {profile.get('emailAddress')}")
-                
-            if self.calendar_service:
-                # Test Calendar connection
-                calendar_list = self.calendar_service.calendarList().list(maxResults=1).execute()
-                result['calendar'] = True
-                print(f"[DEBUG] Calendar connected, found {len(calendar_list.get('items', []))} calendars")
-                
-        except Exception as e:
-            print(f"[ERROR] Connection test failed: {str(e)}")
+        # The two probes are independent, so run them concurrently (one round trip instead of two).
+        # Both clients are this thread's, taken before submitting; each has its own HTTP transport,
+        # and this thread waits on them, so lending one to each worker is safe
+        gmail_service = self.gmail_service
+        calendar_service = self.calendar_service
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            gmail_future = None
+            calendar_future = None
+            if gmail_service:
+                gmail_future = executor.submit(
+                    lambda: gmail_service.users().getProfile(userId='me').execute()
+                )
+            if calendar_service:
+                calendar_future = executor.submit(
+                    lambda: calendar_service.calendarList().list(maxResults=1).execute()
+                )
+            
+            try:
+                if gmail_future:
+                    # Test Gmail connection
+                    profile = gmail_future.result()
+                    result['gmail'] = True
+                    logger.debug("Gmail connected for: %s", profile.get('emailAddress'))
+            except Exception as e:
+                logger.error("Connection test failed: %s", e)
+            
+            try:
+                if calendar_future:
+                    # Test Calendar connection
+                    calendar_list = calendar_future.result()
+                    result['calendar'] = True
+                    logger.debug("Calendar connected, found %s calendars", len(calendar_list.get('items', [])))
+            except Exception as e:
+                logger.error("Connection test failed: %s", e)
             
         return result
     
@@ -112,7 +418,8 @@ class GoogleAPIService:
                    query: str = '', 
                    max_results: int = 100, 
                    page_token: str = None,
-                   include_spam_trash: bool = False) -> Dict[str, Any]:
+                   include_spam_trash: bool = False,
+                   fetch_bodies: bool = False) -> Dict[str, Any]:
         """
         Fetch emails from Gmail
         
@@ -121,6 +428,7 @@ class GoogleAPIService:
             max_results: Maximum number of emails to fetch
             page_token: Token for pagination
             include_spam_trash: Include spam and trash emails
+            fetch_bodies: Download full MIME bodies; otherwise only headers and snippet
             
         Returns:
             Dict containing emails and pagination info
@@ -141,9 +449,9 @@ class GoogleAPIService:
             messages = result.get('messages', [])
             emails = []
             
-            # Fetch full email details
+            # Fetch email details
             for message in messages:
-                email_data = self._get_email_details(message['id'])
+                email_data = self._get_email_details(message['id'], fetch_body=fetch_bodies)
                 if email_data:
                     emails.append(email_data)
             
@@ -154,65 +462,107 @@ class GoogleAPIService:
             }
             
         except HttpError as error:
-            print(f"[ERROR] Gmail API error: {error}")
+            logger.error("Gmail API error: %s", error)
             raise Exception(f"Failed to fetch emails: {error}")
     
-    def _get_email_details(self, message_id: str) -> Optional[Dict[str, Any]]:
+    def _get_email_details(self, message_id: str, fetch_body: bool = True) -> Optional[EmailRecord]:
         """
         Get detailed information for a specific email
         
         Args:
             message_id: Gmail message ID
+            fetch_body: Request the full MIME tree; otherwise use metadata format
+                and fall back to the snippet for body_text
             
         Returns:
-            Dict containing email details or None if failed
+            EmailRecord with the email details or None if failed
         """
         try:
-            message = self.gmail_service.users().messages().get(
-                userId='me', 
-                id=message_id,
-                format='full'
-            ).execute()
+            if fetch_body:
+                message = self.gmail_service.users().messages().get(
+                    userId='me', 
+                    id=message_id,
+                    format='full',
+                    fields=self.FULL_MESSAGE_FIELDS
+                ).execute()
+            else:
+                message = self.gmail_service.users().messages().get(
+                    userId='me',
+                    id=message_id,
+                    format='metadata',
+                    metadataHeaders=self.METADATA_HEADERS,
+                    fields=self.METADATA_MESSAGE_FIELDS
+                ).execute()
             
             headers = message['payload'].get('headers', [])
             header_dict = {h['name']: h['value'] for h in headers}
             
-            # Extract email body
-            body_text, body_html = self._extract_email_body(message['payload'])
-            
-            # Fallback to snippet if body extraction failed or is mostly garbage
-            if not body_text or len(body_text.strip()) < 20 or self._is_mostly_tracking_data(body_text):
-                snippet = message.get('snippet', '')
-                if snippet and len(snippet.strip()) > 20:
-                    body_text = snippet
-                    print(f"[DEBUG] Using email snippet as fallback for message {message_id}")
+            if fetch_body:
+                # Extract email body
+                body_text, body_html = self._extract_email_body(message['payload'])
+                
+                # Fallback to snippet if body extraction failed or is mostly garbage
+                if not body_text or len(body_text.strip()) < 20 or self._is_mostly_tracking_data(body_text):
+                    snippet = message.get('snippet', '')
+                    if snippet and len(snippet.strip()) > 20:
+                        body_text = snippet
+                        logger.debug("Using email snippet as fallback for message %s", message_id)
+            else:
+                # Metadata responses carry no body; the snippet stands in until get_email_body()
+                body_text, body_html = message.get('snippet', ''), ''
             
             # Parse date
             date_received = None
             if 'Date' in header_dict:
                 try:
-                    date_received = dateutil.parser.parse(header_dict['Date'])
-                except:
-                    date_received = datetime.now()
+                    date_received = parsedate_to_datetime(header_dict['Date'])
+                except (TypeError, ValueError):
+                    # Fall back to the lenient parser for non-RFC 2822 headers
+                    try:
+                        date_received = dateutil.parser.parse(header_dict['Date'])
+                    except:
+                        date_received = datetime.now()
             
-            return {
-                'id': message['id'],
-                'thread_id': message['threadId'],
-                'subject': header_dict.get('Subject', ''),
-                'sender_name': self._extract_name_from_email(header_dict.get('From', '')),
-                'sender_email': self._extract_email_from_string(header_dict.get('From', '')),
-                'recipient_email': self._extract_email_from_string(header_dict.get('To', '')),
-                'body_text': body_text,
-                'body_html': body_html,
-                'date_received': date_received,
-                'labels': message.get('labelIds', []),
-                'snippet': message.get('snippet', ''),
-                'size_estimate': message.get('sizeEstimate', 0)
-            }
+            return EmailRecord(
+                id=message['id'],
+                thread_id=message['threadId'],
+                subject=header_dict.get('Subject', ''),
+                sender_name=self._extract_name_from_email(header_dict.get('From', '')),
+                sender_email=self._extract_email_from_string(header_dict.get('From', '')),
+                recipient_email=self._extract_email_from_string(header_dict.get('To', '')),
+                body_text=body_text,
+                body_html=body_html,
+                date_received=date_received,
+                labels=message.get('labelIds', []),
+                snippet=message.get('snippet', ''),
+                size_estimate=message.get('sizeEstimate', 0)
+            )
             
         except Exception as e:
-            print(f"[ERROR] Failed to get email details for {message_id}: {str(e)}")
+            logger.error("Failed to get email details for %s: %s", message_id, e)
+            return None
+    
+    def get_email_body(self, message_id: str) -> Optional[Dict[str, str]]:
+        """
+        Lazily fetch the full body of a single email
+        
+        Args:
+            message_id: Gmail message ID
+            
+        Returns:
+            Dict with body_text and body_html, or None if failed
+        """
+        if not self.gmail_service:
+            raise Exception("Gmail service not initialized. Call authenticate() first.")
+        
+        email_data = self._get_email_details(message_id, fetch_body=True)
+        if not email_data:
             return None
+        
+        return {
+            'body_text': email_data.body_text,
+            'body_html': email_data.body_html
+        }
     
     def _extract_email_body(self, payload: Dict) -> Tuple[str, str]:
         """
@@ -225,36 +575,48 @@ class GoogleAPIService:
             Tuple of (text_body, html_body)
         """
         text_parts = []
-        html_parts = []
+        html_data = []
         
-        def extract_from_part(part):
-            nonlocal text_parts, html_parts
+        # Walk the MIME tree iteratively; HTML parts are only decoded if no good plain text turns up
+        stack = deque([payload])
+        while stack:
+            part = stack.popleft()
             mime_type = part.get('mimeType', '')
+            body = part.get('body')
             
-            if 'body' in part and 'data' in part['body']:
-                try:
-                    decoded_data = base64.urlsafe_b64decode(part['body']['data']).decode('utf-8')
-                    
-                    if mime_type == 'text/plain':
+            if body and 'data' in body:
+                if mime_type == 'text/plain':
+                    try:
+                        raw_data = base64.urlsafe_b64decode(body['data'])
+                    except Exception as e:
+                        logger.debug("Failed to decode email part: %s", e)
+                    else:
+                        # Discard parts that are obviously tracking blobs before paying for the decode
+                        if self._is_mostly_tracking_bytes(raw_data):
+                            continue
                         # Clean up the plain text
-                        cleaned_text = self._clean_email_text(decoded_data)
+                        cleaned_text = self._clean_email_text(raw_data.decode('utf-8', errors='replace'))
                         if cleaned_text and len(cleaned_text.strip()) > 20:  # Only keep substantial content
+                            # A long, clean plain-text part is good enough; stop walking
+                            if len(cleaned_text) > 500 and not self._is_mostly_tracking_data(cleaned_text):
+                                return cleaned_text.strip(), ""
                             text_parts.append(cleaned_text)
-                    elif mime_type == 'text/html':
-                        # Clean up HTML and convert to readable text
-                        cleaned_html = self._clean_email_html(decoded_data)
-                        if cleaned_html and len(cleaned_html.strip()) > 20:
-                            html_parts.append(cleaned_html)
-                except Exception as e:
-                    print(f"[DEBUG] Failed to decode email part: {str(e)}")
-                    pass
-            
-            # Recursively process multipart content
-            if 'parts' in part:
-                for subpart in part['parts']:
-                    extract_from_part(subpart)
-        
-        extract_from_part(payload)
+                elif mime_type == 'text/html':
+                    html_data.append(body['data'])
+            
+            stack.extend(part.get('parts', ()))
+        
+        html_parts = []
+        for data in html_data:
+            try:
+                decoded_data = base64.urlsafe_b64decode(data).decode('utf-8', errors='replace')
+            except Exception as e:
+                logger.debug("Failed to decode email part: %s", e)
+                continue
+            # Clean up HTML and convert to readable text
+            cleaned_html = self._clean_email_html(decoded_data)
+            if cleaned_html and len(cleaned_html.strip()) > 20:
+                html_parts.append(cleaned_html)
         
         # Join all text parts, preferring the longest/most substantial one
         text_body = ""
@@ -282,21 +644,11 @@ class GoogleAPIService:
         if not text:
             return ""
         
-        # Remove excessively long tracking URLs
-        text = re.sub(r'https?://[^\s]{200,}', '[Long URL removed]', text)
-        
-        # Clean up common tracking parameters while preserving readable URLs
-        text = re.sub(r'(\?|&)(utm_[^&\s]*|tracking[^&\s]*|gclid[^&\s]*|fbclid[^&\s]*)', '', text)
-        
-        # Remove base64 encoded content that sometimes gets mixed in
-        text = re.sub(r'[A-Za-z0-9+/]{100,}={0,2}', '[Encoded content removed]', text)
+        # Remove long URLs, tracking parameters, encoded content and tokens in one pass
+        text = _RE_CLEAN_EMAIL_TEXT.sub(_clean_email_text_replacement, text)
         
         # Remove excessive whitespace but preserve paragraph breaks
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
-        
-        # Remove oauth tokens and similar long strings
-        text = re.sub(r'\b[A-Za-z0-9_-]{50,}\b', '[Token removed]', text)
+        text = _RE_EXCESS_WHITESPACE.sub(_collapse_whitespace_replacement, text)
         
         return text.strip()
     
@@ -324,7 +676,7 @@ class GoogleAPIService:
             text = re.sub(r'<[^>]+>', '', html)
             return self._clean_email_text(text)
         except Exception as e:
-            print(f"[DEBUG] HTML cleaning failed: {str(e)}")
+            logger.debug("HTML cleaning failed: %s", e)
             return self._clean_email_text(html)
     
     def _is_mostly_tracking_data(self, text: str) -> bool:
@@ -351,6 +703,14 @@ class GoogleAPIService:
         
         return tracking_chars > (total_chars * 0.3) or tracking_matches > 10
     
+    def _is_mostly_tracking_bytes(self, raw: bytes) -> bool:
+        """Check undecoded part bytes for tracking URLs and tokens making up most of the content"""
+        if not raw:
+            return False
+        
+        tracking_bytes = sum(len(match) for match in _RE_TRACKING_B.findall(raw))
+        return tracking_bytes > (len(raw) * 0.3)
+    
     def _extract_email_from_string(self, email_string: str) -> str:
         """Extract email address from string like 'Name <email@domain.com>'"""
         if not email_string:
@@ -387,18 +747,26 @@ class GoogleAPIService:
         Args:
             message_id: Gmail message ID
             
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.mark_emails_as_read([message_id])
+    
+    def mark_emails_as_read(self, message_ids: List[str]) -> bool:
+        """
+        Mark several emails as read with batched modify requests
+        
+        Args:
+            message_ids: Gmail message IDs
+            
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            self.gmail_service.users().messages().modify(
-                userId='me',
-                id=message_id,
-                body={'removeLabelIds': ['UNREAD']}
-            ).execute()
+            self._batch_modify(message_ids, remove_label_ids=['UNREAD'])
             return True
         except Exception as e:
-            print(f"[ERROR] Failed to mark email as read: {str(e)}")
+            logger.error("Failed to mark email as read: %s", e)
             return False
     
     def archive_email(self, message_id: str) -> bool:
@@ -408,27 +776,46 @@ class GoogleAPIService:
         Args:
             message_id: Gmail message ID
             
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.archive_emails([message_id])
+    
+    def archive_emails(self, message_ids: List[str]) -> bool:
+        """
+        Archive several emails (remove from inbox) with batched modify requests
+        
+        Args:
+            message_ids: Gmail message IDs
+            
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            self.gmail_service.users().messages().modify(
-                userId='me',
-                id=message_id,
-                body={'removeLabelIds': ['INBOX']}
-            ).execute()
+            self._batch_modify(message_ids, remove_label_ids=['INBOX'])
             return True
         except Exception as e:
-            print(f"[ERROR] Failed to archive email: {str(e)}")
+            logger.error("Failed to archive email: %s", e)
             return False
     
+    def _batch_modify(self, message_ids: List[str], remove_label_ids: List[str]) -> None:
+        """Remove labels from messages, at most BATCH_MODIFY_LIMIT IDs per request"""
+        for start in range(0, len(message_ids), self.BATCH_MODIFY_LIMIT):
+            self.gmail_service.users().messages().batchModify(
+                userId='me',
+                body={
+                    'ids': message_ids[start:start + self.BATCH_MODIFY_LIMIT],
+                    'removeLabelIds': remove_label_ids
+                }
+            ).execute()
+    
     def get_calendar_events(self,
                            calendar_id: str = 'primary',
                            time_min: datetime = None,
                            time_max: datetime = None,
                            max_results: int = 100,
                            single_events: bool = True,
-                           order_by: str = 'startTime') -> List[Dict[str, Any]]:
+                           order_by: str = 'startTime') -> List[CalendarEventRecord]:
         """
         Fetch calendar events
         
@@ -477,10 +864,10 @@ class GoogleAPIService:
             return processed_events
             
         except HttpError as error:
-            print(f"[ERROR] Calendar API error: {error}")
+            logger.error("Calendar API error: %s", error)
             raise Exception(f"Failed to fetch calendar events: {error}")
     
-    def _process_calendar_event(self, event: Dict, calendar_id: str) -> Optional[Dict[str, Any]]:
+    def _process_calendar_event(self, event: Dict, calendar_id: str) -> Optional[CalendarEventRecord]:
         """
         Process raw calendar event data into structured format
         
@@ -489,7 +876,7 @@ class GoogleAPIService:
             calendar_id: Calendar ID
             
         Returns:
-            Processed event data or None if failed
+            CalendarEventRecord with the processed event or None if failed
         """
         try:
             # Extract start and end times
@@ -503,12 +890,12 @@ class GoogleAPIService:
             timezone = None
             
             if 'dateTime' in start:
-                start_datetime = dateutil.parser.parse(start['dateTime'])
-                end_datetime = dateutil.parser.parse(end['dateTime'])
+                start_datetime = self._parse_iso_datetime(start['dateTime'])
+                end_datetime = self._parse_iso_datetime(end['dateTime'])
                 timezone = start.get('timeZone')
             elif 'date' in start:
-                start_datetime = dateutil.parser.parse(start['date'])
-                end_datetime = dateutil.parser.parse(end['date'])
+                start_datetime = self._parse_iso_datetime(start['date'])
+                end_datetime = self._parse_iso_datetime(end['date'])
                 is_all_day = True
             
             # Extract organizer info
@@ -536,30 +923,37 @@ class GoogleAPIService:
                         meeting_link = entry_point.get('uri')
                         break
             
-            return {
-                'id': event['id'],
-                'calendar_id': calendar_id,
-                'summary': event.get('summary', ''),
-                'description': event.get('description', ''),
-                'location': event.get('location', ''),
-                'start_datetime': start_datetime,
-                'end_datetime': end_datetime,
-                'timezone': timezone,
-                'is_all_day': is_all_day,
-                'status': event.get('status', 'confirmed').upper(),
-                'organizer_email': organizer_email,
-                'organizer_name': organizer_name,
-                'attendees': attendees,
-                'meeting_link': meeting_link,
-                'html_link': event.get('htmlLink', ''),
-                'created': dateutil.parser.parse(event['created']) if 'created' in event else None,
-                'updated': dateutil.parser.parse(event['updated']) if 'updated' in event else None
-            }
+            return CalendarEventRecord(
+                id=event['id'],
+                calendar_id=calendar_id,
+                summary=event.get('summary', ''),
+                description=event.get('description', ''),
+                location=event.get('location', ''),
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+                timezone=timezone,
+                is_all_day=is_all_day,
+                status=event.get('status', 'confirmed').upper(),
+                organizer_email=organizer_email,
+                organizer_name=organizer_name,
+                attendees=attendees,
+                meeting_link=meeting_link,
+                html_link=event.get('htmlLink', ''),
+                created=self._parse_iso_datetime(event['created']) if 'created' in event else None,
+                updated=self._parse_iso_datetime(event['updated']) if 'updated' in event else None
+            )
             
         except Exception as e:
-            print(f"[ERROR] Failed to process calendar event {event.get('id', 'unknown')}: {str(e)}")
+            logger.error("Failed to process calendar event %s: %s", event.get('id', 'unknown'), e)
             return None
     
+    def _parse_iso_datetime(self, value: str) -> datetime:
+        """Parse a Calendar API ISO-8601 timestamp or date, falling back to dateutil"""
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return dateutil.parser.parse(value)
+    
     def get_calendars(self) -> List[Dict[str, Any]]:
         """
         Get list of available calendars
@@ -589,38 +983,58 @@ class GoogleAPIService:
             return calendars
             
         except HttpError as error:
-            print(f"[ERROR] Calendar list API error: {error}")
+            logger.error("Calendar list API error: %s", error)
             raise Exception(f"Failed to fetch calendars: {error}")
     
-    def search_hiring_related_emails(self, days_back: int = 30) -> Dict[str, Any]:
+    def search_hiring_related_emails(self, days_back: int = 30, start_history_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Search for hiring-related emails using common keywords, including spam folder
         
         Args:
-            days_back: Number of days to search back
+            days_back: Number of days to search back; only used by full searches
+            start_history_id: Gmail history ID from the previous sync; when given, only
+                messages added since then are fetched and days_back is ignored
             
         Returns:
-            Dict containing hiring-related emails from inbox and spam
-        """
-        # Common hiring-related keywords and patterns
-        hiring_keywords = [
-            "interview", "job opportunity", "position", "recruiter", "hiring",
-            "application", "resume", "CV", "offer", "salary", "compensation",
-            "onboarding", "background check", "reference", "screening",
-            "technical assessment", "coding challenge", "take home",
-            "team meeting", "culture fit", "next steps", "feedback"
-        ]
+            Dict containing hiring-related emails from inbox and spam, the
+            history_id to pass to the next incremental sync, and whether this
+            was an incremental sync or a full days_back search
+        """
+        if start_history_id:
+            incremental = self._get_emails_since_history(start_history_id)
+            if incremental is not None:
+                new_emails, history_id = incremental
+                candidate_emails = [email for email in new_emails if self._matches_hiring_keywords(email)]
+                logger.info("Incremental sync: %s new emails, %s hiring-related", len(new_emails), len(candidate_emails))
+                
+                filtered_emails = self._filter_legitimate_hiring_emails(candidate_emails)
+                
+                return {
+                    'emails': filtered_emails,
+                    'next_page_token': None,
+                    'result_size_estimate': len(filtered_emails),
+                    'original_count': len(candidate_emails),
+                    'spam_filtered_count': len(candidate_emails) - len(filtered_emails),
+                    'history_id': history_id,
+                    'incremental': True
+                }
         
         # Build search query
-        keyword_query = " OR ".join([f'"{keyword}"' for keyword in hiring_keywords])
+        keyword_query = " OR ".join([f'"{keyword}"' for keyword in self.HIRING_KEYWORDS])
         date_query = f"newer_than:{days_back}d"
-        full_query = f"({keyword_query}) AND {date_query}"
+        # Let Gmail drop obvious spam server-side instead of downloading and filtering it here
+        excluded_phrases = " ".join([f'"{phrase}"' for phrase in self.QUERY_EXCLUDED_PHRASES])
+        excluded_senders = " OR ".join(self.QUERY_EXCLUDED_SENDERS)
+        full_query = f"({keyword_query}) AND {date_query} AND -{{{excluded_phrases}}} AND -from:({excluded_senders})"
         
         # Search in both inbox and spam
-        print(f"[INFO] Searching for hiring emails in inbox and spam for {days_back} days")
+        logger.info("Searching for hiring emails in inbox and spam for %s days", days_back)
+        
+        # Capture the history ID before searching so messages arriving mid-search are picked up next time
+        history_id = self.gmail_service.users().getProfile(userId='me').execute().get('historyId')
         
-        # Get emails from inbox and spam
-        all_emails = self.get_emails(query=full_query, max_results=200, include_spam_trash=True)
+        # Get emails from inbox and spam; bodies are needed for spam filtering and analysis
+        all_emails = self.get_emails(query=full_query, max_results=200, include_spam_trash=True, fetch_bodies=True)
         
         # Filter out actual spam using additional validation
         filtered_emails = self._filter_legitimate_hiring_emails(all_emails.get('emails', []))
@@ -630,10 +1044,69 @@ class GoogleAPIService:
             'next_page_token': all_emails.get('next_page_token'),
             'result_size_estimate': len(filtered_emails),
             'original_count': len(all_emails.get('emails', [])),
-            'spam_filtered_count': len(all_emails.get('emails', [])) - len(filtered_emails)
+            'spam_filtered_count': len(all_emails.get('emails', [])) - len(filtered_emails),
+            'history_id': history_id,
+            'incremental': False
         }
     
-    def get_upcoming_events(self, days_ahead: int = 7) -> List[Dict[str, Any]]:
+    def _get_emails_since_history(self, start_history_id: str) -> Optional[Tuple[List[EmailRecord], str]]:
+        """
+        Fetch emails added to the mailbox since a Gmail history ID
+        
+        Args:
+            start_history_id: History ID recorded by the previous sync
+            
+        Returns:
+            Tuple of (emails, latest history ID), or None if the history ID is too old
+            and a full sync is required. If any message could not be fetched, the
+            returned history ID is start_history_id so nothing is skipped
+        """
+        message_ids = []
+        history_id = start_history_id
+        page_token = None
+        
+        try:
+            while True:
+                response = self.gmail_service.users().history().list(
+                    userId='me',
+                    startHistoryId=start_history_id,
+                    historyTypes=['messageAdded'],
+                    pageToken=page_token
+                ).execute()
+                
+                for record in response.get('history', []):
+                    for added in record.get('messagesAdded', []):
+                        message_ids.append(added['message']['id'])
+                
+                history_id = response.get('historyId', history_id)
+                page_token = response.get('nextPageToken')
+                if not page_token:
+                    break
+        except HttpError as error:
+            # Gmail only keeps history for a limited time; expired IDs need a full sync
+            if error.resp.status in (404, 412):
+                logger.info("Gmail history ID %s expired, falling back to full sync", start_history_id)
+                return None
+            logger.error("Gmail history API error: %s", error)
+            raise Exception(f"Failed to fetch email history: {error}")
+        
+        emails = []
+        for message_id in dict.fromkeys(message_ids):
+            email_data = self._get_email_details(message_id)
+            if email_data:
+                emails.append(email_data)
+            else:
+                # Keep the old history ID so the next sync lists this message again
+                history_id = start_history_id
+        
+        return emails, history_id
+    
+    def _matches_hiring_keywords(self, email: EmailRecord) -> bool:
+        """Client-side equivalent of the hiring keyword search query"""
+        content = f"{email.subject} {email.body_text}".lower()
+        return any(keyword.lower() in content for keyword in self.HIRING_KEYWORDS)
+    
+    def get_upcoming_events(self, days_ahead: int = 7) -> List[CalendarEventRecord]:
         """
         Get upcoming calendar events
         
@@ -652,12 +1125,12 @@ class GoogleAPIService:
             max_results=50
         )
     
-    def _filter_legitimate_hiring_emails(self, emails: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _filter_legitimate_hiring_emails(self, emails: List[EmailRecord]) -> List[EmailRecord]:
         """
         Filter out actual spam emails from the list, keeping only legitimate hiring emails
         
         Args:
-            emails: List of email dictionaries
+            emails: List of email records
             
         Returns:
             List of legitimate hiring emails
@@ -665,70 +1138,35 @@ class GoogleAPIService:
         legitimate_emails = []
         
         for email in emails:
-            if self._is_legitimate_hiring_email(email):
+            # Lowercase the searchable content once per email
+            content = f"{email.subject} {email.body_text} {email.sender_email} {email.sender_name}".lower()
+            if self._is_legitimate_hiring_email(email, content):
                 legitimate_emails.append(email)
             else:
-                print(f"[INFO] Filtered out potential spam email: {email.get('subject', 'No subject')[:50]}...")
+                logger.info("Filtered out potential spam email: %s...", (email.subject or 'No subject')[:50])
         
         return legitimate_emails
     
-    def _is_legitimate_hiring_email(self, email: Dict[str, Any]) -> bool:
+    def _is_legitimate_hiring_email(self, email: EmailRecord, content: Optional[str] = None) -> bool:
         """
         Determine if an email is a legitimate hiring email or spam
         
         Args:
-            email: Email data dictionary
+            email: Email record
+            content: Precomputed lowercased subject, body and sender text
             
         Returns:
             bool: True if legitimate, False if spam
         """
-        subject = email.get('subject', '').lower()
-        body_text = email.get('body_text', '').lower()
-        sender_email = email.get('sender_email', '').lower()
-        sender_name = email.get('sender_name', '').lower()
-        
-        # Red flags that indicate spam
-        spam_indicators = [
-            # Generic spam phrases
-            'make money fast', 'easy money', 'get rich quick', 'work from home scam',
-            'no experience required', 'earn $', 'guaranteed income', 'click here now',
-            'limited time offer', 'act now', 'urgent response required',
-            
-            # Suspicious hiring claims
-            'high paying job with no experience', 'earn thousands weekly',
-            'mysterious shopper', 'envelope stuffing', 'data entry from home',
-            
-            # Generic/suspicious senders
-            'noreply@', 'donotreply@', 'automated@',
-            
-            # Suspicious links/attachments
-            'download this software', 'install this app', 'verify your account',
-            'update your information', 'confirm your identity'
-        ]
+        sender_email = email.sender_email.lower()
         
-        # Check for spam indicators
-        content = f"{subject} {body_text} {sender_email} {sender_name}"
-        spam_score = sum(1 for indicator in spam_indicators if indicator in content)
+        if content is None:
+            content = f"{email.subject} {email.body_text} {email.sender_email} {email.sender_name}".lower()
         
-        # Legitimate hiring email indicators
-        legitimate_indicators = [
-            # Professional language
-            'dear', 'sincerely', 'best regards', 'thank you for your time',
-            'we reviewed your application', 'would like to schedule',
-            'interview process', 'next steps', 'team member',
-            
-            # Company-specific domains (not free email providers for professional outreach)
-            '.com', '.org', '.net', '.edu', '.gov',
-            
-            # Specific role mentions
-            'software engineer', 'developer', 'manager', 'analyst', 'coordinator',
-            'specialist', 'consultant', 'director', 'lead', 'senior', 'junior',
-            
-            # Legitimate recruiting platforms
-            'linkedin', 'indeed', 'glassdoor', 'hired.com', 'angellist'
-        ]
-        
-        legitimacy_score = sum(1 for indicator in legitimate_indicators if indicator in content)
+        # Check for spam and legitimacy indicators
+        spam_score, legitimacy_score = self._score_indicators(content)
+        if sender_email.endswith(self.LEGITIMATE_SENDER_TLDS):
+            legitimacy_score += 1
         
         # Check sender domain authenticity
         domain_legitimacy = self._check_sender_domain_legitimacy(sender_email)
@@ -752,10 +1190,30 @@ class GoogleAPIService:
         )
         
         if not is_legitimate:
-            print(f"[DEBUG] Email filtered as spam - Score: {total_score}, Spam: {spam_score}, Legit: {legitimacy_score}, Domain: {domain_legitimacy}")
+            logger.debug("Email filtered as spam - Score: %s, Spam: %s, Legit: %s, Domain: %s", total_score, spam_score, legitimacy_score, domain_legitimacy)
         
         return is_legitimate
     
+    def _score_indicators(self, content: str) -> Tuple[int, int]:
+        """
+        Count distinct spam and legitimacy indicators present in content
+        
+        Args:
+            content: Lowercased email content to scan
+            
+        Returns:
+            Tuple of (spam_score, legitimacy_score)
+        """
+        if self._INDICATOR_AUTOMATON is None:
+            spam_score = sum(1 for indicator in self.SPAM_INDICATORS if indicator in content)
+            legitimacy_score = sum(1 for indicator in self.LEGITIMATE_INDICATORS if indicator in content)
+            return spam_score, legitimacy_score
+        
+        # Single pass over content; each indicator counts once however often it occurs
+        matched = {value for _, value in self._INDICATOR_AUTOMATON.iter(content)}
+        spam_score = sum(1 for label, _ in matched if label == 'spam')
+        return spam_score, len(matched) - spam_score
+    
     def _check_sender_domain_legitimacy(self, sender_email: str) -> int:
         """
         Check if sender domain appears legitimate for hiring emails
@@ -766,74 +1224,51 @@ class GoogleAPIService:
         Returns:
             int: Legitimacy score (0-3)
         """
-        if not sender_email or '@' not in sender_email:
+        at = sender_email.rfind('@') if sender_email else -1
+        if at < 0:
             return 0
         
-        domain = sender_email.split('@')[1].lower()
-        
-        # Known legitimate recruiting/job platforms
-        legitimate_platforms = [
-            'linkedin.com', 'indeed.com', 'glassdoor.com', 'monster.com',
-            'ziprecruiter.com', 'careerbuilder.com', 'dice.com',
-            'angellist.com', 'wellfound.com', 'hired.com', 'triplebyte.com'
-        ]
-        
-        # Corporate domains (not free email providers)
-        corporate_indicators = [
-            'corp.', 'company.', 'inc.', 'llc.', 'ltd.',
-            '.edu', '.gov', '.org'
-        ]
+        domain = sender_email[at + 1:].lower()
         
-        # Free email providers (lower trust for professional outreach)
-        free_providers = [
-            'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
-            'aol.com', 'icloud.com', 'protonmail.com'
-        ]
-        
-        if domain in legitimate_platforms:
+        if domain in self.RECRUITING_PLATFORM_DOMAINS:
             return 3  # High trust
-        elif any(indicator in domain for indicator in corporate_indicators):
+        elif _RE_CORPORATE_DOMAIN.search(domain):
             return 2  # Medium-high trust
-        elif domain in free_providers:
+        elif domain in self.FREE_EMAIL_PROVIDER_DOMAINS:
             return 1  # Lower trust but not disqualifying
-        elif '.' in domain and len(domain.split('.')) >= 2:
+        elif '.' in domain:
             return 2  # Appears to be a legitimate domain
         else:
             return 0  # Suspicious domain
     
-    def _check_email_structure(self, email: Dict[str, Any]) -> int:
+    def _check_email_structure(self, email: EmailRecord) -> int:
         """
         Check email structure for legitimacy indicators
         
         Args:
-            email: Email data dictionary
+            email: Email record
             
         Returns:
             int: Structure score (0-2)
         """
         score = 0
         
-        subject = email.get('subject', '')
-        body_text = email.get('body_text', '')
+        subject = email.subject or ''
+        body_text = email.body_text or ''
         
         # Check subject line quality
-        if subject and len(subject) > 10 and len(subject) < 200:
+        if 10 < len(subject) < 200:
             score += 1
         
         # Check body content quality
         if body_text:
             # Has reasonable length
-            if 50 < len(body_text) < 5000:
+            body_length = len(body_text)
+            if 50 < body_length < 5000:
                 score += 1
             
             # Contains professional language patterns
-            professional_patterns = [
-                r'\b(dear|hello|hi)\s+\w+', # Proper greeting
-                r'\b(sincerely|best regards|thank you)', # Professional closing
-                r'\b(company|organization|team|position|role)\b' # Business context
-            ]
-            
-            if any(re.search(pattern, body_text, re.IGNORECASE) for pattern in professional_patterns):
+            if _RE_PROFESSIONAL_LANGUAGE.search(body_text):
                 score += 1
         
         return min(score, 2)  # Cap at 2 points
\ No newline at end of file
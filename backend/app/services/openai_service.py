@@ -1,135 +1,236 @@
 from openai import OpenAI
 import requests
 from bs4 import BeautifulSoup
+import soupsieve
 import json
-from typing import Optional, Dict, Any
+import logging
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
+from urllib.parse import urlsplit
 import re
 
+logger = logging.getLogger(__name__)
+
+# Pattern used by _generate_job_id, compiled once at import
+_RE_NON_ALNUM = re.compile(r'[^A-Za-z0-9]')
+
+# Upper bound on page bytes read; job text is cut to 8000 characters anyway, but
+# scripts and styles in <head> can take up the first few hundred KB of a page
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Any run of whitespace in extracted page text, collapsed to a single space
+_RE_WHITESPACE = re.compile(r'\s+')
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Common selectors for job posting content, in order of preference
+CONTENT_SELECTORS = [
+    '[data-testid*="job"]',
+    '.job-description',
+    '.job-details',
+    '.job-content',
+    '.posting-content',
+    '.position-description',
+    '[role="main"]',
+    'main',
+    '.content',
+    '#job-description',
+    '#job-details'
+]
+
+# One union selector finds every candidate in a single tree walk; the per-selector
+# patterns then rank those candidates without walking the tree again
+_CONTENT_SELECTOR_UNION = soupsieve.compile(', '.join(CONTENT_SELECTORS))
+_CONTENT_SELECTOR_PATTERNS = [(selector, soupsieve.compile(selector)) for selector in CONTENT_SELECTORS]
+
+
+def _extract_page_text_lexbor(page: bytes) -> str:
+    """Extract job posting text from raw page bytes with selectolax's lexbor parser
+    
+    Mirrors _extract_page_text_soup without building a Python object per DOM node.
+    """
+    tree = LexborHTMLParser(page)
+    
+    # Try to find specific job posting content areas first
+    job_content = None
+    
+    for selector in CONTENT_SELECTORS:
+        nodes = tree.css(selector)
+        if nodes:
+            logger.debug("Found content using selector: %s", selector)
+            job_content = ' '.join([node.text(strip=True) for node in nodes])
+            break
+    
+    # If no specific job content found, fall back to full page
+    if not job_content or len(job_content.strip()) < 100:
+        logger.debug("Using full page content as fallback")
+        
+        # Remove script, style, and navigation elements
+        tree.strip_tags(["script", "style", "nav", "header", "footer"])
+        
+        # Get text and clean it
+        job_content = tree.root.text() if tree.root is not None else ''
+    
+    # Clean the text
+    text = _RE_WHITESPACE.sub(' ', job_content).strip()
+    
+    # If content is still very short, it might be a SPA - try to extract any visible text
+    if len(text) < 100 and tree.root is not None:
+        logger.debug("Content very short, extracting all visible text")
+        text = _RE_WHITESPACE.sub(' ', tree.root.text(separator=' ', strip=True)).strip()
+    
+    return text
+
+
+def _extract_page_text_soup(page: bytes) -> str:
+    """Extract job posting text from raw page bytes with BeautifulSoup"""
+    soup = BeautifulSoup(page, HTML_PARSER)
+    
+    # Try to find specific job posting content areas first
+    job_content = None
+    
+    candidates = _CONTENT_SELECTOR_UNION.select(soup)
+    for selector, pattern in _CONTENT_SELECTOR_PATTERNS:
+        elements = [elem for elem in candidates if pattern.match(elem)]
+        if elements:
+            logger.debug("Found content using selector: %s", selector)
+            job_content = ' '.join([elem.get_text(strip=True) for elem in elements])
+            break
+    
+    # If no specific job content found, fall back to full page
+    if not job_content or len(job_content.strip()) < 100:
+        logger.debug("Using full page content as fallback")
+        
+        # Remove script, style, and navigation elements
+        for script in soup(["script", "style", "nav", "header", "footer"]):
+            script.decompose()
+        
+        # Get text and clean it
+        job_content = soup.get_text()
+    
+    # Clean the text
+    text = _RE_WHITESPACE.sub(' ', job_content).strip()
+    
+    # If content is still very short, it might be a SPA - try to extract any visible text
+    if len(text.strip()) < 100:
+        logger.debug("Content very short, extracting all visible text")
+        # Get all text content, including from data attributes
+        all_text = []
+        for elem in soup.find_all(string=True):
+            if elem.strip() and elem.parent.name not in ['script', 'style']:
+                all_text.append(elem.strip())
+        text = ' '.join(all_text)
+    
+    return text
+
+
+# Enhanced headers to appear more like a real browser
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0'
+}
+
 class OpenAIService:
+    # Shared across instances so page fetches reuse pooled TCP/TLS connections
+    _http_session: Optional[requests.Session] = None
+    _http_session_lock = threading.Lock()
+    
     def __init__(self, api_key: str):
         self.client = OpenAI(api_key=api_key)
     
+    @classmethod
+    def _get_http_session(cls) -> requests.Session:
+        """Return the shared page-fetching session, creating it on first use"""
+        if cls._http_session is None:
+            with cls._http_session_lock:
+                if cls._http_session is None:
+                    session = requests.Session()
+                    session.headers.update(BROWSER_HEADERS)
+                    cls._http_session = session
+        return cls._http_session
+    
     def test_api_key(self) -> bool:
         """Test if the OpenAI API key is valid"""
         try:
-            print("[DEBUG] Testing OpenAI API key...")
+            logger.debug("Testing OpenAI API key...")
             # Make a simple API call to test the key
             response = self.client.models.list()
-            print(f"[DEBUG] API key test successful, found {len(response.data)} models")
+            logger.debug("API key test successful, found %s models", len(response.data))
             return True
         except Exception as e:
-            print(f"[ERROR] OpenAI API key test failed: {str(e)}")
-            print(f"[ERROR] Exception type: {type(e)}")
+            logger.error("OpenAI API key test failed: %s", e)
+            logger.error("Exception type: %s", type(e))
             return False
     
     def fetch_webpage_content(self, url: str) -> Optional[str]:
         """Fetch and clean webpage content"""
         try:
-            print(f"[DEBUG] Fetching webpage content from: {url}")
-            
-            # Enhanced headers to appear more like a real browser
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Cache-Control': 'max-age=0'
-            }
-            
-            # Create a session for better handling
-            session = requests.Session()
-            session.headers.update(headers)
-            
-            # First, try to get the page
-            response = session.get(url, timeout=15, allow_redirects=True)
-            print(f"[DEBUG] HTTP response status: {response.status_code}")
-            print(f"[DEBUG] Final URL after redirects: {response.url}")
-            print(f"[DEBUG] Response content length: {len(response.content)} bytes")
-            
-            response.raise_for_status()
-            
-            # Parse HTML and extract text
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Try to find specific job posting content areas first
-            job_content = None
-            
-            # Common selectors for job posting content
-            content_selectors = [
-                '[data-testid*="job"]',
-                '.job-description',
-                '.job-details', 
-                '.job-content',
-                '.posting-content',
-                '.position-description',
-                '[role="main"]',
-                'main',
-                '.content',
-                '#job-description',
-                '#job-details'
-            ]
-            
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    print(f"[DEBUG] Found content using selector: {selector}")
-                    job_content = ' '.join([elem.get_text(strip=True) for elem in elements])
-                    break
+            logger.debug("Fetching webpage content from: %s", url)
             
-            # If no specific job content found, fall back to full page
-            if not job_content or len(job_content.strip()) < 100:
-                print("[DEBUG] Using full page content as fallback")
+            # First, try to get the page; stream it so oversized pages stop at the byte cap
+            with self._get_http_session().get(url, timeout=15, allow_redirects=True, stream=True) as response:
+                logger.debug("HTTP response status: %s", response.status_code)
+                logger.debug("Final URL after redirects: %s", response.url)
                 
-                # Remove script, style, and navigation elements
-                for script in soup(["script", "style", "nav", "header", "footer"]):
-                    script.decompose()
+                response.raise_for_status()
                 
-                # Get text and clean it
-                job_content = soup.get_text()
+                page = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    page.extend(chunk)
+                    if len(page) >= MAX_PAGE_BYTES:
+                        logger.debug("Page exceeds %s bytes, truncating", MAX_PAGE_BYTES)
+                        break
+            logger.debug("Response content length: %s bytes", len(page))
             
-            # Clean the text
-            lines = (line.strip() for line in job_content.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = ' '.join(chunk for chunk in chunks if chunk)
-            
-            # If content is still very short, it might be a SPA - try to extract any visible text
-            if len(text.strip()) < 100:
-                print("[DEBUG] Content very short, extracting all visible text")
-                # Get all text content, including from data attributes
-                all_text = []
-                for elem in soup.find_all(text=True):
-                    if elem.strip() and elem.parent.name not in ['script', 'style']:
-                        all_text.append(elem.strip())
-                text = ' '.join(all_text)
+            # Parse HTML and extract text, with the C lexbor parser when available
+            if LexborHTMLParser is not None:
+                text = _extract_page_text_lexbor(bytes(page))
+            else:
+                text = _extract_page_text_soup(bytes(page))
             
             # Limit content length to avoid token limits
             content = text[:8000]  # Roughly 2000 tokens
-            print(f"[DEBUG] Final extracted content length: {len(content)} characters")
-            print(f"[DEBUG] Content preview: {content[:200]}...")
+            logger.debug("Final extracted content length: %s characters", len(content))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Content preview: %s...", content[:200])
             
             # Check if we have meaningful content
             if len(content.strip()) < 50:
-                print("[ERROR] Extracted content is too short, might be a dynamic page")
+                logger.error("Extracted content is too short, might be a dynamic page")
                 return None
                 
             return content
             
         except Exception as e:
-            print(f"[ERROR] Error fetching webpage: {str(e)}")
-            print(f"[ERROR] Exception type: {type(e)}")
+            logger.error("Error fetching webpage: %s", e)
+            logger.error("Exception type: %s", type(e))
             return None
     
     def parse_job_details(self, url: str, webpage_content: str) -> Optional[Dict[str, Any]]:
         """Parse job details from webpage content using OpenAI"""
         try:
-            print(f"[DEBUG] Starting OpenAI parsing for URL: {url}")
-            print(f"[DEBUG] Content length for parsing: {len(webpage_content)} characters")
+            logger.debug("Starting OpenAI parsing for URL: %s", url)
+            logger.debug("Content length for parsing: %s characters", len(webpage_content))
             
             prompt = f"""
             Analyze the following job posting webpage content and extract key information. 
@@ -155,112 +256,123 @@ class OpenAIService:
             {webpage_content}
             """
             
-            print("[DEBUG] Sending request to OpenAI...")
+            logger.debug("Sending request to OpenAI...")
             response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
+                model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "You are a job posting analyzer. Extract information accurately and return only valid JSON."},
                     {"role": "user", "content": prompt}
                 ],
+                # JSON mode guarantees a bare JSON object, so no code-fence cleanup is needed
+                response_format={"type": "json_object"},
                 temperature=0.1,
-                max_tokens=500
+                max_tokens=300
             )
             
-            result = response.choices[0].message.content.strip()
-            print(f"[DEBUG] OpenAI response: {result[:200]}...")
-            
-            # Clean the response to ensure it's valid JSON
-            if result.startswith('```json'):
-                result = result[7:]
-            if result.endswith('```'):
-                result = result[:-3]
-            result = result.strip()
+            result = response.choices[0].message.content
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("OpenAI response: %s...", result[:200])
             
-            print("[DEBUG] Attempting to parse JSON...")
+            logger.debug("Attempting to parse JSON...")
             # Parse JSON
             job_data = json.loads(result)
-            print(f"[DEBUG] Successfully parsed JSON: {job_data}")
+            logger.debug("Successfully parsed JSON: %s", job_data)
             
             # Validate required fields
             if not job_data.get('company_name') or not job_data.get('job_title'):
-                print(f"[DEBUG] Missing required fields - company_name: {job_data.get('company_name')}, job_title: {job_data.get('job_title')}")
+                logger.debug("Missing required fields - company_name: %s, job_title: %s", job_data.get('company_name'), job_data.get('job_title'))
                 return None
                 
             return job_data
             
         except json.JSONDecodeError as e:
-            print(f"[ERROR] JSON parsing error: {str(e)}")
-            print(f"[ERROR] Raw response: {result}")
+            logger.error("JSON parsing error: %s", e)
+            logger.error("Raw response: %s", result)
             return None
         except Exception as e:
-            print(f"[ERROR] Error parsing job details: {str(e)}")
-            print(f"[ERROR] Exception type: {type(e)}")
+            logger.error("Error parsing job details: %s", e)
+            logger.error("Exception type: %s", type(e))
             return None
     
     def parse_job_url(self, url: str) -> Optional[Dict[str, Any]]:
         """Main method to parse job URL and extract details"""
-        print(f"[DEBUG] parse_job_url called with URL: {url}")
+        logger.debug("parse_job_url called with URL: %s", url)
         
         # Validate URL format
-        print("[DEBUG] Validating URL format...")
+        logger.debug("Validating URL format...")
         if not self._is_valid_url(url):
-            print("[ERROR] Invalid URL format")
+            logger.error("Invalid URL format")
             return None
-        print("[DEBUG] URL format is valid")
+        logger.debug("URL format is valid")
             
         # Fetch webpage content
-        print("[DEBUG] Fetching webpage content...")
+        logger.debug("Fetching webpage content...")
         content = self.fetch_webpage_content(url)
         if not content:
-            print("[ERROR] Failed to fetch webpage content - this might be a dynamic page that requires JavaScript")
+            logger.error("Failed to fetch webpage content - this might be a dynamic page that requires JavaScript")
             return None
-        print("[DEBUG] Successfully fetched webpage content")
+        logger.debug("Successfully fetched webpage content")
             
         # Parse job details using OpenAI
-        print("[DEBUG] Parsing job details with OpenAI...")
+        logger.debug("Parsing job details with OpenAI...")
         job_details = self.parse_job_details(url, content)
         
         if not job_details:
-            print("[ERROR] Failed to parse job details")
+            logger.error("Failed to parse job details")
             return None
         
         # Generate a job ID if not found
         if not job_details.get('job_id'):
-            print("[DEBUG] Generating job ID...")
+            logger.debug("Generating job ID...")
             job_details['job_id'] = self._generate_job_id(url, job_details.get('company_name', ''))
-            print(f"[DEBUG] Generated job ID: {job_details['job_id']}")
+            logger.debug("Generated job ID: %s", job_details['job_id'])
             
-        print(f"[DEBUG] Final job details: {job_details}")
+        logger.debug("Final job details: %s", job_details)
         return job_details
     
+    def parse_job_urls(self, urls: List[str], max_workers: int = 4) -> List[Optional[Dict[str, Any]]]:
+        """Parse several job URLs concurrently, overlapping page fetches and OpenAI calls
+        
+        Results are returned in the same order as urls; failed URLs map to None.
+        """
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(self.parse_job_url, urls))
+    
     def _is_valid_url(self, url: str) -> bool:
         """Validate URL format"""
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        return url_pattern.match(url) is not None
+        if not url or any(char.isspace() for char in url):
+            return False
+        try:
+            parts = urlsplit(url)
+            parts.port  # Raises ValueError for a malformed port
+        except ValueError:
+            return False
+        hostname = parts.hostname
+        if parts.scheme not in ('http', 'https') or not hostname:
+            return False
+        return hostname == 'localhost' or '.' in hostname
     
     def _generate_job_id(self, url: str, company_name: str) -> str:
         """Generate a job ID from URL and company name"""
         # Extract meaningful parts from URL
         url_parts = url.split('/')
         
-        # Look for numeric IDs in URL
+        # Single pass: a numeric ID wins outright, otherwise keep the first alphanumeric one
+        alnum_id = None
         for part in url_parts:
-            if part.isdigit() and len(part) >= 3:
-                return part
-                
+            if part.isdigit():
+                if len(part) >= 3:
+                    return part
+            elif alnum_id is None and len(part) >= 5 and part.isascii() and part.isalnum():
+                alnum_id = part
+        
         # Look for alphanumeric job IDs
-        for part in url_parts:
-            if re.match(r'^[A-Za-z0-9]+$', part) and len(part) >= 5:
-                return part
-                
+        if alnum_id:
+            return alnum_id
+        
         # Fallback: use company name + hash of URL
-        import hashlib
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-        company_short = re.sub(r'[^A-Za-z0-9]', '', company_name)[:10] if company_name else 'JOB'
+        url_hash = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
+        company_short = _RE_NON_ALNUM.sub('', company_name)[:10] if company_name else 'JOB'
         return f"{company_short}_{url_hash}" 
\ No newline at end of file
@@ -0,0 +1,59 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after ttl seconds"""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Bumped on every session commit in this process; part of each cache key, so any
+# write makes earlier entries unreachable while the TTL covers writes from elsewhere
+_data_generation = 0
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_data_generation(session):
+    global _data_generation
+    _data_generation += 1
+
+
+def data_generation() -> int:
+    """Current write generation of the database, as seen by this process"""
+    return _data_generation
+
+
+analytics_cache = TTLCache(maxsize=256, ttl=60.0)
@@ -3,17 +3,19 @@ import os
 from pathlib import Path
 from datetime import datetime
 import subprocess
+from functools import lru_cache
 from typing import Dict, Any
 
 # Get the path to the project root (two levels up from this file)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+@lru_cache(maxsize=1)
 def load_version_config() -> Dict[str, Any]:
     """Load version configuration from version.json"""
     version_file = PROJECT_ROOT / "version.json"
     try:
-        with open(version_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # json.loads detects UTF-8 in bytes, so no text-mode decode layer is needed
+        return json.loads(version_file.read_bytes())
     except FileNotFoundError:
         # Fallback to default version if file doesn't exist
         return {
@@ -23,29 +25,25 @@ def load_version_config() -> Dict[str, Any]:
             "api_version": "v1"
         }
 
+@lru_cache(maxsize=1)
 def get_git_info() -> Dict[str, str]:
     """Get current git information"""
     try:
-        # Get current commit hash
-        commit_hash = subprocess.check_output(
-            ['git', 'rev-parse', '--short', 'HEAD'],
+        # Get current commit hash and branch in one git call; --short implies
+        # --verify and refuses a second revision, so the hash is abbreviated here
+        full_hash, branch = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD', '--abbrev-ref', 'HEAD'],
             cwd=PROJECT_ROOT,
             stderr=subprocess.DEVNULL
-        ).decode().strip()
-        
-        # Get current branch
-        branch = subprocess.check_output(
-            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            cwd=PROJECT_ROOT,
-            stderr=subprocess.DEVNULL
-        ).decode().strip()
+        ).decode().split()
+        commit_hash = full_hash[:7]
         
         return {
             "commit_hash": commit_hash,
             "branch": branch,
             "build_date": datetime.utcnow().isoformat() + "Z"
         }
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
         # Git not available or not in a git repository
         return {
             "commit_hash": "unknown",
@@ -53,6 +51,7 @@ def get_git_info() -> Dict[str, str]:
             "build_date": datetime.utcnow().isoformat() + "Z"
         }
 
+@lru_cache(maxsize=1)
 def get_version_info() -> Dict[str, Any]:
     """Get complete version information"""
     config = load_version_config()
@@ -9,51 +9,450 @@ import sys
 import json
 import shutil
 import sqlite3
-import subprocess
+import tarfile
 import datetime
+import gzip
+import io
+import mmap
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, Tuple, Iterable, Iterator, List, IO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# SQL text dumps: compression suffix for default names and write buffer size
+SQL_DUMP_COMPRESSION = ".zst" if zstandard is not None else ".gz"
+SQL_DUMP_BUFFER_SIZE = 1 << 20
+
+# Per-backup index of uploads (relative path -> [size, mtime_ns]) used for incremental copies
+UPLOADS_INDEX_FILE = "uploads_index.json"
+
+# First 16 bytes of every SQLite 3 database file
+SQLITE_HEADER = b"SQLite format 3\x00"
+
+# Connection settings for loading a SQL dump; MEMORY keeps ROLLBACK working, unlike OFF
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-200000",
+)
+
+DUMP_TRANSACTION_STATEMENTS = {"BEGIN TRANSACTION;", "BEGIN;", "COMMIT;", "END TRANSACTION;", "END;"}
+
+# Bytes requested per copy_file_range call; the kernel may copy less and is called again
+COPY_FILE_RANGE_CHUNK = 1 << 30
+
+# ioctl that clones a whole file copy-on-write (Linux btrfs/XFS); fcntl only names it from 3.12
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
+
+def iter_sql_statements(lines: Iterable[str]) -> Iterator[str]:
+    """Group lines of a SQL script into complete statements
+    
+    sqlite3.complete_statement understands quoting, so semicolons and newlines
+    inside string literals do not split a statement.
+    """
+    statement = []
+    for line in lines:
+        statement.append(line)
+        if line.rstrip().endswith(';'):
+            candidate = ''.join(statement)
+            if sqlite3.complete_statement(candidate):
+                yield candidate
+                statement = []
+    
+    remainder = ''.join(statement)
+    if remainder.strip():
+        yield remainder
+
+def fast_copy(src: str, dst: str) -> str:
+    """copy2 that moves the bytes in-kernel with os.copy_file_range
+    
+    On btrfs/XFS the kernel can satisfy this with a reflink, so no data is
+    written at all. Falls back to shutil.copy2 where copy_file_range is missing
+    or refused (EXDEV on older kernels, ENOSYS, unsupported filesystems).
+    """
+    if not hasattr(os, 'copy_file_range'):
+        return shutil.copy2(src, dst)
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            while os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_FILE_RANGE_CHUNK):
+                pass
+    except OSError:
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+def reflink_copy(src: str, dst: str) -> str:
+    """Clone a file with the FICLONE ioctl so source and copy share blocks until written
+    
+    Raises OSError where the platform or filesystem cannot clone.
+    """
+    if fcntl is None:
+        raise OSError("reflinks are not supported on this platform")
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    shutil.copystat(src, dst)
+    return dst
+
+def mmap_copy(src: str, dst: str) -> str:
+    """Copy a file by writing a read-only memory map of it in one call
+    
+    No Python-side read buffers are allocated; the kernel pages the source in
+    with its own readahead.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        # mmap refuses zero-length files; there is nothing to write anyway
+        if size:
+            with mmap.mmap(fsrc.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+                fdst.write(mapped)
+    shutil.copystat(src, dst)
+    return dst
+
+@lru_cache(maxsize=8)
+def read_alembic_revision(db_path: str, db_mtime_ns: int, wal_mtime_ns: int) -> Optional[str]:
+    """Read the revision straight from alembic_version
+    
+    The mtimes are only part of the cache key: a write to the database or its
+    WAL changes them, so the next call reads the table again.
+    """
+    # Read-only URI so the lookup never takes a write lock
+    with closing(sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)) as conn:
+        try:
+            row = conn.execute("SELECT version_num FROM alembic_version").fetchone()
+        except sqlite3.OperationalError:
+            # No alembic_version table: the schema was never stamped
+            return None
+    return row[0] if row else None
+
+def link_or_copy(previous: Path, source: str, target: Path) -> None:
+    """Hard-link an unchanged file from an earlier backup, copying from the source if that fails"""
+    try:
+        os.link(previous, target)
+    except OSError:
+        fast_copy(source, target)
+
+def open_sql_dump(path: Path, mode: str) -> IO[str]:
+    """Open a SQL dump as text, compressing by suffix: .zst (zstandard), .gz (gzip) or plain"""
+    if path.suffix == '.zst':
+        if zstandard is None:
+            raise RuntimeError("zstandard is required for .zst dumps")
+        if mode == 'w':
+            stream = zstandard.ZstdCompressor(level=3).stream_writer(open(path, 'wb', buffering=SQL_DUMP_BUFFER_SIZE))
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'))
+        return io.TextIOWrapper(stream, encoding='utf-8')
+    if path.suffix == '.gz':
+        return gzip.open(path, mode + 't', encoding='utf-8', compresslevel=6)
+    return open(path, mode, encoding='utf-8', buffering=SQL_DUMP_BUFFER_SIZE)
+
+def load_json_file(path: Path) -> Any:
+    """Parse a JSON file, with orjson when it is installed"""
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def dump_json_file(path: Path, data: Any) -> None:
+    """Write a JSON file, with orjson when it is installed
+    
+    Output is compact unless PATS_PRETTY_METADATA=1 asks for two-space indentation.
+    """
+    pretty = os.getenv("PATS_PRETTY_METADATA") == "1"
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+    else:
+        path.write_text(json.dumps(data, indent=2 if pretty else None))
 
 class PATSBackupRestore:
-    def __init__(self):
-        self.base_dir = Path("/app")
-        self.backup_dir = Path("/app/backups")
-        self.data_dir = Path("/app/data")
-        self.uploads_dir = Path("/app/uploads")
-        self.db_path = Path("/app/data/pats.db")
+    # Pages copied per step of the SQLite Online Backup API; writers can get in between steps
+    BACKUP_PAGES = 1024
+    
+    # Files copied concurrently when uploads have to be byte-copied
+    COPY_WORKERS = 8
+    
+    # PATS_SQLITE_BACKUP_API=0 copies database files byte for byte instead
+    USE_BACKUP_API = os.getenv("PATS_SQLITE_BACKUP_API", "1") != "0"
+    
+    def __init__(self, base_dir: Path = Path("/app")):
+        self.base_dir = Path(base_dir)
+        self.backup_dir = self.base_dir / "backups"
+        self.data_dir = self.base_dir / "data"
+        self.uploads_dir = self.base_dir / "uploads"
+        self.db_path = self.data_dir / "pats.db"
+        
+        # Parsed backup_metadata.json by path, reused while the file's mtime is unchanged
+        self._metadata_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
         
         # Ensure backup directory exists
         self.backup_dir.mkdir(exist_ok=True)
     
     def get_timestamp(self) -> str:
         """Get current timestamp for backup naming"""
-        return datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        return time.strftime("%Y%m%d_%H%M%S")
     
     def get_alembic_revision(self) -> Optional[str]:
         """Get current Alembic revision"""
         try:
-            os.chdir(self.base_dir)
-            result = subprocess.run(
-                ["alembic", "current"],
-                capture_output=True, text=True
-            )
-            if result.returncode == 0:
-                # Extract revision from output
-                for line in result.stdout.split('\n'):
-                    line = line.strip()
-                    # Look for pattern like "041bd0560732 (head)" or just "041bd0560732"
-                    if line and not line.startswith('INFO'):
-                        # Extract the revision ID (first 12 characters)
-                        revision = line.split()[0]
-                        if len(revision) == 12 and revision.isalnum():
-                            return revision
-            return None
+            if not self.db_path.exists():
+                return None
+            # WAL-mode writes only touch the main file at checkpoint, so key on both
+            wal_path = self.db_path.with_name(self.db_path.name + "-wal")
+            wal_mtime = wal_path.stat().st_mtime_ns if wal_path.exists() else 0
+            return read_alembic_revision(str(self.db_path), self.db_path.stat().st_mtime_ns, wal_mtime)
         except Exception as e:
             print(f"Error getting Alembic revision: {e}")
             return None
     
-    def create_backup(self, backup_name: Optional[str] = None) -> str:
-        """Create a complete backup of database and uploads"""
+    def _checkpoint_wal(self, db_path: Optional[Path] = None) -> None:
+        """Fold any WAL frames back into the main database file
+        
+        The backup API already reads through the WAL; this keeps the .db file on
+        its own consistent for any plain file copy. A no-op outside WAL mode.
+        """
+        db_path = db_path or self.db_path
+        if not db_path.exists():
+            return
+        try:
+            with closing(sqlite3.connect(db_path)) as conn:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            print(f"⚠ WAL checkpoint failed: {e}")
+    
+    def _copy_database(self, source: Path, destination: Path,
+                       progress: Optional[Callable[[int, int, int], None]] = None) -> None:
+        """Copy a SQLite database with the Online Backup API
+        
+        Unlike a file copy this yields a consistent snapshot even while the app is
+        writing, and it includes pages still sitting in the WAL. If the API is
+        disabled or fails, the file is memory-mapped and copied as is instead,
+        after checkpointing the source's WAL into it.
+        """
+        if self.USE_BACKUP_API:
+            try:
+                with closing(sqlite3.connect(source)) as src, closing(sqlite3.connect(destination)) as dst:
+                    src.backup(dst, pages=self.BACKUP_PAGES, progress=progress)
+                return
+            except sqlite3.Error as e:
+                print(f"⚠ SQLite backup API failed ({e}), copying the database file instead")
+        
+        self._checkpoint_wal(source)
+        # A leftover WAL or shared-memory file would be replayed over the copied pages
+        for suffix in ("", "-wal", "-shm"):
+            destination.with_name(destination.name + suffix).unlink(missing_ok=True)
+        mmap_copy(source, destination)
+    
+    def _parallel_copytree(self, src: Path, dst: Path, workers: Optional[int] = None,
+                           previous: Optional[Tuple[Path, Dict[str, List[int]]]] = None) -> Dict[str, List[int]]:
+        """Copy a directory tree with several files in flight at once
+        
+        Directories are created up front on the calling thread; file copies are
+        spread over a thread pool so their I/O waits overlap.
+        
+        Args:
+            previous: (tree, index) of an earlier copy; files whose size and mtime
+                still match its index are hard-linked from it instead of copied
+        
+        Returns:
+            Index of the copied tree: relative path -> [size, mtime_ns]
+        """
+        index = {}
+        files = []
+        directories = [(src, dst)]
+        pending = [(src, dst, '')]
+        while pending:
+            src_dir, dst_dir, prefix = pending.pop()
+            os.makedirs(dst_dir, exist_ok=True)
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    target = dst_dir / entry.name
+                    relative_path = prefix + entry.name
+                    if entry.is_dir():
+                        directories.append((Path(entry.path), target))
+                        pending.append((Path(entry.path), target, relative_path + '/'))
+                    else:
+                        stat = entry.stat()
+                        index[relative_path] = [stat.st_size, stat.st_mtime_ns]
+                        files.append((stat.st_size, relative_path, entry.path, target))
+        
+        # Largest first, so a big file never starts last and stretches the wall time
+        files.sort(key=lambda item: item[0], reverse=True)
+        
+        previous_tree, previous_index = previous if previous else (None, {})
+        with ThreadPoolExecutor(max_workers=workers or self.COPY_WORKERS) as executor:
+            futures = []
+            for _, relative_path, source, target in files:
+                if previous_index.get(relative_path) == index[relative_path]:
+                    futures.append(executor.submit(link_or_copy, previous_tree / relative_path, source, target))
+                else:
+                    futures.append(executor.submit(fast_copy, source, target))
+            for future in futures:
+                future.result()
+        
+        # Match copytree: directory timestamps last, once their contents are written
+        for src_dir, dst_dir in directories:
+            shutil.copystat(src_dir, dst_dir)
+        
+        return index
+    
+    def _reflink_tree(self, src: Path, dst: Path) -> None:
+        """Clone a directory tree file by file with reflinks
+        
+        Stops at the first file that cannot be cloned, so an unsupported
+        filesystem costs one failed ioctl rather than one per file.
+        """
+        directories = []
+        pending = [(src, dst)]
+        while pending:
+            src_dir, dst_dir = pending.pop()
+            os.makedirs(dst_dir, exist_ok=True)
+            directories.append((src_dir, dst_dir))
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    target = dst_dir / entry.name
+                    if entry.is_dir():
+                        pending.append((Path(entry.path), target))
+                    else:
+                        reflink_copy(entry.path, target)
+        
+        for src_dir, dst_dir in directories:
+            shutil.copystat(src_dir, dst_dir)
+    
+    def _build_uploads_index(self) -> Dict[str, List[int]]:
+        """Index the live uploads tree: relative path -> [size, mtime_ns]"""
+        index = {}
+        pending = [(self.uploads_dir, '')]
+        while pending:
+            directory, prefix = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        pending.append((entry.path, prefix + entry.name + '/'))
+                    else:
+                        stat = entry.stat()
+                        index[prefix + entry.name] = [stat.st_size, stat.st_mtime_ns]
+        return index
+    
+    def _previous_uploads(self, exclude: Path) -> Optional[Tuple[Path, Dict[str, List[int]]]]:
+        """Find the newest earlier backup with an uploads tree and index to link against"""
+        for backup in reversed(self.list_backups()):
+            backup_path = Path(backup["path"])
+            index_path = backup_path / UPLOADS_INDEX_FILE
+            if backup_path == exclude or not index_path.exists() or not (backup_path / "uploads").is_dir():
+                continue
+            try:
+                return backup_path / "uploads", load_json_file(index_path)
+            except ValueError as e:
+                print(f"⚠ Ignoring unreadable uploads index in {backup['name']}: {e}")
+        return None
+    
+    def _archive_uploads(self, archive_path: Path) -> None:
+        """Stream the uploads tree into one compressed tar (zstd when available, else gzip)"""
+        with open(archive_path, 'wb') as raw:
+            if archive_path.suffix == '.zst':
+                with zstandard.ZstdCompressor().stream_writer(raw) as compressed, \
+                        tarfile.open(fileobj=compressed, mode='w|') as tar:
+                    tar.add(self.uploads_dir, arcname='.')
+            else:
+                with tarfile.open(fileobj=raw, mode='w|gz') as tar:
+                    tar.add(self.uploads_dir, arcname='.')
+    
+    def _extract_uploads(self, archive_path: Path) -> None:
+        """Stream-extract an uploads archive into the uploads directory"""
+        # Reject absolute paths, links out of the tree and device files
+        extract_options = {'filter': 'data'} if hasattr(tarfile, 'data_filter') else {}
+        with open(archive_path, 'rb') as raw:
+            if archive_path.suffix == '.zst':
+                if zstandard is None:
+                    raise RuntimeError("zstandard is required to restore a .zst uploads archive")
+                with zstandard.ZstdDecompressor().stream_reader(raw) as decompressed, \
+                        tarfile.open(fileobj=decompressed, mode='r|') as tar:
+                    tar.extractall(self.uploads_dir, **extract_options)
+            else:
+                with tarfile.open(fileobj=raw, mode='r|gz') as tar:
+                    tar.extractall(self.uploads_dir, **extract_options)
+    
+    def _backup_database(self, backup_path: Path) -> bool:
+        """Snapshot the database into a backup directory; returns whether it existed"""
+        if not self.db_path.exists():
+            print("⚠ Database file not found")
+            return False
+        
+        db_backup_path = backup_path / "pats.db"
+        self._copy_database(self.db_path, db_backup_path)
+        print(f"✓ Database backed up to {db_backup_path}")
+        return True
+    
+    def _backup_uploads(self, backup_path: Path, archive_uploads: bool = False) -> Tuple[bool, bool, Optional[str]]:
+        """Copy uploads into a backup directory
+        
+        Tries, in order: a reflink clone (independent copy, no data written),
+        hard links (shares inodes with the live tree), then a byte copy.
+        
+        Returns:
+            (uploads_reflinked, uploads_hardlinked, uploads_archive) for the backup metadata
+        """
+        if not self.uploads_dir.exists():
+            print("⚠ Uploads directory not found")
+            return False, False, None
+        
+        if archive_uploads:
+            uploads_archive = "uploads.tar.zst" if zstandard is not None else "uploads.tar.gz"
+            self._archive_uploads(backup_path / uploads_archive)
+            print(f"✓ Uploads archived to {backup_path / uploads_archive}")
+            return False, False, uploads_archive
+        
+        uploads_reflinked = False
+        uploads_hardlinked = False
+        uploads_backup_path = backup_path / "uploads"
+        try:
+            self._reflink_tree(self.uploads_dir, uploads_backup_path)
+            uploads_reflinked = True
+        except OSError:
+            shutil.rmtree(uploads_backup_path, ignore_errors=True)
+        
+        if uploads_reflinked:
+            index = self._build_uploads_index()
+        else:
+            try:
+                # Upload routes create files with open(..., "xb") under unique names and never rewrite
+                # them in place, so hard links are safe to share
+                shutil.copytree(self.uploads_dir, uploads_backup_path, copy_function=os.link, dirs_exist_ok=True)
+                uploads_hardlinked = True
+                index = self._build_uploads_index()
+            except OSError:
+                # Backups on another filesystem; drop any partial links and copy only what changed
+                # since the previous backup, linking unchanged files from it
+                shutil.rmtree(uploads_backup_path, ignore_errors=True)
+                previous = self._previous_uploads(exclude=backup_path)
+                index = self._parallel_copytree(self.uploads_dir, uploads_backup_path, previous=previous)
+        
+        # Lets the next backup skip files that have not changed
+        dump_json_file(backup_path / UPLOADS_INDEX_FILE, index)
+        print(f"✓ Uploads backed up to {uploads_backup_path}")
+        return uploads_reflinked, uploads_hardlinked, None
+    
+    def create_backup(self, backup_name: Optional[str] = None, archive_uploads: bool = False) -> str:
+        """Create a complete backup of database and uploads
+        
+        With archive_uploads the uploads are stored as a single compressed tar
+        instead of a directory tree, trading backup speed for disk space and inodes.
+        """
         timestamp = self.get_timestamp()
         if not backup_name:
             backup_name = f"backup_{timestamp}"
@@ -63,24 +462,16 @@ class PATSBackupRestore:
         
         print(f"Creating backup: {backup_name}")
         
-        # 1. Backup database
-        if self.db_path.exists():
-            db_backup_path = backup_path / "pats.db"
-            shutil.copy2(self.db_path, db_backup_path)
-            print(f"✓ Database backed up to {db_backup_path}")
-        else:
-            print("⚠ Database file not found")
-        
-        # 2. Backup uploads directory
-        if self.uploads_dir.exists():
-            uploads_backup_path = backup_path / "uploads"
-            shutil.copytree(self.uploads_dir, uploads_backup_path, dirs_exist_ok=True)
-            print(f"✓ Uploads backed up to {uploads_backup_path}")
-        else:
-            print("⚠ Uploads directory not found")
+        self._checkpoint_wal()
         
-        # 3. Get current Alembic revision
-        current_revision = self.get_alembic_revision()
+        # 1-3. Database, uploads and Alembic revision touch different files, so run them together
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            database_future = executor.submit(self._backup_database, backup_path)
+            uploads_future = executor.submit(self._backup_uploads, backup_path, archive_uploads)
+            revision_future = executor.submit(self.get_alembic_revision)
+            database_backed_up = database_future.result()
+            uploads_reflinked, uploads_hardlinked, uploads_archive = uploads_future.result()
+            current_revision = revision_future.result()
         
         # 4. Create metadata file
         metadata = {
@@ -88,14 +479,16 @@ class PATSBackupRestore:
             "timestamp": timestamp,
             "created_at": datetime.datetime.now().isoformat(),
             "alembic_revision": current_revision,
-            "database_file": "pats.db" if self.db_path.exists() else None,
+            "database_file": "pats.db" if database_backed_up else None,
             "uploads_included": self.uploads_dir.exists(),
+            "uploads_reflinked": uploads_reflinked,
+            "uploads_hardlinked": uploads_hardlinked,
+            "uploads_archive": uploads_archive,
             "backup_version": "1.0"
         }
         
         metadata_path = backup_path / "backup_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        dump_json_file(metadata_path, metadata)
         
         print(f"✓ Backup metadata saved")
         print(f"✓ Backup completed: {backup_path}")
@@ -103,23 +496,38 @@ class PATSBackupRestore:
         
         return backup_name
     
+    def _load_metadata(self, metadata_file: Path) -> Dict[str, Any]:
+        """Load a backup's metadata, reusing the cached parse if the file is unchanged"""
+        mtime_ns = metadata_file.stat().st_mtime_ns
+        cached = self._metadata_cache.get(metadata_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        metadata = load_json_file(metadata_file)
+        self._metadata_cache[metadata_file] = (mtime_ns, metadata)
+        return metadata
+    
     def list_backups(self) -> list:
         """List all available backups"""
         backups = []
-        for item in self.backup_dir.iterdir():
-            if item.is_dir():
-                metadata_file = item / "backup_metadata.json"
-                if metadata_file.exists():
-                    try:
-                        with open(metadata_file, 'r') as f:
-                            metadata = json.load(f)
-                        backups.append({
-                            "name": item.name,
-                            "path": str(item),
-                            "metadata": metadata
-                        })
-                    except Exception as e:
-                        print(f"Error reading metadata for {item.name}: {e}")
+        # scandir's DirEntry carries the file type, so no extra stat per entry
+        with os.scandir(self.backup_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                metadata_file = Path(entry.path, "backup_metadata.json")
+                try:
+                    metadata = self._load_metadata(metadata_file)
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    print(f"Error reading metadata for {entry.name}: {e}")
+                    continue
+                backups.append({
+                    "name": entry.name,
+                    "path": entry.path,
+                    "metadata": metadata
+                })
         
         return sorted(backups, key=lambda x: x["metadata"].get("created_at", ""))
     
@@ -137,8 +545,7 @@ class PATSBackupRestore:
             return False
         
         # Load backup metadata
-        with open(metadata_file, 'r') as f:
-            metadata = json.load(f)
+        metadata = self._load_metadata(metadata_file)
         
         print(f"Restoring backup: {backup_name}")
         print(f"Created: {metadata.get('created_at')}")
@@ -150,30 +557,40 @@ class PATSBackupRestore:
                 print("Restore cancelled")
                 return False
         
+        # One timestamp for every pre-restore copy, so they can be matched up afterwards
+        timestamp = self.get_timestamp()
+        
         # 1. Restore database
         db_backup_path = backup_path / "pats.db"
         if db_backup_path.exists():
             # Create backup of current database first
             if self.db_path.exists():
-                current_backup = self.db_path.with_suffix(f".db.pre_restore_{self.get_timestamp()}")
-                shutil.copy2(self.db_path, current_backup)
+                current_backup = self.db_path.with_suffix(f".db.pre_restore_{timestamp}")
+                self._copy_database(self.db_path, current_backup)
                 print(f"✓ Current database backed up to {current_backup}")
             
             # Ensure data directory exists
             self.data_dir.mkdir(exist_ok=True)
-            shutil.copy2(db_backup_path, self.db_path)
+            self._copy_database(db_backup_path, self.db_path)
             print(f"✓ Database restored")
         
         # 2. Restore uploads
         uploads_backup_path = backup_path / "uploads"
-        if uploads_backup_path.exists():
+        uploads_archive = metadata.get('uploads_archive')
+        uploads_archive_path = backup_path / uploads_archive if uploads_archive else None
+        if uploads_backup_path.exists() or (uploads_archive_path and uploads_archive_path.exists()):
             # Backup current uploads if they exist
             if self.uploads_dir.exists():
-                current_uploads_backup = self.uploads_dir.with_name(f"uploads_pre_restore_{self.get_timestamp()}")
+                current_uploads_backup = self.uploads_dir.with_name(f"uploads_pre_restore_{timestamp}")
                 shutil.move(self.uploads_dir, current_uploads_backup)
                 print(f"✓ Current uploads backed up to {current_uploads_backup}")
             
-            shutil.copytree(uploads_backup_path, self.uploads_dir)
+            if uploads_archive_path and uploads_archive_path.exists():
+                self.uploads_dir.mkdir(parents=True, exist_ok=True)
+                self._extract_uploads(uploads_archive_path)
+            else:
+                # Always copy out, so restored files never share inodes with a hard-linked backup
+                self._parallel_copytree(uploads_backup_path, self.uploads_dir)
             print(f"✓ Uploads restored")
         
         # 3. Handle Alembic migration
@@ -191,11 +608,16 @@ class PATSBackupRestore:
         print(f"\n✓ Restore completed successfully!")
         return True
     
-    def create_database_dump(self, output_file: Optional[str] = None) -> str:
-        """Create a SQL dump of the database"""
+    def create_database_dump(self, output_file: Optional[str] = None, binary: bool = True) -> str:
+        """Create a dump of the database
+        
+        By default the dump is a binary SQLite snapshot taken with the Online Backup
+        API. Pass binary=False for a portable SQL text dump built with iterdump;
+        its default name ends in .sql.zst (.sql.gz without zstandard).
+        """
         if not output_file:
             timestamp = self.get_timestamp()
-            output_file = f"database_dump_{timestamp}.sql"
+            output_file = f"database_dump_{timestamp}.{'db' if binary else 'sql' + SQL_DUMP_COMPRESSION}"
         
         output_path = self.backup_dir / output_file
         
@@ -203,17 +625,56 @@ class PATSBackupRestore:
             print("Error: Database file not found")
             return ""
         
-        # Create SQL dump
-        with sqlite3.connect(self.db_path) as conn:
-            with open(output_path, 'w') as f:
-                for line in conn.iterdump():
-                    f.write(f"{line}\n")
+        self._checkpoint_wal()
+        
+        if binary:
+            # Native page copy, no per-row SQL reconstruction
+            self._copy_database(self.db_path, output_path)
+        else:
+            # Create SQL dump, compressed when the filename ends in .zst or .gz
+            with closing(sqlite3.connect(self.db_path)) as conn:
+                with open_sql_dump(output_path, 'w') as f:
+                    for line in conn.iterdump():
+                        f.write(line)
+                        f.write("\n")
         
         print(f"✓ Database dump created: {output_path}")
         return str(output_path)
     
+    def _is_sqlite_file(self, path: Path) -> bool:
+        """Check whether a file is a SQLite database rather than SQL text"""
+        with open(path, 'rb') as f:
+            return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    
+    def _load_sql_dump(self, lines: Iterable[str]) -> None:
+        """Execute a SQL dump statement by statement inside one transaction
+        
+        Only one statement is held in memory at a time, so large dumps no longer
+        need to be read into a single string first.
+        """
+        with closing(sqlite3.connect(self.db_path, isolation_level=None)) as conn:
+            previous_journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            for pragma in BULK_LOAD_PRAGMAS:
+                conn.execute(pragma)
+            
+            conn.execute("BEGIN")
+            try:
+                for statement in iter_sql_statements(lines):
+                    # iterdump wraps its output in its own transaction; ours replaces it
+                    if statement.strip().upper() in DUMP_TRANSACTION_STATEMENTS:
+                        continue
+                    conn.execute(statement)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            
+            # journal_mode is persistent for WAL databases; put it back as we found it
+            if previous_journal_mode == "wal":
+                conn.execute("PRAGMA journal_mode=WAL")
+    
     def restore_from_dump(self, dump_file: str) -> bool:
-        """Restore database from SQL dump"""
+        """Restore database from a binary or SQL dump"""
         dump_path = Path(dump_file)
         if not dump_path.exists():
             dump_path = self.backup_dir / dump_file
@@ -225,14 +686,18 @@ class PATSBackupRestore:
         # Backup current database
         if self.db_path.exists():
             backup_path = self.db_path.with_suffix(f".db.pre_restore_{self.get_timestamp()}")
-            shutil.copy2(self.db_path, backup_path)
+            self._copy_database(self.db_path, backup_path)
             print(f"✓ Current database backed up to {backup_path}")
         
         # Restore from dump
         self.data_dir.mkdir(exist_ok=True)
-        with sqlite3.connect(self.db_path) as conn:
-            with open(dump_path, 'r') as f:
-                conn.executescript(f.read())
+        if self._is_sqlite_file(dump_path):
+            self._copy_database(dump_path, self.db_path)
+            print(f"✓ Database restored from dump: {dump_path}")
+            return True
+        
+        with open_sql_dump(dump_path, 'r') as f:
+            self._load_sql_dump(f)
         
         print(f"✓ Database restored from dump: {dump_path}")
         return True
@@ -244,11 +709,11 @@ def main():
         print("PATS Backup & Restore System")
         print("Usage: python backup_restore.py <command> [args]")
         print("\nCommands:")
-        print("  backup [name]              - Create a backup")
+        print("  backup [name] [--archive]  - Create a backup (--archive: uploads as one compressed tar)")
         print("  list                       - List all backups")
         print("  restore <name> [--force]   - Restore from backup")
-        print("  dump [filename]            - Create SQL dump")
-        print("  restore-dump <filename>    - Restore from SQL dump")
+        print("  dump [filename] [--sql]    - Create database dump (binary, or SQL text with --sql/.sql)")
+        print("  restore-dump <filename>    - Restore from binary or SQL dump")
         print("\nExamples:")
         print("  python backup_restore.py backup")
         print("  python backup_restore.py backup pre_migration")
@@ -259,8 +724,9 @@ def main():
     command = sys.argv[1]
     
     if command == "backup":
-        backup_name = sys.argv[2] if len(sys.argv) > 2 else None
-        backup_restore.create_backup(backup_name)
+        args = [arg for arg in sys.argv[2:] if arg != "--archive"]
+        backup_name = args[0] if args else None
+        backup_restore.create_backup(backup_name, archive_uploads="--archive" in sys.argv)
     
     elif command == "list":
         backups = backup_restore.list_backups()
@@ -288,8 +754,10 @@ def main():
         backup_restore.restore_backup(backup_name, force)
     
     elif command == "dump":
-        output_file = sys.argv[2] if len(sys.argv) > 2 else None
-        backup_restore.create_database_dump(output_file)
+        args = [arg for arg in sys.argv[2:] if arg != "--sql"]
+        output_file = args[0] if args else None
+        binary = "--sql" not in sys.argv and ".sql" not in Path(output_file or "").suffixes
+        backup_restore.create_database_dump(output_file, binary=binary)
     
     elif command == "restore-dump":
         if len(sys.argv) < 3:
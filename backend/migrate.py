@@ -6,16 +6,46 @@ Provides convenient commands for Alembic operations
 
 import sys
 import os
-import subprocess
 
-def run_alembic_command(cmd):
-    """Run an Alembic command in the correct directory"""
-    os.chdir('/app')
-    result = subprocess.run(['alembic'] + cmd, capture_output=True, text=True)
-    print(result.stdout)
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
-    return result.returncode
+from alembic import command as alembic_command
+from alembic.config import Config
+from alembic.util import CommandError
+
+APP_DIR = '/app'
+
+_config = None
+
+def get_alembic_config():
+    """Build the Alembic Config once and reuse it for every command"""
+    global _config
+    if _config is None:
+        os.chdir(APP_DIR)
+        _config = Config(os.path.join(APP_DIR, 'alembic.ini'))
+    return _config
+
+def run_alembic_command(func, *args, **kwargs):
+    """Run an Alembic command in-process against the shared Config"""
+    try:
+        func(get_alembic_config(), *args, **kwargs)
+    except CommandError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+def current():
+    return run_alembic_command(alembic_command.current)
+
+def history():
+    return run_alembic_command(alembic_command.history)
+
+def upgrade(revision="head"):
+    return run_alembic_command(alembic_command.upgrade, revision)
+
+def downgrade(revision):
+    return run_alembic_command(alembic_command.downgrade, revision)
+
+def revision(message, autogenerate=False):
+    return run_alembic_command(alembic_command.revision, message=message, autogenerate=autogenerate)
 
 def main():
     if len(sys.argv) < 2:
@@ -32,26 +62,26 @@ def main():
     command = sys.argv[1]
     
     if command == "current":
-        return run_alembic_command(["current"])
+        return current()
     elif command == "history":
-        return run_alembic_command(["history"])
+        return history()
     elif command == "upgrade":
-        return run_alembic_command(["upgrade", "head"])
+        return upgrade()
     elif command == "downgrade":
         if len(sys.argv) < 3:
             print("Error: downgrade requires revision argument")
             return 1
-        return run_alembic_command(["downgrade", sys.argv[2]])
+        return downgrade(sys.argv[2])
     elif command == "revision":
         if len(sys.argv) < 3:
             print("Error: revision requires message argument")
             return 1
-        return run_alembic_command(["revision", "-m", sys.argv[2]])
+        return revision(sys.argv[2])
     elif command == "autogenerate":
         if len(sys.argv) < 3:
             print("Error: autogenerate requires message argument")
             return 1
-        return run_alembic_command(["revision", "--autogenerate", "-m", sys.argv[2]])
+        return revision(sys.argv[2], autogenerate=True)
     else:
         print(f"Unknown command: {command}")
         return 1
@@ -10,35 +10,76 @@ import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 import random
+from multiprocessing import Pool
 
 # Add the backend directory to the Python path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
-from app.models.database import engine, Base
+from sqlalchemy.pool import StaticPool
+from app.models.database import engine as app_engine, Base
 from app.models.application import Application, ApplicationStatus, ApplicationSource, ApplicationPriority
 from app.models.contact import Contact, ContactType, Interaction
 from app.models.profile import Profile
 from app.models.setting import Setting
 from app.models.referral_message import ReferralMessage, ReferralMessageType
 
+# The seeder runs on one thread and one session at a time, so it needs a single
+# connection: no pool ping, no overflow bookkeeping on checkout
+if app_engine.dialect.name == "sqlite":
+    engine = create_engine(app_engine.url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+else:
+    engine = create_engine(app_engine.url, pool_size=1, max_overflow=0, pool_pre_ping=False)
+
 # Create tables
 Base.metadata.create_all(bind=engine)
 
 # Create session
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def random_uuids(count):
+    """Generate version 4 UUIDs from a single os.urandom call instead of one per uuid4()"""
+    blob = os.urandom(16 * count)
+    return [uuid.UUID(bytes=blob[i:i + 16], version=4) for i in range(0, len(blob), 16)]
+
+def bulk_insert(session, table, rows):
+    """Insert a batch of row dicts with a single executemany
+    
+    On SQLite the rows go straight to the sqlite3 cursor as tuples, inside the
+    session's transaction; other databases use a Core insert().
+    """
+    column_keys = list(rows[0])
+    defaults = {column.key: column.default for column in table.columns
+                if column.key not in column_keys and column.default is not None}
+    if engine.dialect.name != "sqlite" or any(not d.is_scalar and not d.is_clause_element for d in defaults.values()):
+        session.execute(table.insert(), rows)
+        return
+    
+    # SQL defaults such as func.now() compile inline; scalar defaults become parameters
+    compiled = table.insert().compile(dialect=engine.dialect, column_keys=column_keys)
+    keys = compiled.positiontup
+    processors = [table.c[key].type.bind_processor(engine.dialect) for key in keys]
+    params = [
+        tuple(
+            process(value) if process else value
+            for process, value in zip(processors, (row[key] if key in row else defaults[key].arg for key in keys))
+        )
+        for row in rows
+    ]
+    session.connection().connection.cursor().executemany(compiled.string, params)
+
 def clear_existing_data():
     """Clear all existing data from the database"""
     session = SessionLocal()
     try:
-        session.query(Interaction).delete()
-        session.query(Contact).delete()
-        session.query(Application).delete()
-        session.query(ReferralMessage).delete()
-        session.query(Profile).delete()
-        session.query(Setting).delete()
+        if engine.dialect.name == "postgresql":
+            session.execute(text("TRUNCATE interactions, contacts, applications, referral_messages, profile, settings RESTART IDENTITY CASCADE"))
+        else:
+            # Core DELETEs: no ORM query or session synchronization per table
+            for model in (Interaction, Contact, Application, ReferralMessage, Profile, Setting):
+                session.execute(model.__table__.delete())
         session.commit()
         print("✅ Cleared existing data")
     except Exception as e:
@@ -90,54 +131,74 @@ def create_dummy_names():
     ]
     return [f"{random.choice(first_names)} {random.choice(last_names)}" for _ in range(50)]
 
-def populate_applications():
+def populate_applications(session):
     """Create realistic job application data"""
-    session = SessionLocal()
-    
     companies = create_dummy_companies()
     job_titles = create_dummy_job_titles()
-    statuses = list(ApplicationStatus)
     sources = list(ApplicationSource)
     priorities = list(ApplicationPriority)
+    emails = ["john.doe@gmail.com", "j.doe@protonmail.com", "johndoe.work@gmail.com"]
+    
+    # Company name variants used in job ids, URLs and file names, built once per company
+    domain_slugs = {c: c.lower().replace(' ', '') for c in companies}
+    id_slugs = {c: c.lower().replace(' ', '-') for c in companies}
+    file_slugs = {c: c.lower().replace(' ', '_') for c in companies}
     
     applications = []
     
     # Create 75 applications with varied dates over the past 6 months
-    for i in range(75):
-        company = random.choice(companies)
-        job_title = random.choice(job_titles)
-        
-        # Create dates spread over the past 6 months
-        days_ago = random.randint(1, 180)
-        date_applied = datetime.utcnow() - timedelta(days=days_ago)
-        
-        # Weight statuses realistically (more applied/pending, fewer offers)
-        status_weights = {
-            ApplicationStatus.APPLIED: 0.4,
-            ApplicationStatus.PENDING: 0.25,
-            ApplicationStatus.INTERVIEW: 0.15,
-            ApplicationStatus.REJECTED: 0.15,
-            ApplicationStatus.OFFER: 0.03,
-            ApplicationStatus.WITHDRAWN: 0.02
-        }
-        status = random.choices(list(status_weights.keys()), weights=list(status_weights.values()))[0]
+    count = 75
+    
+    # Draw each field for every row up front rather than one random.choice per row
+    company_picks = random.choices(companies, k=count)
+    job_title_picks = random.choices(job_titles, k=count)
+    priority_picks = random.choices(priorities, k=count)
+    source_picks = random.choices(sources, k=count)
+    email_picks = random.choices(emails, k=count)
+    
+    # Weight statuses realistically (more applied/pending, fewer offers)
+    status_weights = {
+        ApplicationStatus.APPLIED: 0.4,
+        ApplicationStatus.PENDING: 0.25,
+        ApplicationStatus.INTERVIEW: 0.15,
+        ApplicationStatus.REJECTED: 0.15,
+        ApplicationStatus.OFFER: 0.03,
+        ApplicationStatus.WITHDRAWN: 0.02
+    }
+    status_picks = random.choices(list(status_weights), weights=list(status_weights.values()), k=count)
+    
+    # Create dates spread over the past 6 months, all relative to one clock read
+    now = datetime.utcnow()
+    applied_dates = [now - timedelta(days=days_ago) for days_ago in random.choices(range(1, 181), k=count)]
+    
+    row_uuids = random_uuids(count)
+    
+    # One random word per row decides every optional field:
+    #   bit 0       portal_url (1 in 2)
+    #   bits 1-16   cover_letter_filename (1 in 3: the 16-bit slice is divisible by 3)
+    #   bits 17-32  cover_letter_file_path (1 in 3, drawn independently)
+    flag_picks = [random.getrandbits(33) for _ in range(count)]
+    
+    for i, (company, job_title) in enumerate(zip(company_picks, job_title_picks)):
+        row_uuid = row_uuids[i]
+        flags = flag_picks[i]
         
-        application = Application(
-            id=str(uuid.uuid4()),
+        applications.append(dict(
+            id=str(row_uuid),
             company_name=company,
             job_title=job_title,
-            job_id=f"{company.lower().replace(' ', '-')}-{uuid.uuid4().hex[:8]}",
-            job_url=f"https://{company.lower().replace(' ', '')}.com/jobs/{uuid.uuid4().hex[:8]}",
-            portal_url=f"https://{company.lower().replace(' ', '')}.com/careers" if random.choice([True, False]) else None,
-            status=status,
-            priority=random.choice(priorities),
-            date_applied=date_applied,
-            email_used=random.choice(["john.doe@gmail.com", "j.doe@protonmail.com", "johndoe.work@gmail.com"]),
+            job_id=f"{id_slugs[company]}-{row_uuid.hex[:8]}",
+            job_url=f"https://{domain_slugs[company]}.com/jobs/{row_uuid.hex[8:16]}",
+            portal_url=f"https://{domain_slugs[company]}.com/careers" if flags & 1 else None,
+            status=status_picks[i],
+            priority=priority_picks[i],
+            date_applied=applied_dates[i],
+            email_used=email_picks[i],
             resume_filename=f"resume_v{random.randint(1, 5)}.pdf",
             resume_file_path=f"uploads/resumes/resume_v{random.randint(1, 5)}.pdf",
-            cover_letter_filename=f"cover_letter_{company.lower().replace(' ', '_')}.pdf" if random.choice([True, False, False]) else None,
-            cover_letter_file_path=f"uploads/cover_letters/cover_letter_{company.lower().replace(' ', '_')}.pdf" if random.choice([True, False, False]) else None,
-            source=random.choice(sources),
+            cover_letter_filename=f"cover_letter_{file_slugs[company]}.pdf" if (flags >> 1 & 0xFFFF) % 3 == 0 else None,
+            cover_letter_file_path=f"uploads/cover_letters/cover_letter_{file_slugs[company]}.pdf" if (flags >> 17 & 0xFFFF) % 3 == 0 else None,
+            source=source_picks[i],
             notes=random.choice([
                 f"Applied through {random.choice(['LinkedIn', 'company website', 'referral'])}",
                 f"Recruiter reached out on {random.choice(['LinkedIn', 'email'])}",
@@ -147,34 +208,28 @@ def populate_applications():
                 "Growing startup with interesting tech stack",
                 None, None  # Some applications have no notes
             ])
-        )
-        applications.append(application)
+        ))
     
-    try:
-        session.add_all(applications)
-        session.commit()
-        print(f"✅ Created {len(applications)} job applications")
-    except Exception as e:
-        print(f"❌ Error creating applications: {e}")
-        session.rollback()
-    finally:
-        session.close()
+    # Plain dicts in one executemany skip ORM object construction and unit-of-work bookkeeping
+    bulk_insert(session, Application.__table__, applications)
+    print(f"✅ Created {len(applications)} job applications")
 
-def populate_contacts():
+def populate_contacts(session):
     """Create realistic contact data"""
-    session = SessionLocal()
-    
     companies = create_dummy_companies()
     names = create_dummy_names()
-    contact_types = list(ContactType)
+    contact_type_picks = random.choices(list(ContactType), k=50)
     
     contacts = []
+    contact_ids = random_uuids(50)
+    # Bit i decides whether contact i gets a LinkedIn URL (1 in 2)
+    linkedin_flags = random.getrandbits(50)
     
     # Create 50 contacts
     for i in range(50):
         name = names[i] if i < len(names) else f"Contact {i}"
         company = random.choice(companies)
-        contact_type = random.choice(contact_types)
+        contact_type = contact_type_picks[i]
         
         # Generate email from name
         email_name = name.lower().replace(" ", ".")
@@ -183,8 +238,8 @@ def populate_contacts():
             "gmail.com", "protonmail.com", "outlook.com"
         ])
         
-        contact = Contact(
-            id=str(uuid.uuid4()),
+        contacts.append(dict(
+            id=str(contact_ids[i]),
             name=name,
             email=f"{email_name}@{email_domain}",
             company=company,
@@ -195,7 +250,7 @@ def populate_contacts():
                 "Product Manager", "Senior Product Manager", "Head of Product",
                 "People Operations", "Talent Acquisition", "HR Business Partner"
             ]),
-            linkedin_url=f"https://linkedin.com/in/{name.lower().replace(' ', '')}" if random.choice([True, False]) else None,
+            linkedin_url=f"https://linkedin.com/in/{name.lower().replace(' ', '')}" if linkedin_flags >> i & 1 else None,
             contact_type=contact_type,
             notes=random.choice([
                 f"Met at {random.choice(['tech conference', 'networking event', 'meetup'])}",
@@ -205,38 +260,29 @@ def populate_contacts():
                 "Offered to review resume and provide feedback",
                 None, None  # Some contacts have no notes
             ])
-        )
-        contacts.append(contact)
+        ))
     
-    try:
-        session.add_all(contacts)
-        session.commit()
-        print(f"✅ Created {len(contacts)} contacts")
-        
-        # Create interactions for some contacts
-        create_interactions(session, contacts)
-        
-    except Exception as e:
-        print(f"❌ Error creating contacts: {e}")
-        session.rollback()
-    finally:
-        session.close()
+    bulk_insert(session, Contact.__table__, contacts)
+    print(f"✅ Created {len(contacts)} contacts")
+    
+    # Create interactions for some contacts
+    create_interactions(session, contacts)
 
 def create_interactions(session, contacts):
     """Create interactions for contacts"""
     interactions = []
+    now = datetime.utcnow()
     
-    # Create 2-5 interactions for each contact
-    for contact in contacts[:20]:  # Only first 20 contacts to keep data manageable
-        num_interactions = random.randint(1, 4)
-        
-        for i in range(num_interactions):
-            days_ago = random.randint(1, 90)
-            interaction_date = datetime.utcnow() - timedelta(days=days_ago)
-            
-            interaction = Interaction(
-                id=str(uuid.uuid4()),
-                contact_id=contact.id,
+    # Create 1-4 interactions for each contact
+    contacts = contacts[:20]  # Only first 20 contacts to keep data manageable
+    interaction_counts = random.choices(range(1, 5), k=len(contacts))
+    interaction_ids = iter(random_uuids(sum(interaction_counts)))
+    
+    for contact, num_interactions in zip(contacts, interaction_counts):
+        for days_ago in random.choices(range(1, 91), k=num_interactions):
+            interactions.append(dict(
+                id=str(next(interaction_ids)),
+                contact_id=contact["id"],
                 interaction_type=random.choice(["email", "linkedin_message", "phone_call", "coffee_chat", "video_call"]),
                 notes=random.choice([
                     "Initial outreach - introduced myself and expressed interest",
@@ -247,65 +293,39 @@ def create_interactions(session, contacts):
                     "Asked for feedback on application",
                     "Requested referral for open position"
                 ]),
-                date=interaction_date
-            )
-            interactions.append(interaction)
+                date=now - timedelta(days=days_ago)
+            ))
     
-    try:
-        session.add_all(interactions)
-        session.commit()
-        print(f"✅ Created {len(interactions)} contact interactions")
-    except Exception as e:
-        print(f"❌ Error creating interactions: {e}")
-        session.rollback()
+    bulk_insert(session, Interaction.__table__, interactions)
+    print(f"✅ Created {len(interactions)} contact interactions")
 
-def populate_profile():
+def populate_profile(session):
     """Create user profile data"""
-    session = SessionLocal()
-    
-    try:
-        profile = Profile(
-            id=1,
-            full_name="John Doe",
-            email="john.doe@gmail.com",
-            headline="Senior Software Engineer | Full-Stack Developer | React & Python",
-            linkedin_url="https://linkedin.com/in/johndoe"
-        )
-        session.add(profile)
-        session.commit()
-        print("✅ Created user profile")
-    except Exception as e:
-        print(f"❌ Error creating profile: {e}")
-        session.rollback()
-    finally:
-        session.close()
-
-def populate_settings():
+    profile = Profile(
+        id=1,
+        full_name="John Doe",
+        email="john.doe@gmail.com",
+        headline="Senior Software Engineer | Full-Stack Developer | React & Python",
+        linkedin_url="https://linkedin.com/in/johndoe"
+    )
+    session.add(profile)
+    print("✅ Created user profile")
+
+def populate_settings(session):
     """Create application settings"""
-    session = SessionLocal()
-    
     settings = [
-        Setting(key="openai_api_key", value="sk-test-dummy-api-key-for-testing"),
-        Setting(key="default_email", value="john.doe@gmail.com"),
-        Setting(key="linkedin_profile", value="https://linkedin.com/in/johndoe"),
-        Setting(key="github_profile", value="https://github.com/johndoe"),
-        Setting(key="portfolio_website", value="https://johndoe.dev"),
+        dict(key="openai_api_key", value="sk-test-dummy-api-key-for-testing"),
+        dict(key="default_email", value="john.doe@gmail.com"),
+        dict(key="linkedin_profile", value="https://linkedin.com/in/johndoe"),
+        dict(key="github_profile", value="https://github.com/johndoe"),
+        dict(key="portfolio_website", value="https://johndoe.dev"),
     ]
     
-    try:
-        session.add_all(settings)
-        session.commit()
-        print(f"✅ Created {len(settings)} application settings")
-    except Exception as e:
-        print(f"❌ Error creating settings: {e}")
-        session.rollback()
-    finally:
-        session.close()
+    bulk_insert(session, Setting.__table__, settings)
+    print(f"✅ Created {len(settings)} application settings")
 
-def populate_referral_messages():
+def populate_referral_messages(session):
     """Create referral message templates"""
-    session = SessionLocal()
-    
     message_templates = [
         {
             "title": "Cold Outreach to Engineer",
@@ -389,24 +409,36 @@ Best regards,
         }
     ]
     
-    referral_messages = []
-    for template_data in message_templates:
-        message = ReferralMessage(
-            id=str(uuid.uuid4()),
-            **template_data
-        )
-        referral_messages.append(message)
+    referral_messages = [
+        dict(id=str(message_id), **template_data)
+        for message_id, template_data in zip(random_uuids(len(message_templates)), message_templates)
+    ]
     
+    bulk_insert(session, ReferralMessage.__table__, referral_messages)
+    print(f"✅ Created {len(referral_messages)} referral message templates")
+
+def run_in_transaction(*populators):
+    """Run populate_* functions on one session and commit them together"""
+    session = SessionLocal()
     try:
-        session.add_all(referral_messages)
+        if engine.dialect.name == "sqlite":
+            session.execute(text("PRAGMA journal_mode=WAL"))
+            session.execute(text("PRAGMA synchronous=NORMAL"))
+        for populator in populators:
+            populator(session)
         session.commit()
-        print(f"✅ Created {len(referral_messages)} referral message templates")
-    except Exception as e:
-        print(f"❌ Error creating referral messages: {e}")
+    except Exception:
         session.rollback()
+        raise
     finally:
         session.close()
 
+def run_in_worker(populator):
+    """Pool entry point: one populate_* function in its own process and transaction"""
+    # Connections inherited from the parent process must not be shared with it
+    engine.dispose(close=False)
+    run_in_transaction(populator)
+
 def main():
     """Main function to populate all dummy data"""
     print("🚀 Starting dummy data population...")
@@ -420,11 +452,20 @@ def main():
     os.makedirs("uploads/cover_letters", exist_ok=True)
     
     # Populate data
-    populate_profile()
-    populate_settings()
-    populate_applications()
-    populate_contacts()
-    populate_referral_messages()
+    try:
+        if engine.dialect.name == "sqlite":
+            # SQLite has a single writer: one transaction, so it syncs to disk once instead of per table
+            run_in_transaction(populate_profile, populate_settings, populate_applications,
+                               populate_contacts, populate_referral_messages)
+        else:
+            # These tables are independent of each other; contacts follow with their interactions
+            with Pool(4) as pool:
+                pool.map(run_in_worker, [populate_profile, populate_settings, populate_applications,
+                                         populate_referral_messages])
+            run_in_transaction(populate_contacts)
+    except Exception as e:
+        print(f"❌ Error populating data: {e}")
+        return
     
     print("=" * 50)
     print("✅ Dummy data population completed successfully!")
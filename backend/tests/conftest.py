@@ -1,13 +1,18 @@
 import pytest
-import tempfile
+import io
 import os
-import shutil
+from contextvars import ContextVar
 from pathlib import Path
+from types import MappingProxyType
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+# Importing the app runs create_all on DATABASE_URL. Give every test process (and
+# so every pytest-xdist worker) a private in-memory database instead of data/pats.db
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
 from app import app
 from app.models.database import Base, get_db
 from app.models.application import Application, ApplicationStatus, ApplicationSource
@@ -15,9 +20,15 @@ from app.models.contact import Contact, ContactType, Interaction
 from app.models.profile import Profile
 from app.models.setting import Setting
 from app.models.referral_message import ReferralMessage, ReferralMessageType
+from app.services.response_cache import analytics_cache
 from datetime import datetime, timedelta
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Create in-memory SQLite database for testing
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -27,77 +38,140 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
+
+
+# pysqlite defers BEGIN until the first DML statement, which would leave test
+# SAVEPOINTs outside the outer transaction; take over transaction control instead
+@event.listens_for(engine, "connect")
+def _configure_connection(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+    # The database is throwaway: never sync, and keep sort/temp b-trees off disk too
+    dbapi_connection.execute("PRAGMA synchronous=OFF")
+    dbapi_connection.execute("PRAGMA temp_store=MEMORY")
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+# Bulk insert statements for the *_bulk helpers, built once so their compiled
+# form is reused from SQLAlchemy's statement cache
+APPLICATION_INSERT = insert(Application).returning(Application)
+CONTACT_INSERT = insert(Contact).returning(Contact)
+REFERRAL_MESSAGE_INSERT = insert(ReferralMessage).returning(ReferralMessage)
+
+
+def _bulk_factory(db_session, insert_stmt, defaults, unique=None):
+    """Build a *_bulk helper: each override dict becomes one row of a single INSERT ... RETURNING
+    
+    unique maps a column to a callable giving a fresh value for rows that do not set it.
+    """
+    def _create(overrides):
+        rows = []
+        for kwargs in overrides:
+            data = defaults.copy()
+            data.update(kwargs)
+            data["id"] = str(uuid.uuid4())
+            for column, make_value in (unique or {}).items():
+                if column not in kwargs:
+                    data[column] = make_value()
+            rows.append(data)
+        created = db_session.scalars(insert_stmt, rows).all()
+        db_session.commit()
+        return created
+    return _create
+
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+# Session of the running test, set by the db_session fixture
+_current_session: ContextVar = ContextVar("current_session")
+
+
 def override_get_db():
     """Override the database dependency for testing"""
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
+    yield _current_session.get()
 
 
-# Override the database dependency
+# Override the database dependency once for the whole run
 app.dependency_overrides[get_db] = override_get_db
 
 
 @pytest.fixture(scope="session")
 def test_db():
-    """Create test database and tables"""
+    """Create test database and tables once for the whole run
+    
+    Tests never leave rows behind (see db_session), and the in-memory database
+    disappears with the process, so there is no drop_all at teardown.
+    """
     Base.metadata.create_all(bind=engine)
-    yield
-    Base.metadata.drop_all(bind=engine)
 
 
 @pytest.fixture
 def db_session(test_db):
-    """Create a new database session for each test"""
+    """Create a new database session for each test
+    
+    The session joins an outer transaction on the connection and turns each of
+    its commits into a SAVEPOINT release, so rolling back the outer transaction
+    undoes everything the test wrote without recreating the schema.
+    """
     connection = engine.connect()
     transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+    token = _current_session.set(session)
     
     yield session
     
+    _current_session.reset(token)
     session.close()
     transaction.rollback()
     connection.close()
+    # Rolled-back rows must not be served from a cached analytics response
+    analytics_cache.clear()
 
 
-@pytest.fixture
-def client(db_session):
-    """Create a test client with database session"""
-    def override_get_db():
-        yield db_session
+@pytest.fixture(scope="session")
+def json_body():
+    """Parse a response body, with orjson when it is installed"""
+    if orjson is not None:
+        return lambda response: orjson.loads(response.content)
+    return lambda response: response.json()
+
+
+@pytest.fixture(scope="session")
+def test_client(test_db):
+    """One test client shared by every test
     
-    app.dependency_overrides[get_db] = override_get_db
-    return TestClient(app)
+    Entered as a context manager so every request reuses one event loop
+    thread instead of starting a fresh one per request.
+    """
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture
-def temp_uploads_dir():
-    """Create a temporary uploads directory for file tests"""
-    temp_dir = tempfile.mkdtemp()
-    uploads_dir = Path(temp_dir) / "uploads"
-    uploads_dir.mkdir()
+def client(test_client, db_session):
+    """Test client whose requests use this test's database session"""
+    return test_client
+
+
+@pytest.fixture
+def temp_uploads_dir(tmp_path_factory):
+    """Create a temporary uploads directory for file tests
+    
+    Lives under pytest's base temp directory, which pytest prunes itself.
+    """
+    uploads_dir = tmp_path_factory.mktemp("uploads")
     (uploads_dir / "resumes").mkdir()
     (uploads_dir / "cover_letters").mkdir()
-    
-    # Store original uploads path
-    original_resumes_dir = Path("uploads/resumes")
-    original_cover_letters_dir = Path("uploads/cover_letters")
-    
-    yield uploads_dir
-    
-    # Cleanup
-    shutil.rmtree(temp_dir)
+    return uploads_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_application_data():
     """Sample application data for testing"""
-    return {
+    return MappingProxyType({
         "company_name": "Test Company",
         "job_title": "Software Engineer",
         "job_id": f"test-job-{uuid.uuid4().hex[:8]}",
@@ -110,13 +184,13 @@ def sample_application_data():
         "resume_file_path": "uploads/resumes/test_resume.pdf",
         "source": ApplicationSource.LINKEDIN,
         "notes": "Test application notes"
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_contact_data():
     """Sample contact data for testing"""
-    return {
+    return MappingProxyType({
         "name": "John Doe",
         "email": "john.doe@example.com",
         "company": "Test Company",
@@ -124,13 +198,13 @@ def sample_contact_data():
         "linkedin_url": "https://linkedin.com/in/johndoe",
         "contact_type": ContactType.RECRUITER,
         "notes": "Test contact notes"
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_referral_message_data():
     """Sample referral message data for testing"""
-    return {
+    return MappingProxyType({
         "title": "Cold Outreach Template",
         "message_type": ReferralMessageType.COLD_OUTREACH,
         "subject_template": "Interested in {position_title} at {company_name}",
@@ -139,37 +213,37 @@ def sample_referral_message_data():
         "target_position": "Software Engineer",
         "is_active": True,
         "notes": "Test template notes"
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_profile_data():
     """Sample profile data for testing"""
-    return {
+    return MappingProxyType({
         "full_name": "Test User",
         "email": "test@example.com",
         "headline": "Software Engineer",
         "linkedin_url": "https://linkedin.com/in/testuser"
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_setting_data():
     """Sample setting data for testing"""
-    return {
+    return MappingProxyType({
         "key": "test_setting",
         "value": "test_value"
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_interaction_data():
     """Sample interaction data for testing"""
-    return {
+    return MappingProxyType({
         "interaction_type": "email",
         "notes": "Test interaction notes",
         "date": datetime.utcnow()
-    }
+    })
 
 
 @pytest.fixture
@@ -190,6 +264,12 @@ def create_test_application(db_session, sample_application_data):
     return _create_application
 
 
+@pytest.fixture
+def create_test_applications_bulk(db_session, sample_application_data):
+    """Helper function to create many test applications in one INSERT ... RETURNING"""
+    return _bulk_factory(db_session, APPLICATION_INSERT, sample_application_data, unique={"job_id": lambda: f"test-job-{uuid.uuid4().hex[:8]}"})
+
+
 @pytest.fixture
 def create_test_contact(db_session, sample_contact_data):
     """Helper function to create a test contact"""
@@ -199,12 +279,18 @@ def create_test_contact(db_session, sample_contact_data):
         data["id"] = str(uuid.uuid4())
         contact = Contact(**data)
         db_session.add(contact)
+        # The commit expires the instance; attributes reload on first access, if any
         db_session.commit()
-        db_session.refresh(contact)
         return contact
     return _create_contact
 
 
+@pytest.fixture
+def create_test_contacts_bulk(db_session, sample_contact_data):
+    """Helper function to create many test contacts in one INSERT ... RETURNING"""
+    return _bulk_factory(db_session, CONTACT_INSERT, sample_contact_data)
+
+
 @pytest.fixture
 def create_test_referral_message(db_session, sample_referral_message_data):
     """Helper function to create a test referral message"""
@@ -220,6 +306,12 @@ def create_test_referral_message(db_session, sample_referral_message_data):
     return _create_referral_message
 
 
+@pytest.fixture
+def create_test_referral_messages_bulk(db_session, sample_referral_message_data):
+    """Helper function to create many test referral messages in one INSERT ... RETURNING"""
+    return _bulk_factory(db_session, REFERRAL_MESSAGE_INSERT, sample_referral_message_data)
+
+
 @pytest.fixture
 def create_test_profile(db_session, sample_profile_data):
     """Helper function to create a test profile"""
@@ -259,7 +351,6 @@ def create_test_interaction(db_session, sample_interaction_data):
         interaction = Interaction(**data)
         db_session.add(interaction)
         db_session.commit()
-        db_session.refresh(interaction)
         return interaction
     return _create_interaction
 
@@ -287,19 +378,33 @@ def mock_openai_service(monkeypatch):
     return MockOpenAIService("mock-api-key")
 
 
+SAMPLE_PDF_CONTENT = b"%PDF-1.4\n%Test PDF content\n%%EOF"
+SAMPLE_DOCX_CONTENT = b"PK\x03\x04\x14\x00\x00\x00\x08\x00Test DOCX content"
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_file(tmp_path_factory):
+    """Create a sample PDF file for testing, once per session"""
+    path = tmp_path_factory.mktemp("samples") / "sample.pdf"
+    path.write_bytes(SAMPLE_PDF_CONTENT)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def sample_docx_file(tmp_path_factory):
+    """Create a sample DOCX file for testing, once per session"""
+    path = tmp_path_factory.mktemp("samples") / "sample.docx"
+    path.write_bytes(SAMPLE_DOCX_CONTENT)
+    return str(path)
+
+
 @pytest.fixture
-def sample_pdf_file():
-    """Create a sample PDF file for testing"""
-    temp_file = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
-    temp_file.write(b"%PDF-1.4\n%Test PDF content\n%%EOF")
-    temp_file.close()
-    return temp_file.name
+def sample_pdf_stream():
+    """In-memory sample PDF for uploads that do not need a file on disk"""
+    return io.BytesIO(SAMPLE_PDF_CONTENT)
 
 
 @pytest.fixture
-def sample_docx_file():
-    """Create a sample DOCX file for testing"""
-    temp_file = tempfile.NamedTemporaryFile(suffix=".docx", delete=False)
-    temp_file.write(b"PK\x03\x04\x14\x00\x00\x00\x08\x00Test DOCX content")
-    temp_file.close()
-    return temp_file.name 
\ No newline at end of file
+def sample_docx_stream():
+    """In-memory sample DOCX for uploads that do not need a file on disk"""
+    return io.BytesIO(SAMPLE_DOCX_CONTENT) 
\ No newline at end of file
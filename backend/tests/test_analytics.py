@@ -2,40 +2,42 @@
 import pytest
 from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models.application import Application, ApplicationStatus, ApplicationSource
 from app.models.contact import Contact, ContactType, Interaction
 
 # Helper function to create applications
 def create_applications(db: Session):
+    now = datetime.utcnow()
     apps = [
-        Application(id="1", company_name="Tech Corp", job_title="Engineer", job_id="tce", job_url="http://example.com", date_applied=datetime(2023, 1, 15), status=ApplicationStatus.APPLIED, source=ApplicationSource.LINKEDIN, email_used="test@test.com", resume_filename="a.pdf", resume_file_path="a.pdf"),
-        Application(id="2", company_name="Tech Corp", job_title="Senior Engineer", job_id="tcs", job_url="http://example.com", date_applied=datetime(2023, 1, 20), status=ApplicationStatus.INTERVIEW, source=ApplicationSource.LINKEDIN, email_used="test@test.com", resume_filename="a.pdf", resume_file_path="a.pdf"),
-        Application(id="3", company_name="Data Inc", job_title="Analyst", job_id="dia", job_url="http://example.com", date_applied=datetime(2023, 2, 10), status=ApplicationStatus.OFFER, source=ApplicationSource.INDEED, email_used="test@test.com", resume_filename="a.pdf", resume_file_path="a.pdf"),
-        Application(id="4", company_name="Web LLC", job_title="Developer", job_id="wld", job_url="http://example.com", date_applied=datetime.utcnow() - timedelta(days=10), status=ApplicationStatus.REJECTED, source=ApplicationSource.COMPANY_WEBSITE, email_used="test@test.com", resume_filename="a.pdf", resume_file_path="a.pdf"),
-        Application(id="5", company_name="Web LLC", job_title="Frontend Dev", job_id="wfd", job_url="http://example.com", date_applied=datetime.utcnow() - timedelta(days=5), status=ApplicationStatus.APPLIED, source=ApplicationSource.COMPANY_WEBSITE, email_used="test@test.com", resume_filename="a.pdf", resume_file_path="a.pdf"),
+        dict(id="1", company_name="Tech Corp", job_title="Engineer", job_id="tce", job_url="http://example.com", date_applied=datetime(2023, 1, 15), status=ApplicationStatus.APPLIED, source=ApplicationSource.LINKEDIN, email_used="test@test.com", resume_filename="a.pdf", resume_file_path="a.pdf"),
+        dict(id="2", company_name="Tech Corp", job_title="Senior Engineer", job_id="tcs", job_url="http://example.com", date_applied=datetime(2023, 1, 20), status=ApplicationStatus.INTERVIEW, source=ApplicationSource.LINKEDIN, email_used="test@test.com", resume_filename="a.pdf", resume_file_path="a.pdf"),
+        dict(id="3", company_name="Data Inc", job_title="Analyst", job_id="dia", job_url="http://example.com", date_applied=datetime(2023, 2, 10), status=ApplicationStatus.OFFER, source=ApplicationSource.INDEED, email_used="test@test.com", resume_filename="a.pdf", resume_file_path="a.pdf"),
+        dict(id="4", company_name="Web LLC", job_title="Developer", job_id="wld", job_url="http://example.com", date_applied=now - timedelta(days=10), status=ApplicationStatus.REJECTED, source=ApplicationSource.COMPANY_WEBSITE, email_used="test@test.com", resume_filename="a.pdf", resume_file_path="a.pdf"),
+        dict(id="5", company_name="Web LLC", job_title="Frontend Dev", job_id="wfd", job_url="http://example.com", date_applied=now - timedelta(days=5), status=ApplicationStatus.APPLIED, source=ApplicationSource.COMPANY_WEBSITE, email_used="test@test.com", resume_filename="a.pdf", resume_file_path="a.pdf"),
     ]
-    db.add_all(apps)
+    db.execute(insert(Application), apps)
     db.commit()
     return apps
 
 # Helper function to create contacts and interactions
 def create_contacts_and_interactions(db: Session):
+    now = datetime.utcnow()
     contacts = [
-        Contact(id="1", name="John Doe", email="john@techcorp.com", company="Tech Corp", contact_type=ContactType.RECRUITER),
-        Contact(id="2", name="Jane Smith", email="jane@data-inc.com", company="Data Inc", contact_type=ContactType.HIRING_MANAGER),
-        Contact(id="3", name="Sam Brown", email="sam@webllc.com", company="Web LLC", contact_type=ContactType.REFERRAL),
-        Contact(id="4", name="Peter Jones", email="peter@techcorp.com", company="Tech Corp", contact_type=ContactType.OTHER),
+        dict(id="1", name="John Doe", email="john@techcorp.com", company="Tech Corp", contact_type=ContactType.RECRUITER),
+        dict(id="2", name="Jane Smith", email="jane@data-inc.com", company="Data Inc", contact_type=ContactType.HIRING_MANAGER),
+        dict(id="3", name="Sam Brown", email="sam@webllc.com", company="Web LLC", contact_type=ContactType.REFERRAL),
+        dict(id="4", name="Peter Jones", email="peter@techcorp.com", company="Tech Corp", contact_type=ContactType.OTHER),
     ]
-    db.add_all(contacts)
-    db.commit()
+    db.execute(insert(Contact), contacts)
 
     interactions = [
-        Interaction(id="1", contact_id="1", date=datetime.utcnow() - timedelta(days=15), interaction_type="email"),
-        Interaction(id="2", contact_id="2", date=datetime.utcnow() - timedelta(days=10), interaction_type="call"),
-        Interaction(id="3", contact_id="1", date=datetime.utcnow() - timedelta(days=5), interaction_type="meeting"),
+        dict(id="1", contact_id="1", date=now - timedelta(days=15), interaction_type="email"),
+        dict(id="2", contact_id="2", date=now - timedelta(days=10), interaction_type="call"),
+        dict(id="3", contact_id="1", date=now - timedelta(days=5), interaction_type="meeting"),
     ]
-    db.add_all(interactions)
+    db.execute(insert(Interaction), interactions)
     db.commit()
     return contacts, interactions
 
@@ -64,11 +66,18 @@ class TestAnalyticsAPI:
         assert data["applications_by_status"][ApplicationStatus.APPLIED.value] == 2
         assert data["contacts_by_type"][ContactType.RECRUITER.value] == 1
 
-    def test_get_application_trends(self, client: TestClient, db_session: Session):
+    def test_dashboard_cache_invalidated_by_commit(self, client: TestClient, db_session: Session):
+        assert client.get("/api/analytics/dashboard/").json()["total_applications"] == 0
+        create_applications(db_session)
+        
+        response = client.get("/api/analytics/dashboard/")
+        assert response.json()["total_applications"] == 5
+
+    def test_get_application_trends(self, client: TestClient, db_session: Session, json_body):
         create_applications(db_session)
         response = client.get("/api/analytics/applications/trends?days=365")
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert len(data["daily_trends"]) > 0
         assert len(data["monthly_trends"]) > 0
         assert data["daily_trends"][0]["count"] > 0
@@ -77,10 +86,9 @@ class TestAnalyticsAPI:
         create_applications(db_session)
         response = client.get("/api/analytics/applications/source-effectiveness/")
         assert response.status_code == 200
-        data = response.json()["source_effectiveness"]
+        by_source = {s["source"]: s for s in response.json()["source_effectiveness"]}
         
-        linkedin_source = next((s for s in data if s["source"] == "linkedin"), None)
-        assert linkedin_source is not None
+        linkedin_source = by_source["linkedin"]
         assert linkedin_source["total_applications"] == 2
         assert linkedin_source["success_rate"] == 50.0
 
@@ -95,13 +103,13 @@ class TestAnalyticsAPI:
         assert data["active_contacts"][0]["name"] == "John Doe"
         assert data["active_contacts"][0]["interactions"] == 2
 
-    def test_export_data(self, client: TestClient, db_session: Session):
+    def test_export_data(self, client: TestClient, db_session: Session, json_body):
         create_applications(db_session)
         create_contacts_and_interactions(db_session)
         
         response = client.get("/api/analytics/export/data?format=json")
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert data["total_applications"] == 5
         assert data["total_contacts"] == 4
         assert len(data["applications"]) == 5
@@ -1,16 +1,50 @@
 import pytest
-import os
+import io
 from datetime import datetime, timedelta
 from fastapi import UploadFile
 from app.models.application import ApplicationStatus, ApplicationSource
 
+# One timestamp for every application the tests post
+DATE_APPLIED = datetime.utcnow().isoformat()
+
+# Form values the tests post and assert against
+APPLIED = ApplicationStatus.APPLIED.value
+INTERVIEW = ApplicationStatus.INTERVIEW.value
+LINKEDIN = ApplicationSource.LINKEDIN.value
+
+
+# Stand-ins for OpenAIService in the parse-url tests
+class MockSuccessfulOpenAIService:
+    def __init__(self, api_key):
+        pass
+    def test_api_key(self):
+        return True
+    def parse_job_url(self, url):
+        return {"company_name": "Mock Company", "job_title": "Mock Job"}
+
+
+class MockInvalidOpenAIService:
+    def __init__(self, api_key):
+        pass
+    def test_api_key(self):
+        return False
+
+
+class MockFailedOpenAIService:
+    def __init__(self, api_key):
+        pass
+    def test_api_key(self):
+        return True
+    def parse_job_url(self, url):
+        return None
+
 
 class TestApplicationsAPI:
     """Test suite for applications API endpoints"""
 
-    def test_create_application_success(self, client, sample_pdf_file):
+    def test_create_application_success(self, client, sample_pdf_stream):
         """Test successful application creation with file upload"""
-        with open(sample_pdf_file, "rb") as f:
+        with sample_pdf_stream as f:
             files = {
                 "resume": ("test_resume.pdf", f, "application/pdf")
             }
@@ -20,10 +54,10 @@ class TestApplicationsAPI:
                 "job_id": "test-job-123",
                 "job_url": "https://example.com/job/123",
                 "portal_url": "https://example.com/portal",
-                "status": ApplicationStatus.APPLIED.value,
-                "date_applied": datetime.utcnow().isoformat(),
+                "status": APPLIED,
+                "date_applied": DATE_APPLIED,
                 "email_used": "test@example.com",
-                "source": ApplicationSource.LINKEDIN.value,
+                "source": LINKEDIN,
                 "notes": "Test application notes"
             }
             
@@ -39,9 +73,9 @@ class TestApplicationsAPI:
             assert "created_at" in result
             assert "updated_at" in result
 
-    def test_create_application_with_cover_letter(self, client, sample_pdf_file, sample_docx_file):
+    def test_create_application_with_cover_letter(self, client, sample_pdf_stream, sample_docx_stream):
         """Test application creation with both resume and cover letter"""
-        with open(sample_pdf_file, "rb") as resume_f, open(sample_docx_file, "rb") as cover_f:
+        with sample_pdf_stream as resume_f, sample_docx_stream as cover_f:
             files = {
                 "resume": ("test_resume.pdf", resume_f, "application/pdf"),
                 "cover_letter": ("test_cover.docx", cover_f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")
@@ -51,10 +85,10 @@ class TestApplicationsAPI:
                 "job_title": "Software Engineer",
                 "job_id": "test-job-124",
                 "job_url": "https://example.com/job/124",
-                "status": ApplicationStatus.APPLIED.value,
-                "date_applied": datetime.utcnow().isoformat(),
+                "status": APPLIED,
+                "date_applied": DATE_APPLIED,
                 "email_used": "test@example.com",
-                "source": ApplicationSource.LINKEDIN.value
+                "source": LINKEDIN
             }
             
             response = client.post("/api/applications/", data=data, files=files)
@@ -65,35 +99,28 @@ class TestApplicationsAPI:
 
     def test_create_application_invalid_file_type(self, client):
         """Test application creation with invalid file type"""
-        # Create a temporary text file
-        temp_file = "temp.txt"
-        with open(temp_file, "w") as f:
-            f.write("This is not a valid resume file")
-        
-        try:
-            with open(temp_file, "rb") as f:
-                files = {"resume": ("test_resume.txt", f, "text/plain")}
-                data = {
-                    "company_name": "Test Company",
-                    "job_title": "Software Engineer",
-                    "job_id": "test-job-125",
-                    "job_url": "https://example.com/job/125",
-                    "status": ApplicationStatus.APPLIED.value,
-                    "date_applied": datetime.utcnow().isoformat(),
-                    "email_used": "test@example.com",
-                    "source": ApplicationSource.LINKEDIN.value
-                }
-                
-                response = client.post("/api/applications/", data=data, files=files)
-                
-                assert response.status_code == 400
-                assert "Invalid file type" in response.json()["detail"]
-        finally:
-            os.remove(temp_file)
-
-    def test_create_application_missing_required_fields(self, client, sample_pdf_file):
+        # The upload only needs a body, so keep the text "resume" in memory
+        with io.BytesIO(b"This is not a valid resume file") as f:
+            files = {"resume": ("test_resume.txt", f, "text/plain")}
+            data = {
+                "company_name": "Test Company",
+                "job_title": "Software Engineer",
+                "job_id": "test-job-125",
+                "job_url": "https://example.com/job/125",
+                "status": APPLIED,
+                "date_applied": DATE_APPLIED,
+                "email_used": "test@example.com",
+                "source": LINKEDIN
+            }
+            
+            response = client.post("/api/applications/", data=data, files=files)
+            
+            assert response.status_code == 400
+            assert "Invalid file type" in response.json()["detail"]
+
+    def test_create_application_missing_required_fields(self, client, sample_pdf_stream):
         """Test application creation with missing required fields"""
-        with open(sample_pdf_file, "rb") as f:
+        with sample_pdf_stream as f:
             files = {"resume": ("test_resume.pdf", f, "application/pdf")}
             data = {
                 "company_name": "Test Company",
@@ -123,8 +150,9 @@ class TestApplicationsAPI:
         assert response.status_code == 200
         result = response.json()
         assert len(result) == 2
-        assert any(app["id"] == app1.id for app in result)
-        assert any(app["id"] == app2.id for app in result)
+        ids = {app["id"] for app in result}
+        assert app1.id in ids
+        assert app2.id in ids
 
     def test_get_applications_with_filters(self, client, create_test_application):
         """Test getting applications with filters"""
@@ -148,18 +176,18 @@ class TestApplicationsAPI:
         assert result[0]["company_name"] == "Company A"
         
         # Test status filter
-        response = client.get(f"/api/applications/?status={ApplicationStatus.INTERVIEW.value}")
+        response = client.get(f"/api/applications/?status={INTERVIEW}")
         assert response.status_code == 200
         result = response.json()
         assert len(result) == 1
-        assert result[0]["status"] == ApplicationStatus.INTERVIEW.value
+        assert result[0]["status"] == INTERVIEW
         
         # Test source filter
-        response = client.get(f"/api/applications/?source={ApplicationSource.LINKEDIN.value}")
+        response = client.get(f"/api/applications/?source={LINKEDIN}")
         assert response.status_code == 200
         result = response.json()
         assert len(result) == 1
-        assert result[0]["source"] == ApplicationSource.LINKEDIN.value
+        assert result[0]["source"] == LINKEDIN
 
     def test_get_application_by_id(self, client, create_test_application):
         """Test getting a specific application by ID"""
@@ -179,14 +207,12 @@ class TestApplicationsAPI:
         assert response.status_code == 404
         assert "Application not found" in response.json()["detail"]
 
-    def test_get_recent_applications(self, client, create_test_application):
+    def test_get_recent_applications(self, client, create_test_applications_bulk):
         """Test getting recent applications"""
         # Create multiple applications
-        for i in range(7):
-            create_test_application(
-                company_name=f"Company {i}",
-                job_id=f"job-{i}"
-            )
+        create_test_applications_bulk([
+            {"company_name": f"Company {i}", "job_id": f"job-{i}"} for i in range(7)
+        ])
         
         response = client.get("/api/applications/recent/")
         
@@ -199,7 +225,7 @@ class TestApplicationsAPI:
         app = create_test_application()
         
         update_data = {
-            "status": ApplicationStatus.INTERVIEW.value,
+            "status": INTERVIEW,
             "notes": "Updated notes"
         }
         
@@ -207,12 +233,12 @@ class TestApplicationsAPI:
         
         assert response.status_code == 200
         result = response.json()
-        assert result["status"] == ApplicationStatus.INTERVIEW.value
+        assert result["status"] == INTERVIEW
         assert result["notes"] == "Updated notes"
 
     def test_update_application_not_found(self, client):
         """Test updating non-existent application"""
-        update_data = {"status": ApplicationStatus.INTERVIEW.value}
+        update_data = {"status": INTERVIEW}
         
         response = client.put("/api/applications/non-existent-id", json=update_data)
         
@@ -287,15 +313,6 @@ class TestApplicationsAPI:
         """Test successful job URL parsing with mock OpenAI service"""
         # Set a dummy API key
         create_test_setting(key="openai_api_key", value="test-api-key")
-
-        class MockSuccessfulOpenAIService:
-            def __init__(self, api_key):
-                pass
-            def test_api_key(self):
-                return True
-            def parse_job_url(self, url):
-                return {"company_name": "Mock Company", "job_title": "Mock Job"}
-
         monkeypatch.setattr("app.routes.applications.OpenAIService", MockSuccessfulOpenAIService)
 
         response = client.post("/api/applications/parse-url/", data={"url": "https://example.com/job/123"})
@@ -305,71 +322,40 @@ class TestApplicationsAPI:
         assert result["company_name"] == "Mock Company"
         assert result["job_title"] == "Mock Job"
 
-    def test_parse_job_url_no_api_key(self, client):
-        """Test job URL parsing with no API key"""
-        response = client.post("/api/applications/parse-url/", data={"url": "https://example.com/job/123"})
-        
-        assert response.status_code == 400
-        assert "OpenAI API key not configured" in response.json()["detail"]
-
-    def test_parse_job_url_invalid_api_key(self, client, create_test_setting, monkeypatch):
-        """Test parsing job URL with invalid API key"""
-        create_test_setting(key="openai_api_key", value="invalid-key")
-
-        class MockInvalidOpenAIService:
-            def __init__(self, api_key):
-                pass
-            
-            def test_api_key(self):
-                return False
-
-        monkeypatch.setattr("app.routes.applications.OpenAIService", MockInvalidOpenAIService)
-        
-        response = client.post("/api/applications/parse-url/", data={"url": "https://example.com/job/123"})
-        
-        assert response.status_code == 400
-        assert "Invalid OpenAI API key" in response.json()["detail"]
-
-    def test_parse_job_url_parsing_failure(self, client, create_test_setting, monkeypatch):
-        """Test parsing job URL when parsing fails"""
-        create_test_setting(key="openai_api_key", value="test-key")
-
-        class MockFailedOpenAIService:
-            def __init__(self, api_key):
-                pass
-            
-            def test_api_key(self):
-                return True
-            
-            def parse_job_url(self, url):
-                return None
-
-        monkeypatch.setattr("app.routes.applications.OpenAIService", MockFailedOpenAIService)
+    @pytest.mark.parametrize("api_key,service,detail", [
+        (None, None, "OpenAI API key not configured"),
+        ("invalid-key", MockInvalidOpenAIService, "Invalid OpenAI API key"),
+        ("test-key", MockFailedOpenAIService, "Unable to extract job details"),
+    ], ids=["no_api_key", "invalid_api_key", "parsing_failure"])
+    def test_parse_job_url_errors(self, client, create_test_setting, monkeypatch, api_key, service, detail):
+        """Test job URL parsing without a key, with a rejected key, and when parsing fails"""
+        if api_key is not None:
+            create_test_setting(key="openai_api_key", value=api_key)
+        if service is not None:
+            monkeypatch.setattr("app.routes.applications.OpenAIService", service)
         
         response = client.post("/api/applications/parse-url/", data={"url": "https://example.com/job/123"})
         
         assert response.status_code == 400
-        assert "Unable to extract job details" in response.json()["detail"]
+        assert detail in response.json()["detail"]
 
-    def test_pagination(self, client, create_test_application):
+    def test_pagination(self, client, create_test_applications_bulk, json_body):
         """Test pagination of applications"""
-        # Create 12 applications
-        for i in range(15):
-            create_test_application(
-                company_name=f"Company {i}",
-                job_id=f"job-{i}"
-            )
+        # Create 15 applications
+        create_test_applications_bulk([
+            {"company_name": f"Company {i}", "job_id": f"job-{i}"} for i in range(15)
+        ])
         
         # Test first page (default limit is 100)
         response = client.get("/api/applications/?skip=0&limit=10")
         assert response.status_code == 200
-        result = response.json()
+        result = json_body(response)
         assert len(result) == 10
         
         # Test second page
         response = client.get("/api/applications/?skip=10&limit=10")
         assert response.status_code == 200
-        result = response.json()
+        result = json_body(response)
         assert len(result) == 5  # Only 5 remaining
 
     def test_pagination_invalid_params(self, client):
@@ -0,0 +1,175 @@
+import io
+import json
+import os
+import shutil
+import sqlite3
+from datetime import datetime
+
+import pytest
+from fastapi import UploadFile
+
+import backup_restore
+from app.routes import applications
+from backup_restore import PATSBackupRestore
+
+
+UPLOAD_FILES = {
+    "resumes/resume.pdf": b"resume contents",
+    "cover_letters/letter.txt": b"cover letter contents",
+    "photo.png": b"\x89PNG" + bytes(range(256)),
+}
+
+
+def read_tree(root):
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in root.rglob("*") if path.is_file()
+    }
+
+
+def count_rows(db_path):
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
+
+
+def fail(*args, **kwargs):
+    raise OSError("not supported")
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """PATSBackupRestore over a tmp tree with a WAL database and an uploads directory"""
+    monkeypatch.setattr(PATSBackupRestore, "USE_BACKUP_API", False)
+    (tmp_path / "data").mkdir()
+    for relative_path, content in UPLOAD_FILES.items():
+        path = tmp_path / "uploads" / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    with sqlite3.connect(tmp_path / "data" / "pats.db") as connection:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)")
+        connection.execute("INSERT INTO alembic_version VALUES ('041bd0560732')")
+        connection.execute("CREATE TABLE applications (id INTEGER PRIMARY KEY, company TEXT)")
+        connection.executemany("INSERT INTO applications (company) VALUES (?)", [("Acme",), ("Globex",)])
+    return PATSBackupRestore(base_dir=tmp_path)
+
+
+def backup_metadata(manager, backup_name):
+    return json.loads((manager.backup_dir / backup_name / "backup_metadata.json").read_text())
+
+
+class TestBackupUploads:
+    """Test suite for how uploads are copied into a backup"""
+
+    def test_reflink_preferred(self, manager, monkeypatch):
+        """Test that uploads are cloned when the filesystem supports reflinks"""
+        monkeypatch.setattr(backup_restore, "reflink_copy", shutil.copy2)
+        monkeypatch.setattr(os, "link", fail)
+
+        backup_name = manager.create_backup("reflinked")
+
+        metadata = backup_metadata(manager, backup_name)
+        assert metadata["uploads_reflinked"] is True
+        assert metadata["uploads_hardlinked"] is False
+        assert metadata["uploads_archive"] is None
+        assert read_tree(manager.backup_dir / backup_name / "uploads") == UPLOAD_FILES
+
+    def test_hardlink_fallback(self, manager, monkeypatch):
+        """Test that uploads are hard-linked when reflinks are unsupported"""
+        monkeypatch.setattr(backup_restore, "reflink_copy", fail)
+
+        backup_name = manager.create_backup("hardlinked")
+
+        metadata = backup_metadata(manager, backup_name)
+        assert metadata["uploads_reflinked"] is False
+        assert metadata["uploads_hardlinked"] is True
+        backed_up = manager.backup_dir / backup_name / "uploads" / "photo.png"
+        assert backed_up.stat().st_ino == (manager.uploads_dir / "photo.png").stat().st_ino
+
+    def test_reupload_leaves_hardlinked_backup_unchanged(self, manager, monkeypatch):
+        """Test that uploading again in the same second never rewrites a file a backup links to"""
+        monkeypatch.setattr(backup_restore, "reflink_copy", fail)
+        frozen = datetime(2024, 1, 15, 9, 30)
+        monkeypatch.setattr(applications, "datetime", type("FrozenDatetime", (), {"utcnow": staticmethod(lambda: frozen)}))
+        resumes_dir = manager.uploads_dir / "resumes"
+
+        def upload(content):
+            return applications.save_upload_file(UploadFile(io.BytesIO(content), filename="resume.pdf"), "app-1", resumes_dir)
+
+        _, first_path = upload(b"first resume")
+        backup_name = manager.create_backup("before-reupload")
+        backed_up = manager.backup_dir / backup_name / "uploads" / "resumes" / os.path.basename(first_path)
+        assert backed_up.stat().st_ino == os.stat(first_path).st_ino
+
+        _, second_path = upload(b"second resume")
+
+        assert second_path != first_path
+        assert backed_up.read_bytes() == b"first resume"
+        assert open(second_path, "rb").read() == b"second resume"
+
+    def test_existing_upload_is_never_rewritten(self, manager, monkeypatch):
+        """Test that an upload whose name is taken fails instead of truncating the linked file"""
+        monkeypatch.setattr(backup_restore, "reflink_copy", fail)
+        monkeypatch.setattr(applications.uuid, "uuid4", lambda: applications.uuid.UUID(int=0))
+        resumes_dir = manager.uploads_dir / "resumes"
+        _, path = applications.save_upload_file(UploadFile(io.BytesIO(b"first resume"), filename="resume.pdf"), "app-1", resumes_dir)
+        backup_name = manager.create_backup("linked")
+
+        with pytest.raises(FileExistsError):
+            applications.save_upload_file(UploadFile(io.BytesIO(b"rewritten"), filename="resume.pdf"), "app-1", resumes_dir)
+
+        backed_up = manager.backup_dir / backup_name / "uploads" / "resumes" / os.path.basename(path)
+        assert backed_up.read_bytes() == b"first resume"
+
+    def test_copy_fallback(self, manager, monkeypatch):
+        """Test that uploads are copied when neither reflinks nor hard links work"""
+        monkeypatch.setattr(backup_restore, "reflink_copy", fail)
+        monkeypatch.setattr(os, "link", fail)
+
+        backup_name = manager.create_backup("copied")
+
+        metadata = backup_metadata(manager, backup_name)
+        assert metadata["uploads_reflinked"] is False
+        assert metadata["uploads_hardlinked"] is False
+        backup_path = manager.backup_dir / backup_name
+        assert read_tree(backup_path / "uploads") == UPLOAD_FILES
+        assert (backup_path / "uploads" / "photo.png").stat().st_ino != (manager.uploads_dir / "photo.png").stat().st_ino
+        assert set(json.loads((backup_path / backup_restore.UPLOADS_INDEX_FILE).read_text())) == set(UPLOAD_FILES)
+
+
+class TestBackupRoundTrip:
+    """Test suite for restoring what create_backup wrote"""
+
+    def test_restore_round_trip(self, manager, monkeypatch):
+        """Test that a restore brings back the database and uploads as backed up"""
+        monkeypatch.setattr(backup_restore, "reflink_copy", fail)
+
+        backup_name = manager.create_backup("round-trip")
+        metadata = backup_metadata(manager, backup_name)
+        assert metadata["database_file"] == "pats.db"
+        assert metadata["alembic_revision"] == "041bd0560732"
+
+        with sqlite3.connect(manager.db_path) as connection:
+            connection.execute("DELETE FROM applications")
+        shutil.rmtree(manager.uploads_dir / "resumes")
+        (manager.uploads_dir / "photo.png").unlink()
+
+        assert manager.restore_backup(backup_name, force=True) is True
+
+        assert count_rows(manager.db_path) == 2
+        assert read_tree(manager.uploads_dir) == UPLOAD_FILES
+        # Restored files are copies, never links into the backup
+        restored = manager.uploads_dir / "photo.png"
+        assert restored.stat().st_ino != (manager.backup_dir / backup_name / "uploads" / "photo.png").stat().st_ino
+
+    def test_restore_archived_uploads(self, manager):
+        """Test that uploads archived into the backup are extracted on restore"""
+        backup_name = manager.create_backup("archived", archive_uploads=True)
+        metadata = backup_metadata(manager, backup_name)
+        assert metadata["uploads_archive"] in ("uploads.tar.zst", "uploads.tar.gz")
+        assert not (manager.backup_dir / backup_name / "uploads").exists()
+
+        shutil.rmtree(manager.uploads_dir)
+
+        assert manager.restore_backup(backup_name, force=True) is True
+        assert read_tree(manager.uploads_dir) == UPLOAD_FILES
@@ -1,7 +1,6 @@
 import pytest
 from datetime import datetime, timedelta
 from app.models.contact import ContactType
-from app.models.contact import Contact
 
 
 class TestContactsAPI:
@@ -112,16 +111,17 @@ class TestContactsAPI:
         assert response.status_code == 200
         result = response.json()
         assert len(result) == 2
-        assert any(contact["id"] == contact1.id for contact in result)
-        assert any(contact["id"] == contact2.id for contact in result)
+        ids = {contact["id"] for contact in result}
+        assert contact1.id in ids
+        assert contact2.id in ids
 
-    def test_get_contacts_with_filters(self, client, db_session):
+    def test_get_contacts_with_filters(self, client, create_test_contacts_bulk):
         """Test getting contacts with filters"""
         # Create test contacts with different types
-        contact1 = Contact(id="1", name="John Doe", email="john.doe@example.com", company="Company A", contact_type=ContactType.RECRUITER)
-        contact2 = Contact(id="2", name="Jane Smith", email="jane.smith@example.com", company="Company B", contact_type=ContactType.HIRING_MANAGER)
-        db_session.add_all([contact1, contact2])
-        db_session.commit()
+        create_test_contacts_bulk([
+            dict(name="John Doe", email="john.doe@example.com", company="Company A", contact_type=ContactType.RECRUITER),
+            dict(name="Jane Smith", email="jane.smith@example.com", company="Company B", contact_type=ContactType.HIRING_MANAGER),
+        ])
         
         # Test name filter
         response = client.get("/api/contacts/?name=John")
@@ -217,14 +217,14 @@ class TestContactsAPI:
         assert response.status_code == 404
         assert "Contact not found" in response.json()["detail"]
 
-    def test_search_contacts(self, client, db_session):
+    def test_search_contacts(self, client, create_test_contacts_bulk):
         """Test searching contacts"""
         # Create test contacts
-        contact1 = Contact(id="1", name="John Doe", email="john.doe@example.com", company="Tech Corp", contact_type=ContactType.RECRUITER)
-        contact2 = Contact(id="2", name="Jane Smith", email="jane.smith@example.com", company="Tech Corp", contact_type=ContactType.HIRING_MANAGER)
-        contact3 = Contact(id="3", name="Bob Johnson", email="bob.johnson@other.com", company="Other Corp", contact_type=ContactType.OTHER)
-        db_session.add_all([contact1, contact2, contact3])
-        db_session.commit()
+        create_test_contacts_bulk([
+            dict(name="John Doe", email="john.doe@example.com", company="Tech Corp", contact_type=ContactType.RECRUITER),
+            dict(name="Jane Smith", email="jane.smith@example.com", company="Tech Corp", contact_type=ContactType.HIRING_MANAGER),
+            dict(name="Bob Johnson", email="bob.johnson@other.com", company="Other Corp", contact_type=ContactType.OTHER),
+        ])
         
         # Search by name
         response = client.get("/api/contacts/search/?q=John Doe")
@@ -254,15 +254,12 @@ class TestContactsAPI:
         result = response.json()
         assert len(result) == 0
 
-    def test_pagination(self, client, create_test_contact):
+    def test_pagination(self, client, create_test_contacts_bulk):
         """Test pagination for contacts list"""
         # Create 15 contacts
-        for i in range(15):
-            create_test_contact(
-                name=f"Contact {i}",
-                email=f"contact{i}@example.com",
-                company=f"Company {i}"
-            )
+        create_test_contacts_bulk([
+            {"name": f"Contact {i}", "email": f"contact{i}@example.com", "company": f"Company {i}"} for i in range(15)
+        ])
         
         # Test first page
         response = client.get("/api/contacts/?skip=0&limit=10")
@@ -376,8 +373,9 @@ class TestInteractionsAPI:
         assert response.status_code == 200
         result = response.json()
         assert len(result) == 2
-        assert any(interaction["id"] == interaction1.id for interaction in result)
-        assert any(interaction["id"] == interaction2.id for interaction in result)
+        ids = {interaction["id"] for interaction in result}
+        assert interaction1.id in ids
+        assert interaction2.id in ids
 
     def test_get_contact_interactions_contact_not_found(self, client):
         """Test getting interactions for non-existent contact"""
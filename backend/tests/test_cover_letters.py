@@ -297,8 +297,9 @@ class TestCoverLettersAPI:
         assert len(result) == 2
         
         # Find applications with and without notes
-        with_notes = next(app for app in result if app["company_name"] == "With Notes")
-        without_notes = next(app for app in result if app["company_name"] == "Without Notes")
+        by_company = {app["company_name"]: app for app in result}
+        with_notes = by_company["With Notes"]
+        without_notes = by_company["Without Notes"]
         
         assert with_notes["notes"] == "This is a test note about the application"
         assert without_notes["notes"] is None
@@ -324,8 +325,9 @@ class TestCoverLettersAPI:
         assert len(result) == 2
         
         # Find applications with and without portal URLs
-        with_portal = next(app for app in result if app["company_name"] == "With Portal")
-        without_portal = next(app for app in result if app["company_name"] == "Without Portal")
+        by_company = {app["company_name"]: app for app in result}
+        with_portal = by_company["With Portal"]
+        without_portal = by_company["Without Portal"]
         
         assert with_portal["portal_url"] == "https://company.com/careers/portal"
         assert without_portal["portal_url"] is None
@@ -527,8 +529,9 @@ class TestCoverLettersAPI:
         assert "No Cover Letter" not in companies
         
         # Check that all fields are properly returned
-        complete_app = next(app for app in result if app["company_name"] == "Complete App")
-        minimal_app = next(app for app in result if app["company_name"] == "Minimal App")
+        by_company = {app["company_name"]: app for app in result}
+        complete_app = by_company["Complete App"]
+        minimal_app = by_company["Minimal App"]
         
         assert complete_app["portal_url"] == "https://company.com/portal"
         assert complete_app["notes"] == "Complete application with all fields"
@@ -0,0 +1,288 @@
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from app.models.email import Email
+from app.models.setting import Setting
+from app.routes.emails import sync_emails_background
+from app.services import google_api_service
+from app.services.google_api_service import EmailRecord, GoogleAPIService
+
+
+def make_record(message_id):
+    return EmailRecord(
+        id=message_id,
+        thread_id=f"thread-{message_id}",
+        subject="Interview invitation",
+        sender_name="Recruiter",
+        sender_email="recruiter@example.com",
+        recipient_email="me@example.com",
+        body_text="We would like to schedule an interview with you.",
+        body_html="",
+        date_received=datetime(2024, 1, 15),
+        labels=["INBOX"],
+        snippet="",
+        size_estimate=0
+    )
+
+
+@pytest.fixture
+def gmail_service(monkeypatch):
+    """GoogleAPIService with a mocked Gmail client and pass-through filtering"""
+    service = GoogleAPIService()
+    service.gmail_service = MagicMock()
+    monkeypatch.setattr(service, "_matches_hiring_keywords", lambda email: True)
+    monkeypatch.setattr(service, "_filter_legitimate_hiring_emails", lambda emails: emails)
+    return service
+
+
+def history_list(service):
+    return service.gmail_service.users.return_value.history.return_value.list
+
+
+class TestGmailHistorySync:
+    """Test suite for incremental Gmail sync in GoogleAPIService"""
+
+    def test_incremental_sync_reads_history(self, gmail_service, monkeypatch):
+        """Test that a stored history ID fetches only the messages added since then"""
+        history_list(gmail_service).return_value.execute.return_value = {
+            "history": [
+                {"messagesAdded": [{"message": {"id": "m1"}}]},
+                {"messagesAdded": [{"message": {"id": "m2"}}, {"message": {"id": "m1"}}]}
+            ],
+            "historyId": "200"
+        }
+        monkeypatch.setattr(gmail_service, "_get_email_details", make_record)
+
+        result = gmail_service.search_hiring_related_emails(7, start_history_id="100")
+
+        assert result["incremental"] is True
+        assert result["history_id"] == "200"
+        assert [email.id for email in result["emails"]] == ["m1", "m2"]
+        assert history_list(gmail_service).call_args.kwargs["startHistoryId"] == "100"
+
+    @pytest.mark.parametrize("status", [404, 412])
+    def test_expired_history_falls_back_to_full_sync(self, gmail_service, monkeypatch, status):
+        """Test that an expired history ID runs a full days_back search"""
+        history_list(gmail_service).return_value.execute.side_effect = HttpError(
+            httplib2.Response({"status": str(status)}), b""
+        )
+        gmail_service.gmail_service.users.return_value.getProfile.return_value.execute.return_value = {"historyId": "300"}
+        monkeypatch.setattr(gmail_service, "get_emails", lambda **kwargs: {"emails": [make_record("m3")]})
+
+        result = gmail_service.search_hiring_related_emails(7, start_history_id="100")
+
+        assert result["incremental"] is False
+        assert result["history_id"] == "300"
+        assert [email.id for email in result["emails"]] == ["m3"]
+
+    def test_incremental_sync_keeps_history_id_when_fetch_fails(self, gmail_service, monkeypatch):
+        """Test that a message that cannot be fetched holds the history ID back"""
+        history_list(gmail_service).return_value.execute.return_value = {
+            "history": [{"messagesAdded": [{"message": {"id": "m1"}}, {"message": {"id": "m2"}}]}],
+            "historyId": "200"
+        }
+        monkeypatch.setattr(gmail_service, "_get_email_details", lambda message_id: make_record(message_id) if message_id == "m1" else None)
+
+        result = gmail_service.search_hiring_related_emails(7, start_history_id="100")
+
+        assert [email.id for email in result["emails"]] == ["m1"]
+        assert result["history_id"] == "100"
+
+
+class FakeGoogleService:
+    def __init__(self, emails, history_id, incremental):
+        self.result = {"emails": emails, "history_id": history_id, "incremental": incremental}
+        self.calls = []
+
+    def search_hiring_related_emails(self, days_back, start_history_id=None):
+        self.calls.append((days_back, start_history_id))
+        return self.result
+
+
+class FakeFilteringService:
+    def __init__(self, failing_ids=()):
+        self.failing_ids = set(failing_ids)
+
+    def analyze_email(self, email):
+        if email["id"] in self.failing_ids:
+            raise ValueError("analysis failed")
+        return {}
+
+
+def run_sync(db_session, google_service, days_back=7, force_refresh=False, failing_ids=()):
+    asyncio.run(sync_emails_background(
+        db_session, google_service, FakeFilteringService(failing_ids), days_back, force_refresh
+    ))
+
+
+def setting_value(db_session, key):
+    setting = db_session.get(Setting, key)
+    return setting.value if setting else None
+
+
+class TestEmailSync:
+    """Test suite for the email sync background task"""
+
+    def test_sync_advances_history_id(self, db_session, create_test_setting):
+        """Test that a clean incremental sync stores the new history ID"""
+        create_test_setting(key="gmail_history_id", value="100")
+        create_test_setting(key="gmail_sync_days_back", value="7")
+        google_service = FakeGoogleService([make_record("e1")], "200", incremental=True)
+
+        run_sync(db_session, google_service)
+
+        assert google_service.calls == [(7, "100")]
+        assert setting_value(db_session, "gmail_history_id") == "200"
+        assert db_session.get(Email, "e1") is not None
+
+    def test_sync_keeps_history_id_when_an_email_fails(self, db_session, create_test_setting):
+        """Test that a failed email keeps the history ID so the next sync retries it"""
+        create_test_setting(key="gmail_history_id", value="100")
+        create_test_setting(key="gmail_sync_days_back", value="7")
+        google_service = FakeGoogleService([make_record("e1"), make_record("e2")], "200", incremental=True)
+
+        run_sync(db_session, google_service, failing_ids={"e2"})
+
+        assert setting_value(db_session, "gmail_history_id") == "100"
+        assert db_session.get(Email, "e1") is not None
+        assert db_session.get(Email, "e2") is None
+
+    def test_full_sync_failure_clears_history_id(self, db_session, create_test_setting):
+        """Test that a failed email in a full search makes the next sync search again"""
+        create_test_setting(key="gmail_history_id", value="100")
+        create_test_setting(key="gmail_sync_days_back", value="7")
+        google_service = FakeGoogleService([make_record("e1")], "200", incremental=False)
+
+        run_sync(db_session, google_service, force_refresh=True, failing_ids={"e1"})
+
+        assert google_service.calls == [(7, None)]
+        assert setting_value(db_session, "gmail_history_id") is None
+
+    def test_wider_days_back_forces_full_sync(self, db_session, create_test_setting):
+        """Test that asking for more days than the last full sync covered searches again"""
+        create_test_setting(key="gmail_history_id", value="100")
+        create_test_setting(key="gmail_sync_days_back", value="7")
+        google_service = FakeGoogleService([], "300", incremental=False)
+
+        run_sync(db_session, google_service, days_back=14)
+
+        assert google_service.calls == [(14, None)]
+        assert setting_value(db_session, "gmail_history_id") == "300"
+        assert setting_value(db_session, "gmail_sync_days_back") == "14"
+
+
+@pytest.fixture
+def google_token(tmp_path, monkeypatch, create_test_setting):
+    """token.json registered as the connected Google account, with token reads counted"""
+    token_path = tmp_path / "token.json"
+    token_path.write_text(json.dumps({
+        "token": "access-token",
+        "refresh_token": "refresh-token",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "client_id": "client-id",
+        "client_secret": "client-secret",
+        "expiry": "2099-01-01T00:00:00Z"
+    }))
+    create_test_setting(key="google_token_path", value=str(token_path))
+
+    reads = []
+    from_file = google_api_service.Credentials.from_authorized_user_file
+    def counting_from_file(filename, scopes=None):
+        reads.append(filename)
+        return from_file(filename, scopes)
+    monkeypatch.setattr(google_api_service.Credentials, "from_authorized_user_file", counting_from_file)
+    monkeypatch.setattr(google_api_service, "build", lambda *args, **kwargs: MagicMock())
+    monkeypatch.setattr(google_api_service, "_shared_credentials", {})
+    return token_path, reads
+
+
+class TestGoogleServiceDependency:
+    """Test suite for the Google credentials shared across requests"""
+
+    def test_token_file_read_once_across_requests(self, client, google_token):
+        """Test that two requests reuse the credentials loaded by the first"""
+        token_path, reads = google_token
+
+        for _ in range(2):
+            response = client.post("/api/emails/test-connection")
+            assert response.status_code == 200
+            assert response.json()["gmail_connected"] is True
+
+        assert reads == [str(token_path)]
+
+    def test_rewritten_token_file_is_reloaded(self, client, google_token):
+        """Test that a token.json rewritten by the OAuth callback is read again"""
+        token_path, reads = google_token
+        client.post("/api/emails/test-connection")
+
+        token = json.loads(token_path.read_text())
+        token["token"] = "new-access-token"
+        token_path.write_text(json.dumps(token))
+        client.post("/api/emails/test-connection")
+
+        assert reads == [str(token_path)] * 2
+        shared = google_api_service._shared_credentials[str(token_path)]
+        assert shared.creds.token == "new-access-token"
+
+    def test_missing_token_file_is_rejected(self, client, google_token):
+        """Test that removing token.json disconnects even with cached credentials"""
+        token_path, reads = google_token
+        client.post("/api/emails/test-connection")
+
+        token_path.unlink()
+        response = client.post("/api/emails/test-connection")
+
+        assert response.status_code == 401
+
+    def test_expiring_token_refreshed_once(self, google_token, monkeypatch):
+        """Test that concurrent services sharing a token file refresh it only once"""
+        token_path, reads = google_token
+        token = json.loads(token_path.read_text())
+        token["expiry"] = "2000-01-01T00:00:00Z"
+        token_path.write_text(json.dumps(token))
+
+        refreshes = []
+        def refresh(creds, request):
+            refreshes.append(creds)
+            time.sleep(0.05)
+            creds.token = "refreshed-token"
+            creds.expiry = datetime.utcnow() + timedelta(hours=1)
+        monkeypatch.setattr(google_api_service.Credentials, "refresh", refresh)
+
+        services = [GoogleAPIService(None, str(token_path)) for _ in range(4)]
+        results = []
+        threads = [threading.Thread(target=lambda service=service: results.append(service.authenticate())) for service in services]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True] * 4
+        assert len(refreshes) == 1
+        assert reads == [str(token_path)]
+        assert json.loads(token_path.read_text())["token"] == "refreshed-token"
+
+    def test_clients_outlive_the_service_per_thread(self, google_token):
+        """Test that later services on a thread reuse its API clients and transports"""
+        token_path, reads = google_token
+        first = GoogleAPIService(None, str(token_path))
+        second = GoogleAPIService(None, str(token_path))
+        assert first.authenticate() and second.authenticate()
+
+        assert second.gmail_service is first.gmail_service
+        assert second.calendar_service is first.calendar_service
+        assert first.gmail_service is not first.calendar_service
+
+        other_thread = {}
+        thread = threading.Thread(target=lambda: other_thread.update(gmail=second.gmail_service))
+        thread.start()
+        thread.join()
+        assert other_thread["gmail"] is not first.gmail_service
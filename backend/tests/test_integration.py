@@ -7,7 +7,7 @@ from app.models.contact import ContactType
 class TestIntegrationScenarios:
     """Integration tests for complete system workflows"""
 
-    def test_complete_application_workflow(self, client, sample_pdf_file, sample_docx_file):
+    def test_complete_application_workflow(self, client, sample_pdf_stream, sample_docx_stream):
         """Test complete application workflow from creation to analytics"""
         # 1. Create a profile
         profile_data = {
@@ -21,7 +21,7 @@ class TestIntegrationScenarios:
         assert response.status_code == 200
         
         # 2. Create an application with files
-        with open(sample_pdf_file, "rb") as resume_f, open(sample_docx_file, "rb") as cover_f:
+        with sample_pdf_stream as resume_f, sample_docx_stream as cover_f:
             files = {
                 "resume": ("test_resume.pdf", resume_f, "application/pdf"),
                 "cover_letter": ("test_cover.docx", cover_f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")
@@ -458,10 +458,10 @@ class TestIntegrationScenarios:
         response = client.get("/api/settings/non_existent_key")
         assert response.status_code == 404
 
-    def test_file_management_workflow(self, client, sample_pdf_file, sample_docx_file):
+    def test_file_management_workflow(self, client, sample_pdf_stream, sample_docx_stream):
         """Test complete file management workflow"""
         # 1. Create application with resume and cover letter
-        with open(sample_pdf_file, "rb") as resume_f, open(sample_docx_file, "rb") as cover_f:
+        with sample_pdf_stream as resume_f, sample_docx_stream as cover_f:
             files = {
                 "resume": ("test_resume.pdf", resume_f, "application/pdf"),
                 "cover_letter": ("test_cover.docx", cover_f, "application/vnd.openxmlformats-officedocument.wordprocessingml.document")
@@ -507,7 +507,7 @@ class TestIntegrationScenarios:
         assert response.headers["content-type"] == "application/octet-stream"
         assert "test_cover.docx" in response.headers["content-disposition"]
 
-    def test_error_handling_workflow(self, client, sample_pdf_file):
+    def test_error_handling_workflow(self, client):
         """Test various error handling scenarios"""
         # 1. Create application with missing required fields
         response = client.post("/api/applications/", data={}, files={})
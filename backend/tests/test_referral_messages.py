@@ -96,8 +96,9 @@ class TestReferralMessagesAPI:
         assert response.status_code == 200
         result = response.json()
         assert len(result) == 2
-        assert any(msg["id"] == msg1.id for msg in result)
-        assert any(msg["id"] == msg2.id for msg in result)
+        ids = {msg["id"] for msg in result}
+        assert msg1.id in ids
+        assert msg2.id in ids
 
     def test_get_referral_messages_with_filters(self, client, create_test_referral_message):
         """Test getting referral messages with filters"""
@@ -211,14 +212,12 @@ class TestReferralMessagesAPI:
         expected_types = [msg_type.value for msg_type in ReferralMessageType]
         assert result == expected_types
 
-    def test_pagination(self, client, create_test_referral_message):
+    def test_pagination(self, client, create_test_referral_messages_bulk):
         """Test pagination for referral messages list"""
         # Create 15 messages
-        for i in range(15):
-            create_test_referral_message(
-                title=f"Template {i}",
-                message_type=ReferralMessageType.COLD_OUTREACH
-            )
+        create_test_referral_messages_bulk([
+            {"title": f"Template {i}", "message_type": ReferralMessageType.COLD_OUTREACH} for i in range(15)
+        ])
         
         # Test first page
         response = client.get("/api/referral-messages/?skip=0&limit=10")
@@ -198,8 +198,9 @@ class TestResumesAPI:
         assert len(result) == 2
         
         # Find applications with and without cover letters
-        with_cover = next(app for app in result if app["company_name"] == "With Cover Letter")
-        without_cover = next(app for app in result if app["company_name"] == "Without Cover Letter")
+        by_company = {app["company_name"]: app for app in result}
+        with_cover = by_company["With Cover Letter"]
+        without_cover = by_company["Without Cover Letter"]
         
         assert with_cover["cover_letter_filename"] == "cover1.pdf"
         assert with_cover["cover_letter_file_path"] == "uploads/cover_letters/cover1.pdf"
@@ -225,8 +226,9 @@ class TestResumesAPI:
         assert len(result) == 2
         
         # Find applications with and without notes
-        with_notes = next(app for app in result if app["company_name"] == "With Notes")
-        without_notes = next(app for app in result if app["company_name"] == "Without Notes")
+        by_company = {app["company_name"]: app for app in result}
+        with_notes = by_company["With Notes"]
+        without_notes = by_company["Without Notes"]
         
         assert with_notes["notes"] == "This is a test note about the application"
         assert without_notes["notes"] is None
@@ -250,8 +252,9 @@ class TestResumesAPI:
         assert len(result) == 2
         
         # Find applications with and without portal URLs
-        with_portal = next(app for app in result if app["company_name"] == "With Portal")
-        without_portal = next(app for app in result if app["company_name"] == "Without Portal")
+        by_company = {app["company_name"]: app for app in result}
+        with_portal = by_company["With Portal"]
+        without_portal = by_company["Without Portal"]
         
         assert with_portal["portal_url"] == "https://company.com/careers/portal"
         assert without_portal["portal_url"] is None
@@ -22,11 +22,11 @@ show_help() {
     echo "Usage: ./backup.sh <command> [args]"
     echo ""
     echo "Commands:"
-    echo "  backup [name]              - Create a backup"
+    echo "  backup [name] [--archive]  - Create a backup (--archive: uploads as one compressed tar)"
     echo "  list                       - List all backups"
     echo "  restore <name> [--force]   - Restore from backup"
-    echo "  dump [filename]            - Create SQL dump"
-    echo "  restore-dump <filename>    - Restore from SQL dump"
+    echo "  dump [filename] [--sql]    - Create database dump (binary, or SQL text with --sql/.sql)"
+    echo "  restore-dump <filename>    - Restore from binary or SQL dump"
     echo "  auto-backup                - Create automated backup with migration info"
     echo ""
     echo "Examples:"
@@ -91,7 +91,7 @@ case "$COMMAND" in
     "backup")
         check_container
         if [ $# -gt 0 ]; then
-            docker exec $BACKEND_CONTAINER python backup_restore.py backup "$1"
+            docker exec $BACKEND_CONTAINER python backup_restore.py backup "$@"
         else
             docker exec $BACKEND_CONTAINER python backup_restore.py backup
         fi
@@ -122,7 +122,7 @@ case "$COMMAND" in
     "dump")
         check_container
         if [ $# -gt 0 ]; then
-            docker exec $BACKEND_CONTAINER python backup_restore.py dump "$1"
+            docker exec $BACKEND_CONTAINER python backup_restore.py dump "$@"
         else
             docker exec $BACKEND_CONTAINER python backup_restore.py dump
         fi